@@ -0,0 +1,38 @@
+import json
+from pathlib import Path
+
+from django.core.exceptions import BadRequest
+from django.core.management.base import BaseCommand, CommandError
+
+from UserApp.viewHandling.userImport import UserImporter, DEFAULT_BATCH_SIZE, iterImportRows
+
+
+class Command(BaseCommand):
+    help = "Imports users from an NDJSON or CSV file, reading it incrementally and inserting in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the NDJSON (.ndjson/.jsonl) or CSV (.csv) file.")
+        parser.add_argument("--format", choices=["ndjson", "csv"], help="File format, detected from the extension by default.")
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Number of users per bulk INSERT.")
+        parser.add_argument("--report", help="Write the per-row error report to this JSON file.")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"File not found: {path}")
+
+        import_format = options["format"] or ("csv" if path.suffix.lower() == ".csv" else "ndjson")
+
+        with path.open("rb") as lines:  # Decoded line by line, so a line that is not UTF-8 only fails its own row
+            try:
+                report = UserImporter(batch_size=options["batch_size"]).importRows(iterImportRows(lines, import_format))
+            except BadRequest as e:
+                raise CommandError(str(e))
+
+        if options["report"]:
+            Path(options["report"]).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        else:
+            for error in report["errors"]:
+                self.stderr.write(f"row {error['row']}: {error['error']}")
+
+        self.stdout.write(self.style.SUCCESS(f"Created {report['created']} users, {report['failed']} rows failed."))
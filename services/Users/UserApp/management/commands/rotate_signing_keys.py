@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from gymcommon.serviceTokens import KeyRing
+
+
+class Command(BaseCommand):
+    help = (
+        "Adds a new active key to the service token key file and drops all but the most recent keys. "
+        "Tokens signed with a kept key keep verifying, so rotate less often than SERVICE_TOKEN_TTL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keep", type=int, default=3, help="Number of keys left in the file, the new one included.")
+
+    def handle(self, *args, **options):
+        if options["keep"] < 1:
+            raise CommandError("--keep must be at least 1.")
+
+        path = Path(settings.SERVICE_TOKEN_KEY_FILE)
+        ring = KeyRing.load(path).rotated(options["keep"]) if path.exists() else KeyRing.generate()
+        ring.save(path)
+        self.stdout.write(self.style.SUCCESS(f"Signing with key {ring.active}, {len(ring.keys)} keys in {path}."))
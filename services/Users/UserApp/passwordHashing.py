@@ -0,0 +1,110 @@
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+
+DEFAULT_CHUNK_SIZE = 16
+
+
+def _initWorker(settings_module: str) -> None:
+    """
+    Runs once in every worker process so make_password sees the service's PASSWORD_HASHERS.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+
+    import django
+    from django.apps import apps
+    if not apps.ready:
+        django.setup()
+
+def _hashChunk(passwords: list) -> list:
+    return [make_password(password) for password in passwords]
+
+
+class InlineHashingPool:
+    """
+    Hashes on the calling thread. Used when no worker processes are configured.
+    """
+
+    def hashPassword(self, password: str) -> str:
+        return make_password(password)
+
+    def hashMany(self, passwords: list) -> list:
+        return _hashChunk(passwords)
+
+    def shutdown(self) -> None:
+        pass
+
+
+class PasswordHashingPool:
+    """
+    Spreads make_password calls across worker processes so hashing is not bound by the GIL.
+    At most max_pending chunks are queued at once; further submissions block until a chunk finishes.
+    """
+
+    def __init__(self, workers: int, max_pending: int = 64, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.workers = workers
+        self.chunk_size = max(1, chunk_size)
+        self.max_pending = max(1, max_pending)
+        self.slots = threading.BoundedSemaphore(self.max_pending)
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initWorker,
+            initargs=(os.environ.get("DJANGO_SETTINGS_MODULE", "UserSite.settings"),),
+        )
+
+    def submit(self, passwords: list) -> Future:
+        """
+        Queues one chunk of passwords, blocking while max_pending chunks are already in flight.
+        """
+        self.slots.acquire()
+        try:
+            future = self.executor.submit(_hashChunk, list(passwords))
+        except BaseException:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda _: self.slots.release())
+        return future
+
+    def hashPassword(self, password: str) -> str:
+        return self.submit([password]).result()[0]
+
+    def hashMany(self, passwords: list) -> list:
+        passwords = list(passwords)
+        futures = [
+            self.submit(passwords[start:start + self.chunk_size])
+            for start in range(0, len(passwords), self.chunk_size)
+        ]
+
+        hashed = []
+        for future in futures:
+            hashed.extend(future.result())
+        return hashed
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def getHashingPool():
+    """
+    Returns the process-wide hashing pool, created on first use from the
+    PASSWORD_HASHING_WORKERS and PASSWORD_HASHING_MAX_PENDING settings.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                workers = getattr(settings, "PASSWORD_HASHING_WORKERS", 0)
+                if workers > 1:
+                    _pool = PasswordHashingPool(workers, max_pending=getattr(settings, "PASSWORD_HASHING_MAX_PENDING", 64))
+                else:
+                    _pool = InlineHashingPool()
+    return _pool
+
+def hashPasswords(passwords: list) -> list:
+    return getHashingPool().hashMany(passwords)
@@ -0,0 +1,84 @@
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.core.cache import caches
+from django.utils.crypto import constant_time_compare
+
+from UserApp.viewHandling.jsonResponses import encodeJson
+
+SELF_RESPONSE_MESSAGE = "User data retrieved successfully"
+
+
+def getProfileCache():
+    """
+    Returns the cache configured by USER_PROFILE_CACHE. It must be shared by the workers,
+    since entries are only dropped from it by the worker that saves or deletes the user.
+    """
+    return caches[getattr(settings, "USER_PROFILE_CACHE", "default")]
+
+def profileCacheKey(user_id) -> str:
+    return f"user-profile:{user_id}"
+
+def cacheSelfResponse(user, payload: dict) -> bytes:
+    """
+    Stores the encoded GET /user/ body for an authenticated user together with
+    the session auth hash, so later requests can be verified without loading the user.
+    """
+    body = encodeJson(payload)
+    getProfileCache().set(profileCacheKey(user.pk), (user.get_session_auth_hash(), body))
+    return body
+
+def getCachedSelfResponse(request):
+    """
+    Returns the cached GET /user/ body for the session's user, or None when it has to be rebuilt.
+    Only reads the session, request.user is never touched.
+    """
+    try:
+        user_id = request.session[SESSION_KEY]
+        backend_path = request.session[BACKEND_SESSION_KEY]
+    except KeyError:
+        return None
+
+    if backend_path not in settings.AUTHENTICATION_BACKENDS:
+        return None
+
+    cached = getProfileCache().get(profileCacheKey(user_id))
+    if cached is None:
+        return None
+
+    session_auth_hash, body = cached
+    session_hash = request.session.get(HASH_SESSION_KEY)
+    if not session_hash or not constant_time_compare(session_hash, session_auth_hash):
+        return None  # Let the normal auth path verify or flush the session
+
+    return body
+
+def invalidateProfile(user_id) -> None:
+    getProfileCache().delete(profileCacheKey(user_id))
+
+async def acacheSelfResponse(user, payload: dict) -> bytes:
+    """
+    Async version of cacheSelfResponse.
+    """
+    body = encodeJson(payload)
+    await getProfileCache().aset(profileCacheKey(user.pk), (user.get_session_auth_hash(), body))
+    return body
+
+async def agetCachedSelfResponse(request):
+    """
+    Async version of getCachedSelfResponse, reads the session through its async API.
+    """
+    user_id = await request.session.aget(SESSION_KEY)
+    backend_path = await request.session.aget(BACKEND_SESSION_KEY)
+    if user_id is None or backend_path not in settings.AUTHENTICATION_BACKENDS:
+        return None
+
+    cached = await getProfileCache().aget(profileCacheKey(user_id))
+    if cached is None:
+        return None
+
+    session_auth_hash, body = cached
+    session_hash = await request.session.aget(HASH_SESSION_KEY)
+    if not session_hash or not constant_time_compare(session_hash, session_auth_hash):
+        return None
+
+    return body
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from UserApp.models import User
+from UserApp.profileCache import invalidateProfile
+
+
+@receiver(post_save, sender=User)
+def invalidateProfileOnSave(sender, instance, **kwargs):
+    invalidateProfile(instance.pk)
+
+@receiver(post_delete, sender=User)
+def invalidateProfileOnDelete(sender, instance, **kwargs):
+    invalidateProfile(instance.pk)
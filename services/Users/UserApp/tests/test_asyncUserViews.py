@@ -0,0 +1,31 @@
+from django.test import override_settings
+
+from UserApp.tests import test_userViews
+
+# Runs the existing view tests unchanged against the async views
+ASYNC_URLS = override_settings(ROOT_URLCONF="UserSite.asyncUrls")
+
+
+@ASYNC_URLS
+class AsyncCreateUserTests(test_userViews.CreateUserTests):
+    pass
+
+
+@ASYNC_URLS
+class AsyncLoginUserTests(test_userViews.LoginUserTests):
+    pass
+
+
+@ASYNC_URLS
+class AsyncLogoutUserTests(test_userViews.LogoutUserTests):
+    pass
+
+
+@ASYNC_URLS
+class AsyncGetUserTests(test_userViews.GetUserTests):
+    pass
+
+
+@ASYNC_URLS
+class AsyncDeleteUserTests(test_userViews.DeleteUserTests):
+    pass
@@ -0,0 +1,26 @@
+from unittest import skipUnless
+
+from django.conf import settings
+from django.db import connection
+from django.test import SimpleTestCase
+
+from gymcommon.databaseSettings import sqlitePragmas, sqliteTuning
+
+
+@skipUnless(connection.vendor == "sqlite" and sqliteTuning(), "SQLite tuning is disabled")
+class SqliteTuningTests(SimpleTestCase):
+    databases = {"default"}
+
+    def pragma(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def test_pragmas_applied_to_connection(self):
+        self.assertEqual(self.pragma("synchronous"), 1)  # NORMAL
+        self.assertEqual(self.pragma("busy_timeout"), int(sqlitePragmas()["busy_timeout"]))
+        self.assertEqual(self.pragma("cache_size"), int(sqlitePragmas()["cache_size"]))
+        self.assertEqual(self.pragma("temp_store"), 2)  # MEMORY
+
+    def test_immediate_transactions(self):
+        self.assertEqual(connection.transaction_mode, settings.DATABASES["default"]["OPTIONS"]["transaction_mode"].upper())
@@ -0,0 +1,54 @@
+import json
+from datetime import date
+from decimal import Decimal
+from unittest import skipIf
+
+from django.test import SimpleTestCase
+
+from UserApp.models import User
+from UserApp.viewHandling import jsonResponses
+from UserApp.viewHandling.jsonResponses import encodeJsonStdlib, jsonResponse, rawJsonResponse
+from UserApp.viewHandling.userViews import createUserResponseData
+
+USER_RESPONSE_KEYS = {"id", "username", "first_name", "last_name", "email", "date_of_birth", "phone_number", "weight", "height"}
+
+
+def sampleUser():
+    return User(
+        id=7,
+        username="testuser",
+        first_name="Zoë",
+        last_name="User",
+        email="testuser@email.com",
+        date_of_birth=date(2000, 1, 1),
+        phone_number="+447700900123",
+        weight=Decimal("70.50"),
+        height=180,
+    )
+
+
+class JsonResponsesTests(SimpleTestCase):
+    def test_user_payload_keys_unchanged(self):
+        response = jsonResponse(createUserResponseData(sampleUser()))
+        self.assertEqual(set(json.loads(response.content)), USER_RESPONSE_KEYS)
+
+    def test_response_headers_and_status(self):
+        response = jsonResponse({"error": "User not logged in"}, status=401)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(response.content), {"error": "User not logged in"})
+
+    def test_raw_response_reuses_bytes(self):
+        body = encodeJsonStdlib({"ok": True})
+        response = rawJsonResponse(body)
+        self.assertEqual(response.content, body)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+    @skipIf(jsonResponses.orjson is None, "orjson is not installed")
+    def test_encoders_agree(self):
+        payload = createUserResponseData(sampleUser())
+        payload["message"] = "User data retrieved successfully"
+        self.assertEqual(
+            json.loads(jsonResponses.encodeJsonOrjson(payload)),
+            json.loads(encodeJsonStdlib(payload)),
+        )
@@ -0,0 +1,64 @@
+import threading
+
+from django.test import SimpleTestCase, override_settings
+from django.contrib.auth.hashers import check_password
+
+from UserApp import passwordHashing
+from UserApp.passwordHashing import InlineHashingPool, PasswordHashingPool, getHashingPool
+
+FAST_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class InlineHashingPoolTests(SimpleTestCase):
+    def test_hash_many(self):
+        hashed = InlineHashingPool().hashMany(["FirstPass1*", "SecondPass2*"])
+
+        self.assertEqual(len(hashed), 2)
+        self.assertTrue(check_password("FirstPass1*", hashed[0]))
+        self.assertTrue(check_password("SecondPass2*", hashed[1]))
+
+
+class PasswordHashingPoolTests(SimpleTestCase):
+    def setUp(self):
+        self.pool = PasswordHashingPool(workers=2, max_pending=2, chunk_size=3)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_hash_many_keeps_order(self):
+        passwords = [f"MemberPass{i}*" for i in range(10)]
+        hashed = self.pool.hashMany(passwords)
+
+        self.assertEqual(len(hashed), 10)
+        for password, encoded in zip(passwords, hashed):
+            self.assertTrue(check_password(password, encoded))
+
+    def test_hash_password(self):
+        self.assertTrue(check_password("SinglePass1*", self.pool.hashPassword("SinglePass1*")))
+
+    def test_submit_waits_for_a_free_slot(self):
+        self.pool.slots = threading.BoundedSemaphore(1)
+        first = self.pool.submit(["QueuedPass1*"])
+
+        # The only slot is taken until the first chunk finishes
+        second_submitted = threading.Event()
+        def submitSecond():
+            self.pool.submit(["QueuedPass2*"]).result()
+            second_submitted.set()
+
+        thread = threading.Thread(target=submitSecond)
+        thread.start()
+        first.result()
+        thread.join(timeout=30)
+        self.assertTrue(second_submitted.is_set())
+
+
+class GetHashingPoolTests(SimpleTestCase):
+    def tearDown(self):
+        passwordHashing._pool = None
+
+    @override_settings(PASSWORD_HASHING_WORKERS=0)
+    def test_inline_by_default(self):
+        passwordHashing._pool = None
+        self.assertIsInstance(getHashingPool(), InlineHashingPool)
@@ -0,0 +1,114 @@
+import json
+import os
+from unittest import skipIf
+
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from UserApp.profileCache import getProfileCache, profileCacheKey
+
+User = get_user_model()
+
+
+class ProfileCacheTests(TestCase):
+    def setUp(self):
+        getProfileCache().clear()
+        self.client = Client()
+        self.user_url = reverse("user")
+        self.login_url = reverse("login")
+        self.user = User.objects.create_user(
+            username="testuser",
+            password="ValidPass123*",
+            first_name="Test",
+            last_name="User",
+            email="testuser@email.com",
+            phone_number="+447700900123",
+            weight="70.50",
+            height=180,
+        )
+
+    def login(self):
+        return self.client.post(
+            self.login_url,
+            data=json.dumps({"username": "testuser", "password": "ValidPass123*"}),
+            content_type="application/json",
+        )
+
+    def userQueries(self, ctx):
+        return [q["sql"] for q in ctx.captured_queries if '"UserApp_user"' in q["sql"]]
+
+    def test_login_warms_cache(self):
+        self.login()
+        self.assertIsNotNone(getProfileCache().get(profileCacheKey(self.user.id)))
+
+    def test_get_self_served_without_user_query(self):
+        self.login()
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.user_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response.json()["username"], "testuser")
+        self.assertEqual(response.json()["message"], "User data retrieved successfully")
+        self.assertEqual(self.userQueries(ctx), [])
+
+    def test_cache_miss_rebuilds_entry(self):
+        self.login()
+        getProfileCache().clear()
+
+        response = self.client.get(self.user_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["weight"], "70.50")
+        self.assertIsNotNone(getProfileCache().get(profileCacheKey(self.user.id)))
+
+    def test_update_invalidates_entry(self):
+        self.login()
+        self.user.refresh_from_db()
+        self.user.first_name = "Changed"
+        self.user.save()
+
+        self.assertIsNone(getProfileCache().get(profileCacheKey(self.user.id)))
+        self.assertEqual(self.client.get(self.user_url).json()["first_name"], "Changed")
+
+    def test_delete_invalidates_entry(self):
+        self.login()
+        self.client.delete(self.user_url, data=json.dumps({"id": self.user.id}), content_type="application/json")
+
+        self.assertIsNone(getProfileCache().get(profileCacheKey(self.user.id)))
+        self.assertEqual(self.client.get(self.user_url).status_code, 401)
+
+    @skipIf("USER_PROFILE_CACHE_BACKEND" in os.environ, "backend chosen by the environment")
+    def test_default_backend_is_shared_by_workers(self):
+        self.assertNotEqual(settings.CACHES[settings.USER_PROFILE_CACHE]["BACKEND"], "django.core.cache.backends.locmem.LocMemCache")
+
+    def test_deactivation_reaches_other_workers(self):
+        self.login()
+        other_worker = caches.create_connection(settings.USER_PROFILE_CACHE)  # What another process would open
+        self.assertIsNotNone(other_worker.get(profileCacheKey(self.user.id)))
+
+        self.user.refresh_from_db()
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertIsNone(other_worker.get(profileCacheKey(self.user.id)))
+        self.assertEqual(self.client.get(self.user_url).status_code, 401)
+
+    def test_password_change_is_not_served_from_cache(self):
+        self.login()
+        self.user.refresh_from_db()
+        self.user.set_password("OtherPass123*")
+        self.user.save()
+
+        self.assertEqual(self.client.get(self.user_url).status_code, 401)
+
+    def test_logged_out_is_not_served_from_cache(self):
+        self.login()
+        self.client.post(reverse("logout"))
+
+        self.assertEqual(self.client.get(self.user_url).status_code, 401)
@@ -0,0 +1,92 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, Client, AsyncClient, override_settings
+
+from gymcommon.metricsMiddleware import registry
+
+User = get_user_model()
+
+
+def scrape(client):
+    return client.get("/metrics", headers={"authorization": "Bearer scrape-secret"})
+
+def metricSamples(response) -> dict:
+    lines = response.content.decode().splitlines()
+    return dict(line.rsplit(" ", 1) for line in lines if not line.startswith("#"))
+
+
+@override_settings(METRICS_TOKEN="scrape-secret")
+class RequestMetricsTests(TestCase):
+    def setUp(self):
+        registry.reset()
+        self.client = Client()
+        self.user = User.objects.create_user(username="member", email="member@email.com", password="ValidPass123*")
+
+    def test_server_timing_header(self):
+        response = self.client.get("/user/", {"id": self.user.id})
+
+        db, total = response["Server-Timing"].split(", ")
+        self.assertRegex(db, r'^db;dur=\d+\.\d;desc="1 queries"$')
+        self.assertRegex(total, r"^total;dur=\d+\.\d$")
+
+    def test_metrics_per_view(self):
+        for _ in range(3):
+            self.client.get("/user/", {"id": self.user.id})
+        body_size = len(self.client.get("/user/", {"id": 999999}).content)
+        self.client.get("/no/such/page/")
+
+        response = scrape(self.client)
+        samples = metricSamples(response)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        self.assertEqual(samples['gym_http_requests_total{view="user",method="GET",status="2xx"}'], "3")
+        self.assertEqual(samples['gym_http_db_queries_total{view="user",method="GET",status="2xx"}'], "3")
+        self.assertEqual(samples['gym_http_response_bytes_total{view="user",method="GET",status="4xx"}'], str(body_size))
+        self.assertEqual(samples['gym_http_requests_total{view="unmatched",method="GET",status="4xx"}'], "1")
+        self.assertGreater(float(samples['gym_http_db_duration_seconds_total{view="user",method="GET",status="2xx"}']), 0)
+
+    def test_metrics_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 401)
+        self.assertEqual(self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code, 401)
+        self.assertEqual(self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer scrape-secret").status_code, 200)
+
+    @override_settings(METRICS_TOKEN="")
+    def test_metrics_without_token_only_while_debugging(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 404)
+        with self.settings(DEBUG=True):
+            self.assertEqual(self.client.get("/metrics").status_code, 200)
+
+    @override_settings(METRICS_SLOW_REQUEST_SECONDS=0, METRICS_SLOW_SAMPLE_RATE=1)
+    def test_slow_requests_logged_with_slowest_query(self):
+        with self.assertLogs("gymcommon.metrics", "WARNING") as logs:
+            self.client.get("/user/", {"id": self.user.id})
+
+        self.assertIn("Slow request GET /user/ (user) 200", logs.output[0])
+        self.assertIn('FROM "UserApp_user"', logs.output[0])
+
+    @override_settings(METRICS_SLOW_REQUEST_SECONDS=0, METRICS_SLOW_SAMPLE_RATE=0)
+    def test_slow_requests_counted_when_not_sampled(self):
+        with self.assertNoLogs("gymcommon.metrics"):
+            self.client.get("/user/", {"id": self.user.id})
+
+        samples = metricSamples(scrape(self.client))
+        self.assertEqual(samples['gym_http_slow_requests_total{view="user",method="GET",status="2xx"}'], "1")
+
+    @override_settings(METRICS_SERVER_TIMING=False)
+    def test_server_timing_can_be_turned_off(self):
+        self.assertFalse(self.client.get("/user/", {"id": self.user.id}).has_header("Server-Timing"))
+
+
+@override_settings(ROOT_URLCONF="UserSite.asyncUrls", METRICS_TOKEN="scrape-secret")
+class AsyncRequestMetricsTests(TestCase):
+    def setUp(self):
+        registry.reset()
+        self.user = User.objects.create_user(username="member", email="member@email.com", password="ValidPass123*")
+
+    async def test_queries_counted_in_async_views(self):
+        client = AsyncClient()
+        response = await client.get("/user/", {"id": self.user.id})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('desc="1 queries"', response["Server-Timing"])
+        samples = metricSamples(await client.get("/metrics", headers={"authorization": "Bearer scrape-secret"}))
+        self.assertEqual(samples['gym_http_db_queries_total{view="user",method="GET",status="2xx"}'], "1")
@@ -0,0 +1,72 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+
+from gymcommon.serviceTokens import KeyRing, verifyToken
+
+User = get_user_model()
+
+
+class ServiceTokenTests(TestCase):
+    def setUp(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.key_path = Path(directory) / "keys" / "service_tokens.json"
+        self.enterContext(override_settings(SERVICE_TOKEN_KEY_FILE=str(self.key_path), SERVICE_TOKEN_TTL=600))
+
+        self.client = Client()
+        self.user = User.objects.create_user(username="testuser", password="ValidPass123*", email="testuser@email.com")
+
+    def login(self):
+        return self.client.post(
+            reverse("login"),
+            data=json.dumps({"username": "testuser", "password": "ValidPass123*"}),
+            content_type="application/json",
+        )
+
+    def test_login_issues_token(self):
+        body = self.login().json()
+
+        self.assertEqual(body["token_expires_in"], 600)
+        claims = verifyToken(KeyRing.load(self.key_path), body["token"])
+        self.assertEqual(claims["sub"], self.user.id)
+        self.assertEqual(claims["exp"] - claims["iat"], 600)
+
+    def test_token_not_cached_in_profile(self):
+        self.login()
+        self.assertNotIn("token", self.client.get(reverse("user")).json())
+
+    def test_refresh(self):
+        self.login()
+        response = self.client.post(reverse("token"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(verifyToken(KeyRing.load(self.key_path), response.json()["token"])["sub"], self.user.id)
+
+    def test_refresh_requires_login(self):
+        response = self.client.post(reverse("token"))
+        self.assertEqual(response.status_code, 401)
+
+    def test_method_not_allowed(self):
+        response = self.client.get(reverse("token"))
+        self.assertEqual(response.status_code, 400)
+
+    def test_rotation_keeps_existing_tokens_valid(self):
+        token = self.login().json()["token"]
+
+        out = StringIO()
+        call_command("rotate_signing_keys", "--keep", "2", stdout=out)
+        ring = KeyRing.load(self.key_path)
+
+        self.assertIn(f"Signing with key {ring.active}, 2 keys", out.getvalue())
+        self.assertEqual(verifyToken(ring, token)["sub"], self.user.id)
+
+
+@override_settings(ROOT_URLCONF="UserSite.asyncUrls")
+class AsyncServiceTokenTests(ServiceTokenTests):
+    pass
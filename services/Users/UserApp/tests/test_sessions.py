@@ -0,0 +1,52 @@
+import json
+
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+
+from UserApp.profileCache import getProfileCache
+
+User = get_user_model()
+
+
+class SessionStoreTests(TestCase):
+    def setUp(self):
+        caches["sessions"].clear()
+        getProfileCache().clear()
+        self.client = Client()
+        User.objects.create_user(username="testuser", email="testuser@email.com", password="ValidPass123*")
+
+    def login(self):
+        response = self.client.post(
+            reverse("login"),
+            data=json.dumps({"username": "testuser", "password": "ValidPass123*"}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.db")
+    def test_db_sessions_read_session_table(self):
+        self.login()
+        with self.assertNumQueries(1):  # The django_session lookup
+            self.assertEqual(self.client.get(reverse("user")).status_code, 200)
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cached_db")
+    def test_cached_db_sessions_skip_database_on_read(self):
+        self.login()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(reverse("user")).status_code, 200)
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cache")
+    def test_cache_sessions_skip_database(self):
+        with self.assertNumQueries(0):
+            self.client.get(reverse("user"))
+        self.login()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(reverse("user")).status_code, 200)
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cache")
+    def test_logout_with_cache_sessions(self):
+        self.login()
+        self.client.post(reverse("logout"))
+        self.assertEqual(self.client.get(reverse("user")).status_code, 401)
@@ -0,0 +1,186 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from UserApp.viewHandling import viewHandlingConstants as V
+from UserApp.viewHandling.userImport import UserImporter, iterNdjsonRows, iterCsvRows
+
+User = get_user_model()
+
+
+def memberRow(i, **overrides):
+    row = {
+        "username": f"member{i}",
+        "password": "ValidPass123*",
+        "first_name": "Gym",
+        "last_name": "Member",
+        "email": f"member{i}@email.com",
+        "date_of_birth": "1990-05-05",
+        "phone_number": f"+44770090{i:04d}",
+        "weight": 80,
+        "height": 175,
+    }
+    row.update(overrides)
+    return row
+
+
+def toNdjson(rows):
+    return "\n".join(json.dumps(row) for row in rows) + "\n"
+
+
+CSV_HEADER = "username,password,first_name,last_name,email,date_of_birth,phone_number,weight,height\n"
+
+
+class UserImporterTests(TestCase):
+    def test_import_creates_users(self):
+        report = UserImporter(batch_size=2).importRows(iterNdjsonRows(toNdjson([memberRow(i) for i in range(5)]).splitlines()))
+
+        self.assertEqual(report, {"created": 5, "failed": 0, "errors": []})
+        self.assertEqual(User.objects.count(), 5)
+        self.assertTrue(User.objects.get(username="member3").check_password("ValidPass123*"))
+
+    def test_existing_values_are_loaded_once(self):
+        User.objects.create_user(username="member0", email="existing@email.com", password="x")
+        rows = [memberRow(i) for i in range(4)]
+
+        # Three preload queries plus one savepoint-wrapped bulk INSERT per batch
+        with self.assertNumQueries(3 + 2 * 3):
+            report = UserImporter(batch_size=2).importRows(iterNdjsonRows(toNdjson(rows).splitlines()))
+
+        self.assertEqual(report["created"], 3)
+        self.assertEqual(report["errors"], [{"row": 1, "error": V.TAKEN_USERNAME}])
+
+    def test_per_row_errors(self):
+        lines = toNdjson([
+            memberRow(1),
+            memberRow(2, email="member1@email.com"),
+            memberRow(3, phone_number="+447700900001"),
+            memberRow(4, height=20),
+        ]).splitlines()
+        lines.insert(2, "not json")
+
+        report = UserImporter().importRows(iterNdjsonRows(lines))
+
+        self.assertEqual(report["created"], 1)
+        self.assertEqual(report["failed"], 4)
+        self.assertEqual(report["errors"], [
+            {"row": 2, "error": V.TAKEN_EMAIL},
+            {"row": 3, "error": V.INVALID_IMPORT_ROW},
+            {"row": 4, "error": V.TAKEN_PHONE_NUMBER},
+            {"row": 5, "error": V.SMALL_HEIGHT},
+        ])
+
+    def test_csv_rows(self):
+        csv_body = CSV_HEADER + "member1,ValidPass123*,Gym,Member,Member1@Email.com,1990-05-05,+447700900001,80.5,175\n"
+        csv_body += "member2,ValidPass123*,Gym,Member,member2@email.com,1990-05-05,,80,175\n"
+
+        report = UserImporter().importRows(iterCsvRows(csv_body.splitlines(keepends=True)))
+
+        self.assertEqual(report["created"], 1)
+        self.assertEqual(report["errors"], [{"row": 2, "error": V.MISSING_PHONE_NUMBER}])
+        self.assertEqual(User.objects.get(username="member1").email, "member1@email.com")
+
+    def test_rows_normalised_like_create_user(self):
+        User.objects.create_user(username="member1", email="existing@email.com", password="x")
+        rows = [memberRow(1, username="\uff4d\uff45\uff4d\uff42\uff45\uff52\uff11"), memberRow(2, username="\uff2dember2")]
+
+        report = UserImporter().importRows(iterNdjsonRows(toNdjson(rows).splitlines()))
+
+        self.assertEqual(report["errors"], [{"row": 1, "error": V.TAKEN_USERNAME}])  # Fullwidth "member1"
+        self.assertTrue(User.objects.filter(username="Member2").exists())
+
+
+class UserImportViewTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("user_import")
+        self.staff = User.objects.create_user(username="coach", email="coach@email.com", password="CoachPass123*", is_staff=True)
+
+    def test_requires_login(self):
+        response = self.client.post(self.url, data=toNdjson([memberRow(1)]), content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, 401)
+
+    def test_requires_staff(self):
+        User.objects.create_user(username="member", email="member@email.com", password="MemberPass123*")
+        self.client.login(username="member", password="MemberPass123*")
+
+        response = self.client.post(self.url, data=toNdjson([memberRow(1)]), content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()["error"], V.NOT_STAFF)
+
+    def test_ndjson_import(self):
+        self.client.login(username="coach", password="CoachPass123*")
+        rows = [memberRow(1), memberRow(2, username="  ")]
+
+        response = self.client.post(self.url + "?batch_size=10", data=toNdjson(rows), content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"created": 1, "failed": 1, "errors": [{"row": 2, "error": V.EMPTY_USERNAME}]})
+
+    def test_csv_import(self):
+        self.client.login(username="coach", password="CoachPass123*")
+        csv_body = CSV_HEADER + "member1,ValidPass123*,Gym,Member,member1@email.com,1990-05-05,+447700900001,80,175\n"
+
+        response = self.client.post(self.url, data=csv_body, content_type="text/csv")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["created"], 1)
+
+    def test_unsupported_format(self):
+        self.client.login(username="coach", password="CoachPass123*")
+
+        response = self.client.post(self.url, data=json.dumps([memberRow(1)]), content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], V.UNSUPPORTED_IMPORT_FORMAT)
+
+    def test_rows_not_utf8(self):
+        self.client.login(username="coach", password="CoachPass123*")
+        ndjson_body = toNdjson([memberRow(1)]).encode() + json.dumps(memberRow(2, first_name="Jos\u00e9"), ensure_ascii=False).encode("latin-1") + b"\n"
+        csv_body = (CSV_HEADER + "member3,ValidPass123*,Gym,Member,member3@email.com,1990-05-05,+447700900003,80,175\n").encode()
+        csv_body += "member4,ValidPass123*,Jos\u00e9,Member,member4@email.com,1990-05-05,+447700900004,80,175\n".encode("latin-1")
+
+        ndjson = self.client.post(self.url, data=ndjson_body, content_type="application/x-ndjson")
+        self.assertEqual(ndjson.status_code, 200)
+        self.assertEqual(ndjson.json(), {"created": 1, "failed": 1, "errors": [{"row": 2, "error": V.INVALID_IMPORT_ENCODING}]})
+
+        csv_response = self.client.post(self.url, data=csv_body, content_type="text/csv")
+        self.assertEqual(csv_response.status_code, 200)
+        self.assertEqual(csv_response.json(), {"created": 1, "failed": 1, "errors": [{"row": 2, "error": V.INVALID_IMPORT_ENCODING}]})
+
+    def test_malformed_csv(self):
+        self.client.login(username="coach", password="CoachPass123*")
+        csv_body = CSV_HEADER + 'member1,ValidPass123*,Gym,"Member"s,member1@email.com,1990-05-05,+447700900001,80,175\n'
+        csv_body += "member2,ValidPass123*,Gym,Member,member2@email.com,1990-05-05,+447700900002,80,175\n"
+
+        response = self.client.post(self.url, data=csv_body, content_type="text/csv")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"created": 1, "failed": 1, "errors": [{"row": 1, "error": V.INVALID_CSV_ROW}]})
+
+        response = self.client.post(self.url, data='username,"password\n', content_type="text/csv")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], V.INVALID_CSV_HEADER)
+
+    def test_method_not_allowed(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 400)
+
+
+class ImportUsersCommandTests(TestCase):
+    def test_command_imports_file_and_writes_report(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "members.ndjson"
+            source.write_text(toNdjson([memberRow(1), memberRow(1)]), encoding="utf-8")
+            report_path = Path(tmp) / "report.json"
+
+            out = StringIO()
+            call_command("import_users", str(source), "--batch-size", "1", "--report", str(report_path), stdout=out)
+
+            self.assertIn("Created 1 users, 1 rows failed.", out.getvalue())
+            report = json.loads(report_path.read_text(encoding="utf-8"))
+            self.assertEqual(report["errors"], [{"row": 2, "error": V.TAKEN_USERNAME}])
+
+        self.assertTrue(User.objects.filter(username="member1").exists())
@@ -0,0 +1,105 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, LiveServerTestCase, Client
+from django.urls import reverse
+
+from gymcommon.serviceClient import ServiceClient
+from gymcommon.usersClient import UsersClient
+from UserApp.viewHandling import viewHandlingConstants as V
+
+User = get_user_model()
+
+
+def createUsers(count: int) -> list:
+    return User.objects.bulk_create(
+        User(username=f"member{i}", email=f"member{i}@email.com", first_name="Gym", last_name=f"Member {i}", password="!")
+        for i in range(count)
+    )
+
+
+class UserLookupTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("user_lookup")
+        self.users = createUsers(3)
+
+    def test_one_query_for_many_users(self):
+        ids = [user.id for user in self.users]
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"ids": ",".join(map(str, ids + [999]))})
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["missing"], {"ids": [999], "usernames": [], "emails": []})
+        self.assertEqual(body["users"][str(ids[1])], {"id": ids[1], "username": "member1", "first_name": "Gym", "last_name": "Member 1"})
+        self.assertEqual(len(body["users"]), 3)
+
+    def test_ids_usernames_and_emails_in_one_query(self):
+        first, second, third = self.users
+        params = {
+            "ids": f"{first.id},999",
+            "usernames": "member1,member0,nobody",
+            "emails": " MEMBER2@email.com,member1@email.com,nobody@email.com",
+        }
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, params)
+
+        body = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sorted(body["users"]), sorted(str(user.id) for user in self.users))
+        self.assertNotIn("email", body["users"][str(third.id)])
+        self.assertEqual(body["usernames"], {"member1": second.id, "member0": first.id})
+        self.assertEqual(body["emails"], {"member2@email.com": third.id, "member1@email.com": second.id})
+        self.assertEqual(body["missing"], {"ids": [999], "usernames": ["nobody"], "emails": ["nobody@email.com"]})
+
+    def test_only_public_fields_loaded(self):
+        with self.assertNumQueries(1) as queries:
+            self.client.get(self.url, {"usernames": "member0"})
+        sql = queries.captured_queries[0]["sql"]
+        self.assertNotIn("password", sql)
+        self.assertNotIn("email", sql.split("FROM")[0])
+
+    def test_duplicates_resolved_once(self):
+        user_id = self.users[0].id
+        response = self.client.get(self.url, {"ids": f"{user_id},{user_id}"})
+        self.assertEqual(list(response.json()["users"]), [str(user_id)])
+
+    def test_invalid_parameters(self):
+        cases = [
+            ({}, V.MISSING_LOOKUP),
+            ({"ids": "1,abc"}, "User ID must be an integer."),
+            ({"ids": "1,-2"}, V.INVALID_USER_ID_VALUE),
+            ({"ids": ",".join(str(i) for i in range(1, 102))}, V.TOO_MANY_LOOKUPS),
+            ({"ids": ",".join(str(i) for i in range(1, 61)), "usernames": ",".join(f"user{i}" for i in range(41))}, V.TOO_MANY_LOOKUPS),
+            ({"usernames": "member0, "}, V.EMPTY_USERNAME),
+            ({"emails": "not-an-email"}, V.INVALID_EMAIL),
+        ]
+        for params, message in cases:
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["error"], message)
+
+    def test_method_not_allowed(self):
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 400)
+
+
+class UsersClientLiveTests(LiveServerTestCase):
+    """
+    Resolves users through the shared client against a running Users service.
+    """
+
+    def setUp(self):
+        self.users = createUsers(250)
+        self.client = UsersClient(ServiceClient(self.live_server_url, timeout=5))
+
+    def tearDown(self):
+        self.client.client.close()
+
+    def test_resolves_in_batches(self):
+        ids = [user.id for user in self.users] + [10**6]
+        resolved = self.client.resolveUsers(ids)
+
+        self.assertEqual(len(resolved), 251)
+        self.assertEqual(resolved[self.users[200].id]["username"], "member200")
+        self.assertIsNone(resolved[10**6])
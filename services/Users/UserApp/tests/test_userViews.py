@@ -6,6 +6,10 @@ import json
 from django.test import TestCase, Client
 from django.urls import reverse, NoReverseMatch
 from django.contrib.auth import get_user_model
+from django.contrib.auth.signals import user_login_failed
+from django.db import connection
+from django.db.models.signals import pre_delete, post_delete
+from django.test.utils import CaptureQueriesContext
 
 # If you assert on specific error texts, import your constants:
 from UserApp.viewHandling import viewHandlingConstants as V
@@ -498,6 +502,65 @@ class CreateUserTests(TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertIn("error", response.json())
         self.assertIn(V.LARGE_HEIGHT, response.json()["error"])
+
+    def test_create_user_query_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.post_json(self.payload)
+        self.assertEqual(response.status_code, 201)
+
+        # One batched uniqueness SELECT plus the INSERT, ignoring savepoint statements
+        statements = [q["sql"] for q in ctx.captured_queries if "SAVEPOINT" not in q["sql"]]
+        self.assertEqual(len(statements), 2)
+        self.assertTrue(statements[0].startswith("SELECT"))
+        self.assertTrue(statements[1].startswith("INSERT"))
+
+    def test_taken_username_and_email_reports_username(self):
+        self.post_json(self.payload)
+
+        payload = self.payload.copy()
+        payload["phone_number"] = "+447700900199"
+        response = self.post_json(payload)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(V.TAKEN_USERNAME, response.json()["error"])
+
+    def test_taken_username_compared_after_normalisation(self):
+        self.post_json(self.payload)
+
+        payload = self.payload.copy()
+        payload.update(username="\uff54\uff45\uff53\uff54user", email="other@email.com", phone_number="+447700900199")  # Fullwidth "test"
+        response = self.post_json(payload)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(V.TAKEN_USERNAME, response.json()["error"])
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_taken_username_reported_before_invalid_password(self):
+        self.post_json(self.payload)
+
+        payload = self.payload.copy()
+        payload["password"] = "short"
+        response = self.post_json(payload)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(V.TAKEN_USERNAME, response.json()["error"])
+
+    def test_taken_email_reported_before_invalid_phone_number(self):
+        self.post_json(self.payload)
+
+        payload = self.payload.copy()
+        payload["username"] = "otheruser"
+        payload["phone_number"] = "not-a-number"
+        response = self.post_json(payload)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(V.TAKEN_EMAIL, response.json()["error"])
+
+    def test_invalid_password_reported_before_taken_email(self):
+        self.post_json(self.payload)
+
+        payload = self.payload.copy()
+        payload["username"] = "otheruser"
+        payload["password"] = "short"
+        response = self.post_json(payload)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(V.INVALID_PASSWORD, response.json()["error"])
     
     
 class LoginUserTests(TestCase):
@@ -651,6 +714,25 @@ class LoginUserTests(TestCase):
         self.assertIn("error", response.json())
         self.assertIn("Invalid credentials", response.json()["error"])  
 
+    def test_inactive_user(self):
+        self.register_user()
+        User.objects.filter(username="testuser").update(is_active=False)
+
+        response = self.post_json(self.login_url, self.login_payload)
+        self.assertEqual(response.status_code, 401)
+
+    def test_failed_login_signalled(self):
+        self.register_user()
+        failures = []
+        receiver = lambda sender, credentials, **kwargs: failures.append(credentials["username"])
+        user_login_failed.connect(receiver)
+        try:
+            self.post_json(self.login_url, {"username": "testuser", "password": "wrongpassword*"})
+        finally:
+            user_login_failed.disconnect(receiver)
+
+        self.assertEqual(failures, ["testuser"])
+
 
 class LogoutUserTests(TestCase):
     def setUp(self):
@@ -868,6 +950,31 @@ class GetUserTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["id"], a["id"])
 
+    def test_get_uses_one_query(self):
+        uid = self.register_user().json()["id"]
+        lookups = [
+            ({"id": uid}, 200),
+            ({"username": "testuser"}, 200),
+            ({"email": "testuser@email.com"}, 200),
+            ({"id": 999999}, 404),
+            ({"username": "nobody"}, 404),
+            ({"email": "nobody@email.com"}, 404),
+        ]
+        for params, status in lookups:
+            with self.subTest(params=params), self.assertNumQueries(1):
+                response = self.client.get(self.user_url, params)
+                self.assertEqual(response.status_code, status)
+
+    def test_get_not_found_messages(self):
+        cases = [
+            ({"id": 999999}, V.ID_DOES_NOT_EXIST),
+            ({"username": "nobody"}, V.USERNAME_DOES_NOT_EXIST),
+            ({"email": "nobody@email.com"}, V.EMAIL_DOES_NOT_EXIST),
+        ]
+        for params, message in cases:
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(self.user_url, params).json()["error"], message)
+
 class DeleteUserTests(TestCase):
     def setUp(self):
         self.client = Client()
@@ -972,4 +1079,51 @@ class DeleteUserTests(TestCase):
         self.assertIn(response.status_code, (404,))  
         self.assertTrue(
             V.ID_DOES_NOT_EXIST in response.json()["error"] or response.json()["error"] == "User not found"
-        )
\ No newline at end of file
+        )
+
+    def test_delete_query_count(self):
+        uid = self.register_user().json()["id"]
+
+        # The user is loaded for the delete signals, the admin log, group and permission rows go without a SELECT
+        with self.assertNumQueries(5) as queries:
+            response = self.delete_json(self.user_url, {"id": uid})
+        self.assertEqual(response.status_code, 200)
+        statements = [query["sql"].split()[0] for query in queries.captured_queries]
+        self.assertEqual(statements, ["SELECT", "DELETE", "DELETE", "DELETE", "DELETE"])
+
+        with self.assertNumQueries(1):
+            response = self.delete_json(self.user_url, {"id": uid})
+        self.assertEqual(response.status_code, 404)
+
+    def test_delete_removes_related_rows(self):
+        from django.contrib.admin.models import LogEntry, ADDITION
+        from django.contrib.auth.models import Group, Permission
+
+        user = User.objects.get(id=self.register_user().json()["id"])
+        user.groups.add(Group.objects.create(name="coaches"))
+        user.user_permissions.add(Permission.objects.first())
+        LogEntry.objects.create(user=user, action_flag=ADDITION, object_repr="test")
+
+        self.assertEqual(self.delete_json(self.user_url, {"id": user.id}).status_code, 200)
+
+        self.assertFalse(User.groups.through.objects.filter(user_id=user.id).exists())
+        self.assertFalse(User.user_permissions.through.objects.filter(user_id=user.id).exists())
+        self.assertFalse(LogEntry.objects.filter(user_id=user.id).exists())
+        self.assertTrue(Group.objects.filter(name="coaches").exists())
+
+    def test_delete_signals_sent(self):
+        uid = self.register_user().json()["id"]
+        sent = []
+
+        def receiver(signal, sender, instance, **kwargs):
+            sent.append((signal, instance.pk))
+
+        pre_delete.connect(receiver, sender=User)
+        post_delete.connect(receiver, sender=User)
+        try:
+            self.assertEqual(self.delete_json(self.user_url, {"id": uid}).status_code, 200)
+        finally:
+            pre_delete.disconnect(receiver, sender=User)
+            post_delete.disconnect(receiver, sender=User)
+
+        self.assertEqual(sent, [(pre_delete, uid), (post_delete, uid)])
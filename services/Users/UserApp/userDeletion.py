@@ -0,0 +1,14 @@
+"""
+Deleting a user by id without a separate existence query.
+"""
+from UserApp.models import User
+
+
+def deleteUser(user_id: int) -> bool:
+    """
+    Deletes the user and the rows that cascade from it. Returns False when no such user exists, after a single query.
+    The ORM collector loads the user, so pre_delete and post_delete are sent and UserApp.signals clears the profile cache.
+    Its admin log, group and permission rows have no receivers and are fast deleted with one filtered DELETE per table.
+    """
+    deleted, _ = User.objects.filter(id=user_id).delete()
+    return bool(deleted)
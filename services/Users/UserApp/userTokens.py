@@ -0,0 +1,24 @@
+from functools import lru_cache
+
+from django.conf import settings
+
+from gymcommon.serviceTokens import KeyFile, issueToken
+
+
+@lru_cache(maxsize=None)
+def buildKeyFile(path: str) -> KeyFile:
+    return KeyFile(path, create=True)
+
+def getKeyFile() -> KeyFile:
+    """
+    Returns the key file shared with the other services, creating it with a first key if it does not exist.
+    """
+    return buildKeyFile(str(settings.SERVICE_TOKEN_KEY_FILE))
+
+def issueUserToken(user_id: int) -> dict:
+    """
+    Returns the fields added to a login response: a token the other services verify without calling
+    this one, and its lifetime in seconds. Clients fetch a fresh one from POST /token/ before it expires.
+    """
+    ttl = settings.SERVICE_TOKEN_TTL
+    return {"token": issueToken(getKeyFile().ring(), user_id, ttl), "token_expires_in": ttl}
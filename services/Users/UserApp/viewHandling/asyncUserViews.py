@@ -0,0 +1,148 @@
+import json
+
+from asgiref.sync import sync_to_async
+from UserApp.models import User  # Importing the custom User model
+from django.core.exceptions import BadRequest
+from django.contrib.auth import aauthenticate, alogin, alogout
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError
+
+from UserApp.viewHandling import viewHandlingConstants as validators
+from UserApp.viewHandling.jsonResponses import jsonResponse, rawJsonResponse
+from UserApp.profileCache import SELF_RESPONSE_MESSAGE, acacheSelfResponse, agetCachedSelfResponse
+from UserApp.userDeletion import deleteUser
+from UserApp.userTokens import issueUserToken
+from UserApp.viewHandling.userViews import createUserResponseData, parseDeleteData
+from UserApp.viewHandling.viewHandlingValidators import avalidateNewUser, avalidateUniqueUserFields, validateGetLookup, validateDeleteLookup, validateUsername, validatePassword
+
+# Password hashing is pure CPU work, so it runs in the thread pool instead of blocking the event loop
+hashPasswordAsync = sync_to_async(make_password, thread_sensitive=False)
+deleteUserAsync = sync_to_async(deleteUser)
+
+async def userRegisterAsync(request):
+    """
+    Async version of userRegister.
+    """
+    try:
+        data = json.loads(request.body.decode("utf-8"))
+    except ValueError:
+        return jsonResponse({"error": "Invalid JSON"}, status=400)
+
+    try:
+        fields = await avalidateNewUser(data)
+    except BadRequest as e:
+        return jsonResponse({"error": str(e)}, status=400)
+
+    password = fields.pop("password")
+    user = User(**fields)
+    user.password = await hashPasswordAsync(password)
+
+    try:
+        await user.asave(force_insert=True)
+    except IntegrityError:
+        # Another signup took one of the values after the uniqueness check
+        try:
+            await avalidateUniqueUserFields(fields["username"], fields["email"], fields["phone_number"])
+        except BadRequest as e:
+            return jsonResponse({"error": str(e)}, status=400)
+        raise
+    return jsonResponse({"ok": True, "id": user.id, "name": user.first_name}, status=201)
+
+async def userLoginAsync(request):
+    """
+    Async version of userLogin.
+    """
+    try:
+        data = json.loads(request.body.decode("utf-8"))
+    except ValueError:
+        return jsonResponse({"error": "Invalid JSON"}, status=400)
+
+    try:
+        username = validateUsername(data.get("username"))
+        password = validatePassword(data.get("password"))
+    except BadRequest as e:
+        return jsonResponse({"error": str(e)}, status=400)
+
+    user = await authenticateUserAsync(request, {"username": username, "password": password})
+    if user is None:
+        return jsonResponse({"error": "Invalid credentials"}, status=401)
+
+    response = createUserResponseData(user)
+    await acacheSelfResponse(user, dict(response, message=SELF_RESPONSE_MESSAGE))
+
+    response["message"] = "User logged in successfully"
+    response.update(issueUserToken(user.id))  # Signing is in memory; the key file is only re-read when it changes
+    return jsonResponse(response, status=200)
+
+async def userLogoutAsync(request):
+    """
+    Async version of userLogout.
+    """
+    user = await request.auser()
+    if user.is_authenticated:
+        await alogout(request)
+        return jsonResponse({"message": "User logged out successfully"}, status=200)
+    return jsonResponse({"error": "User not logged in"}, status=401)
+
+async def authenticateUserAsync(request, requestData: dict):
+    """
+    Async version of authenticateUser. Returns the logged in user, or None for invalid credentials.
+    """
+    user = await aauthenticate(request, username=requestData["username"], password=requestData["password"])
+    if user is not None:
+        await alogin(request, user)
+    return user
+
+async def userGetAsync(request):
+    """
+    Async version of userGet, resolving the user with a single query.
+    """
+    data = request.GET.dict()
+    if not data:
+        return await userGetSelfAsync(request)
+
+    try:
+        field, value, not_found = validateGetLookup(data)
+        user = await User.objects.aget(**{field: value})
+    except BadRequest as e:
+        return jsonResponse({"error": str(e)}, status=400)
+    except User.DoesNotExist:
+        return jsonResponse({"error": not_found}, status=404)
+
+    userResponse = createUserResponseData(user)
+    userResponse["message"] = "User data retrieved successfully"
+    return jsonResponse(userResponse, status=200)
+
+async def userGetSelfAsync(request):
+    """
+    Async version of userGetSelf.
+    """
+    cached = await agetCachedSelfResponse(request)
+    if cached is not None:
+        return rawJsonResponse(cached, status=200)
+
+    user = await request.auser()
+    if not user.is_authenticated:
+        return jsonResponse({"error": "User not logged in"}, status=401)
+
+    userResponse = createUserResponseData(user)
+    userResponse["message"] = SELF_RESPONSE_MESSAGE
+    return rawJsonResponse(await acacheSelfResponse(user, userResponse), status=200)
+
+async def userDeleteAsync(request):
+    """
+    Async version of userDelete.
+    """
+    try:
+        data = parseDeleteData(request)
+    except ValueError:
+        return jsonResponse({"error": "Invalid JSON"}, status=400)
+
+    try:
+        user_id = validateDeleteLookup(data)
+    except BadRequest as e:
+        return jsonResponse({"error": str(e)}, status=400)
+
+    if not await deleteUserAsync(user_id):
+        return jsonResponse({"error": validators.ID_DOES_NOT_EXIST}, status=404)
+    return jsonResponse({"message": "User deleted successfully"}, status=200)
@@ -0,0 +1,33 @@
+import json
+
+from django.http import HttpResponse
+
+try:
+    import orjson  # Optional, much faster than the stdlib encoder for small payloads
+except ImportError:
+    orjson = None
+
+JSON_CONTENT_TYPE = "application/json"
+
+
+def encodeJsonStdlib(payload) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+def encodeJsonOrjson(payload) -> bytes:
+    return orjson.dumps(payload)
+
+encodeJson = encodeJsonOrjson if orjson is not None else encodeJsonStdlib
+
+
+def jsonResponse(payload: dict, status: int = 200) -> HttpResponse:
+    """
+    Drop-in replacement for JsonResponse for payloads made of plain JSON types.
+    Skips DjangoJSONEncoder and encodes with orjson when it is installed.
+    """
+    return HttpResponse(encodeJson(payload), content_type=JSON_CONTENT_TYPE, status=status)
+
+def rawJsonResponse(body: bytes, status: int = 200) -> HttpResponse:
+    """
+    Wraps an already encoded JSON body, e.g. one read from the profile cache.
+    """
+    return HttpResponse(body, content_type=JSON_CONTENT_TYPE, status=status)
@@ -0,0 +1,197 @@
+import csv
+import json
+
+from UserApp.models import User  # Importing the custom User model
+from UserApp.passwordHashing import hashPasswords
+from django.contrib.auth.base_user import BaseUserManager
+from django.core.exceptions import BadRequest
+from django.db import IntegrityError, transaction
+
+from UserApp.viewHandling import viewHandlingConstants as validators  # Importing validation messages
+from UserApp.viewHandling.viewHandlingValidators import validateRegisterData
+
+DEFAULT_BATCH_SIZE = 1000
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+CSV_CONTENT_TYPES = ("text/csv", "application/csv")
+
+
+#ROW READERS
+def isUtf8(text: str) -> bool:
+    try:
+        text.encode("utf-8")  # Bytes that were not UTF-8 are decoded to lone surrogates, which cannot be encoded again
+    except UnicodeEncodeError:
+        return False
+    return True
+
+def iterNdjsonRows(lines):
+    """
+    Yields (row_number, data) for every non-blank NDJSON line.
+    data is an error message instead when the line is not UTF-8 or not a JSON object.
+    """
+    row_number = 0
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", "surrogateescape")
+        if not line.strip():
+            continue
+
+        row_number += 1
+        if not isUtf8(line):
+            yield row_number, validators.INVALID_IMPORT_ENCODING
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            data = None
+        yield row_number, data if isinstance(data, dict) else validators.INVALID_IMPORT_ROW
+
+def iterCsvRows(lines):
+    """
+    Yields (row_number, data) for every CSV record after the header row.
+    Empty cells are treated as missing fields. data is an error message instead when the record is not UTF-8 or not valid CSV.
+    """
+    decoded = (line.decode("utf-8", "surrogateescape") if isinstance(line, bytes) else line for line in lines)
+    reader = csv.DictReader(decoded, strict=True)  # Stray quotes are reported instead of read into the field
+    try:
+        fieldnames = reader.fieldnames
+    except csv.Error:
+        raise BadRequest(validators.INVALID_CSV_HEADER)
+    if fieldnames is None:
+        raise BadRequest(validators.MISSING_CSV_HEADER)
+    if not all(isUtf8(name) for name in fieldnames):
+        raise BadRequest(validators.INVALID_CSV_HEADER)
+
+    row_number = 0
+    while True:
+        row_number += 1
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error:
+            yield row_number, validators.INVALID_CSV_ROW  # The reader starts afresh on the next line
+            continue
+
+        if not all(isUtf8(value) for value in row.values() if isinstance(value, str)):
+            yield row_number, validators.INVALID_IMPORT_ENCODING
+            continue
+        yield row_number, {key.strip(): value for key, value in row.items() if key and value not in (None, "")}
+
+def iterImportRows(lines, import_format: str):
+    if import_format == "ndjson":
+        return iterNdjsonRows(lines)
+    if import_format == "csv":
+        return iterCsvRows(lines)
+    raise BadRequest(validators.UNSUPPORTED_IMPORT_FORMAT)
+
+def importFormatFromContentType(content_type: str) -> str:
+    if content_type in NDJSON_CONTENT_TYPES:
+        return "ndjson"
+    if content_type in CSV_CONTENT_TYPES:
+        return "csv"
+    raise BadRequest(validators.UNSUPPORTED_IMPORT_FORMAT)
+
+
+#IMPORTER
+class UserImporter:
+    """
+    Validates and inserts users in batches.
+    Existing usernames, emails and phone numbers are loaded once up front,
+    so uniqueness is checked in memory instead of one query per row.
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.batch_size = max(1, batch_size)
+        self.created = 0
+        self.errors = []
+        self.pending = []
+
+        self.usernames = set(User.objects.values_list("username", flat=True))
+        self.emails = set(User.objects.values_list("email", flat=True))
+        self.phone_numbers = set(User.objects.exclude(phone_number=None).values_list("phone_number", flat=True))
+
+    def validateRow(self, data: dict) -> User:
+        fields = validateRegisterData(data)
+        # bulk_create skips create_user, so its normalisation is applied here, before the uniqueness checks
+        fields["username"] = User.normalize_username(fields["username"])
+        fields["email"] = BaseUserManager.normalize_email(fields["email"])
+
+        if fields["username"] in self.usernames:
+            raise BadRequest(validators.TAKEN_USERNAME)
+        if fields["email"] in self.emails:
+            raise BadRequest(validators.TAKEN_EMAIL)
+        if fields["phone_number"] in self.phone_numbers:
+            raise BadRequest(validators.TAKEN_PHONE_NUMBER)
+
+        return User(**fields)  # The raw password is hashed when the batch is flushed
+
+    def addRow(self, row_number: int, data) -> None:
+        if isinstance(data, str):  # The reader could not read the row
+            self.errors.append({"row": row_number, "error": data})
+            return
+
+        try:
+            user = self.validateRow(data)
+        except BadRequest as e:
+            self.errors.append({"row": row_number, "error": str(e)})
+            return
+
+        # Reserve the values so later rows in the same import are rejected too
+        self.usernames.add(user.username)
+        self.emails.add(user.email)
+        self.phone_numbers.add(user.phone_number)
+
+        self.pending.append((row_number, user))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def hashPasswords(self, users: list) -> None:
+        hashed = hashPasswords([user.password for user in users])  # Spread across the hashing pool when configured
+        for user, password in zip(users, hashed):
+            user.password = password
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+
+        batch, self.pending = self.pending, []
+        self.hashPasswords([user for _, user in batch])
+
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create([user for _, user in batch])
+            self.created += len(batch)
+            return
+        except IntegrityError:
+            pass
+
+        # A concurrent write took one of the values, fall back to row-by-row inserts for this batch
+        for row_number, user in batch:
+            try:
+                with transaction.atomic():
+                    user.save(force_insert=True)
+                self.created += 1
+            except IntegrityError:
+                self.errors.append({"row": row_number, "error": self.describeConflict(user)})
+
+    def describeConflict(self, user: User) -> str:
+        if User.objects.filter(username=user.username).exists():
+            return validators.TAKEN_USERNAME
+        if User.objects.filter(email=user.email).exists():
+            return validators.TAKEN_EMAIL
+        return validators.TAKEN_PHONE_NUMBER
+
+    def importRows(self, rows) -> dict:
+        for row_number, data in rows:
+            self.addRow(row_number, data)
+        self.flush()
+        return self.report()
+
+    def report(self) -> dict:
+        self.errors.sort(key=lambda error: error["row"])
+        return {
+            "created": self.created,
+            "failed": len(self.errors),
+            "errors": self.errors,
+        }
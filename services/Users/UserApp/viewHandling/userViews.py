@@ -1,43 +1,44 @@
 import json
 
 from UserApp.models import User  # Importing the custom User model 
-from django.http import JsonResponse, HttpResponse
-from django.core.exceptions import BadRequest, ObjectDoesNotExist
+from django.core.exceptions import BadRequest
 from django.contrib.auth import authenticate, login, logout
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 
-from UserApp.viewHandling.viewHandlingValidators import validateCreateUsername, validateCreatePassword, validateCreateEmail, validateDateOfBirth, validatePhoneNumber, validateWeight, validateHeight, validateGetStudentData, validateDeleteStudentData, validateFirstName, validateLastName, validateUserID, validateUsername, validatePassword, validateEmail, validateUniqueEmail
+from UserApp.viewHandling import viewHandlingConstants as validators
+from UserApp.viewHandling.jsonResponses import jsonResponse, rawJsonResponse
+from UserApp.profileCache import SELF_RESPONSE_MESSAGE, cacheSelfResponse, getCachedSelfResponse
+from UserApp.userDeletion import deleteUser
+from UserApp.userTokens import issueUserToken
+from UserApp.viewHandling.userImport import UserImporter, DEFAULT_BATCH_SIZE, importFormatFromContentType, iterImportRows
+
+from UserApp.viewHandling.viewHandlingValidators import validateNewUser, validateUniqueUserFields, validateGetLookup, validateDeleteLookup, validateUsername, validatePassword, validateLookupData
+
+PUBLIC_PROFILE_FIELDS = ("id", "username", "first_name", "last_name")
 
 def userRegister(request):
     try:
         data = json.loads(request.body.decode("utf-8"))
     except ValueError:
-        return JsonResponse({"error": "Invalid JSON"}, status=400)
+        return jsonResponse({"error": "Invalid JSON"}, status=400)
 
     try:
-        username = validateCreateUsername(data)
-        password = validateCreatePassword(data)
-        first_name = validateFirstName(data)
-        last_name = validateLastName(data)
-        email = validateCreateEmail(data)
-        dob = validateDateOfBirth(data)            
-        phone = validatePhoneNumber(data)
-        weight = validateWeight(data)
-        height = validateHeight(data)
+        fields = validateNewUser(data)  # One query for all uniqueness checks
     except BadRequest as e:
-        return JsonResponse({"error": str(e)}, status=400)
-
-    user = User.objects.create_user(
-        username=username,
-        password=password,
-        first_name=first_name,
-        last_name=last_name,
-        email=email,
-        date_of_birth=dob,          
-        phone_number=phone,
-        weight=weight,
-        height=height,
-    )
-    return JsonResponse({"ok": True, "id": user.id, "name": user.first_name}, status=201)
+        return jsonResponse({"error": str(e)}, status=400)
+
+    try:
+        with transaction.atomic():
+            user = User.objects.create_user(**fields)
+    except IntegrityError:
+        # Another signup took one of the values after the uniqueness check
+        try:
+            validateUniqueUserFields(fields["username"], fields["email"], fields["phone_number"])
+        except BadRequest as e:
+            return jsonResponse({"error": str(e)}, status=400)
+        raise
+    return jsonResponse({"ok": True, "id": user.id, "name": user.first_name}, status=201)
 
 def userLogin(request):
     """
@@ -46,21 +47,35 @@ def userLogin(request):
     try:
         data = json.loads(request.body.decode("utf-8"))
     except ValueError:
-        return JsonResponse({"error": "Invalid JSON"}, status=400)
+        return jsonResponse({"error": "Invalid JSON"}, status=400)
     
     try:    
         username = validateUsername(data.get("username"))
         password = validatePassword(data.get("password"))
     except BadRequest as e:
-        return JsonResponse({"error": str(e)}, status=400)
+        return jsonResponse({"error": str(e)}, status=400)
     
     #Check if user exists
     if not authenticateUser(request, {"username": username, "password": password}):
-        return JsonResponse({"error": "Invalid credentials"}, status=401)
+        return jsonResponse({"error": "Invalid credentials"}, status=401)
 
     response = createUserResponseData(request.user)
+
+    # Warm the profile cache so the client's GET /user/ polling starts from a cache hit
+    selfResponse = dict(response, message=SELF_RESPONSE_MESSAGE)
+    cacheSelfResponse(request.user, selfResponse)
+
     response["message"] = "User logged in successfully"
-    return JsonResponse(response, status=200)
+    response.update(issueUserToken(request.user.id))
+    return jsonResponse(response, status=200)
+
+def userToken(request):
+    """
+    A view to handle issuing a fresh service token to the logged in user.
+    """
+    if not request.user.is_authenticated:
+        return jsonResponse({"error": "User not logged in"}, status=401)
+    return jsonResponse(issueUserToken(request.user.id), status=200)
     
 def userLogout(request):
     """
@@ -68,8 +83,8 @@ def userLogout(request):
     """
     if request.user.is_authenticated:
         logout(request)
-        return JsonResponse({"message": "User logged out successfully"}, status=200)
-    return JsonResponse({"error": "User not logged in"}, status=401)
+        return jsonResponse({"message": "User logged out successfully"}, status=200)
+    return jsonResponse({"error": "User not logged in"}, status=401)
 
 
 def authenticateUser(request, requestData: dict):
@@ -104,67 +119,122 @@ def userGet(request):
         return userGetSelf(request)
 
     try:
-        validateGetStudentData(data)
-        if "id" in data:
-            user_id = validateUserID(data["id"])
-            user = User.objects.get(id=user_id)
-        elif "username" in data:
-            username = validateUsername(data["username"])
-            user = User.objects.get(username=username)
-        else:
-            email = validateEmail(data["email"])
-            user = User.objects.get(email=email)
+        field, value, not_found = validateGetLookup(data)
+        user = User.objects.get(**{field: value})
     except BadRequest as e:
-        return JsonResponse({"error": str(e)}, status=400)
-    except ObjectDoesNotExist as e:                 
-        return JsonResponse({"error": str(e)}, status=404)
+        return jsonResponse({"error": str(e)}, status=400)
     except User.DoesNotExist:
-        return JsonResponse({"error": "User not found"}, status=404)
+        return jsonResponse({"error": not_found}, status=404)
 
     userResponse = createUserResponseData(user)
     userResponse["message"] = "User data retrieved successfully"
     
-    return JsonResponse(userResponse, status=200)
+    return jsonResponse(userResponse, status=200)
 
 def userGetSelf(request):
     """
     A view to handle retrieval of the authenticated user's data.
+    Served from the profile cache when possible, which skips loading the user row.
     """
+    cached = getCachedSelfResponse(request)
+    if cached is not None:
+        return rawJsonResponse(cached, status=200)
+
     if not request.user.is_authenticated:
-        return JsonResponse({"error": "User not logged in"}, status=401)
+        return jsonResponse({"error": "User not logged in"}, status=401)
 
     
     user = request.user
     userResponse = createUserResponseData(user)
-    userResponse["message"] = "User data retrieved successfully"
-    return JsonResponse(userResponse, status=200)
+    userResponse["message"] = SELF_RESPONSE_MESSAGE
+    return rawJsonResponse(cacheSelfResponse(user, userResponse), status=200)
     
-def userDelete(request):
+def userLookup(request):
+    """
+    A view to handle resolving many users by id, username or email in one request, for the other services.
+    Returns the public profile of every user found keyed by id, the ids the usernames and emails
+    resolved to, and the values that matched no user.
+    """
+    try:
+        lookups = validateLookupData(request.GET)
+    except BadRequest as e:
+        return jsonResponse({"error": str(e)}, status=400)
+
+    query = Q()
+    for field, values in (("id", lookups["ids"]), ("username", lookups["usernames"]), ("email", lookups["emails"])):
+        if values:
+            query |= Q(**{f"{field}__in": values})
+    fields = PUBLIC_PROFILE_FIELDS + (("email",) if lookups["emails"] else ())
+    found = list(User.objects.filter(query).only(*fields))
+
+    users = {str(user.id): createPublicProfile(user) for user in found}
+    usernames = {user.username: user.id for user in found}
+    emails = {user.email: user.id for user in found} if lookups["emails"] else {}
+    return jsonResponse({
+        "users": users,
+        "usernames": {username: usernames[username] for username in lookups["usernames"] if username in usernames},
+        "emails": {email: emails[email] for email in lookups["emails"] if email in emails},
+        "missing": {
+            "ids": [user_id for user_id in lookups["ids"] if str(user_id) not in users],
+            "usernames": [username for username in lookups["usernames"] if username not in usernames],
+            "emails": [email for email in lookups["emails"] if email not in emails],
+        },
+    }, status=200)
+
+def createPublicProfile(user: User) -> dict:
+    return {field: getattr(user, field) for field in PUBLIC_PROFILE_FIELDS}
+
+def parseDeleteData(request) -> dict:
+    """
+    Merges the query string with an optional JSON object body.
+    Raises ValueError when the body is not a JSON object.
+    """
     data = request.GET.dict()
 
+    raw = (request.body or b"").decode("utf-8")
+    if raw.strip():
+        body = json.loads(raw)
+        if not isinstance(body, dict):
+            raise ValueError("Invalid JSON")
+        data.update(body)
+
+    return data
+
+def userDelete(request):
     try:
-        raw = (request.body or b"").decode("utf-8")
-        if raw.strip():
-            body = json.loads(raw)
-            if isinstance(body, dict):
-                data.update(body)
-            else:
-                return JsonResponse({"error": "Invalid JSON"}, status=400)
+        data = parseDeleteData(request)
     except ValueError:
-        return JsonResponse({"error": "Invalid JSON"}, status=400)
+        return jsonResponse({"error": "Invalid JSON"}, status=400)
 
     try:
-        validateDeleteStudentData(data)
+        user_id = validateDeleteLookup(data)
     except BadRequest as e:
-        return JsonResponse({"error": str(e)}, status=400)
-    except ObjectDoesNotExist as e:                 
-        return JsonResponse({"error": str(e)}, status=404)
+        return jsonResponse({"error": str(e)}, status=400)
+
+    if not deleteUser(user_id):
+        return jsonResponse({"error": validators.ID_DOES_NOT_EXIST}, status=404)
+    return jsonResponse({"message": "User deleted successfully"}, status=200)
+
+def userBulkImport(request):
+    """
+    A view to handle bulk user imports from an NDJSON or CSV request body.
+    The body is read line by line, so large member lists are never held in memory at once.
+    """
+    if not request.user.is_authenticated:
+        return jsonResponse({"error": "User not logged in"}, status=401)
+    if not request.user.is_staff:
+        return jsonResponse({"error": validators.NOT_STAFF}, status=403)
 
     try:
-        user_id = validateUserID(data["id"])
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
-        return JsonResponse({"error": "User not found"}, status=404)
+        batch_size = int(request.GET.get("batch_size", DEFAULT_BATCH_SIZE))
+    except ValueError:
+        batch_size = DEFAULT_BATCH_SIZE
+
+    try:
+        import_format = importFormatFromContentType(request.content_type)
+        rows = iterImportRows(request, import_format)
+        report = UserImporter(batch_size=batch_size).importRows(rows)
+    except BadRequest as e:
+        return jsonResponse({"error": str(e)}, status=400)
 
-    user.delete()
-    return JsonResponse({"message": "User deleted successfully"}, status=200)
+    return jsonResponse(report, status=200)
@@ -59,4 +59,16 @@ MISSING_USER_ID = "User ID is missing."
 EMPTY_USER_ID = "User ID cannot be empty."
 INVALID_USER_ID_VALUE = "User ID is invalid. It must be a valid integer."
 INVALID_USER_ID_TYPE = "User ID must be an integer."
-ID_DOES_NOT_EXIST = "User ID does not exist."
\ No newline at end of file
+ID_DOES_NOT_EXIST = "User ID does not exist."
+
+INVALID_IMPORT_ROW = "Row is not a valid JSON object."
+INVALID_IMPORT_ENCODING = "Row is not valid UTF-8."
+INVALID_CSV_ROW = "Row is not valid CSV."
+UNSUPPORTED_IMPORT_FORMAT = "Unsupported import format. Use NDJSON (application/x-ndjson) or CSV (text/csv)."
+MISSING_CSV_HEADER = "CSV header row is missing."
+INVALID_CSV_HEADER = "CSV header row is not valid CSV or UTF-8."
+NOT_STAFF = "Only staff users can perform this action."
+
+MISSING_LOOKUP = "At least one of 'ids', 'usernames', or 'emails' must be provided."
+TOO_MANY_LOOKUPS = "Too many users in one lookup. The maximum is 100."
+MAX_LOOKUP_USERS = 100
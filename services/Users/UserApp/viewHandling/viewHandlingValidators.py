@@ -1,7 +1,10 @@
 from UserApp.models import User  # Importing the custom User model 
-from django.core.exceptions import ValidationError, BadRequest, ObjectDoesNotExist
+from django.core.exceptions import ValidationError, BadRequest
 from django.core.validators import validate_email, RegexValidator
+from django.db.models import Q
 from decimal import Decimal, InvalidOperation
+from functools import reduce
+from operator import or_
 
 
 from UserApp.viewHandling import viewHandlingConstants as validators  # Importing validation messages
@@ -21,22 +24,13 @@ def validateUsername(username: str) -> str:
 
     return username
 
-def validateCreateUsername(data: dict) -> str:
+def validateNewUsername(data: dict) -> str:
     username = data.get("username")
     
     username = validateUsername(username)  # Check if username is provided and not empty
-    validateUniqueUsername(username)  # Check if username is unique
     validateUsernameLength(username)  # Check if username length is valid
     
-    return username
-
-def validateGetUsername(data: dict) -> str:
-    username = data.get("username")
-    
-    u_username = validateUsername(username)  # Check if username is provided and not empty
-    validateUsernameExists(u_username)  # Check if username exists in the database
-    
-    return u_username
+    return User.normalize_username(username)  # As stored by create_user, so uniqueness is checked against the same value
 
 def validateUniqueUsername(username: str) -> None:
     if User.objects.filter(username=username).exists():
@@ -46,12 +40,6 @@ def validateUsernameLength(username):
     if len(username) < 3 or len(username) > 150:
         raise BadRequest(validators.INVALID_USERNAME)
 
-
-def validateUsernameExists(username):
-    if not User.objects.filter(username=username).exists():
-        raise ObjectDoesNotExist(validators.USERNAME_DOES_NOT_EXIST)
-
-
 #PASSWORD VALIDATIONS
 def validateCreatePassword(data):
     password = data.get("password")
@@ -118,35 +106,16 @@ def validateEmail(email: str) -> str:
     
     return email
 
-def validateCreateEmail(data: dict) -> str:
+def validateNewEmail(data: dict) -> str:
     email = data.get("email")
-    email = validateEmail(email)  # Validate email format
-    validateUniqueEmail(email)  # Check if email is unique 
     
-    return email
-
-def validateGetEmail(data):
-    email = data.get("email")
-    
-    u_email = validateEmail(email)  # Validate email format
-    validateEmailExists(u_email)  # Check if email exists in the database
+    return validateEmail(email)  # Validate email format, uniqueness is checked in validateUniqueUserFields
 
 def validateUniqueEmail(email: str) -> None:
     if User.objects.filter(email=email).exists():
         raise BadRequest(validators.TAKEN_EMAIL)
 
-def validateEmailExists(email):
-    
-    if not User.objects.filter(email=email).exists():
-        raise ObjectDoesNotExist(validators.EMAIL_DOES_NOT_EXIST)
-
 #User ID VALIDATIONS
-def validateGetUserID(data):
-    user_id = data.get("id")
-    
-    uid = validateUserID(user_id)  # Validate user ID format
-    validateUserIDExists(uid)
-    
 def validateUserID(user_id) -> int:
     if user_id is None:
         raise BadRequest(validators.MISSING_USER_ID)
@@ -164,26 +133,104 @@ def validateUserID(user_id) -> int:
     
     return uid
 
-def validateUserIDExists(user_id: int) -> None:
-    if not User.objects.filter(id=user_id).exists():
-        raise ObjectDoesNotExist(validators.ID_DOES_NOT_EXIST)
+def validateLookupList(value, validate) -> list:
+    """
+    Validates a comma separated list with validate and returns the values without duplicates, in order.
+    """
+    if value is None or not value.strip():
+        return []
+    return list(dict.fromkeys(validate(part) for part in value.split(",")))
 
 #VALIDATIONS FOR VIEW DATA
-def validateGetStudentData(data: dict) -> None:
+def validateLookupData(data: dict) -> dict:
+    """
+    Validates a batch lookup query string and returns the ids, usernames and emails to resolve.
+    """
+    lookups = {
+        "ids": validateLookupList(data.get("ids"), validateUserID),
+        "usernames": validateLookupList(data.get("usernames"), validateUsername),
+        "emails": validateLookupList(data.get("emails"), validateEmail),
+    }
+    total = sum(len(values) for values in lookups.values())
+    if not total:
+        raise BadRequest(validators.MISSING_LOOKUP)
+    if total > validators.MAX_LOOKUP_USERS:
+        raise BadRequest(validators.TOO_MANY_LOOKUPS)
+    return lookups
+
+def checkRegisterData(data: dict) -> tuple:
+    """
+    Runs every format check for a new user without touching the database, in the order of the per-field validators.
+    Returns (fields, error). After a failed check fields only holds the values validated before it.
+    """
+    fields = {}
+    try:
+        fields["username"] = validateNewUsername(data)
+        fields["password"] = validateCreatePassword(data)
+        fields["first_name"] = validateFirstName(data)
+        fields["last_name"] = validateLastName(data)
+        fields["email"] = validateNewEmail(data)
+        fields["date_of_birth"] = validateDateOfBirth(data)
+        fields["phone_number"] = validatePhoneNumberFormat(data)
+        fields["weight"] = validateWeight(data)
+        fields["height"] = validateHeight(data)
+    except BadRequest as e:
+        return fields, e
+    return fields, None
+
+def validateRegisterData(data: dict) -> dict:
+    """
+    Runs every format check for a new user without touching the database.
+    Uniqueness is checked separately by validateUniqueUserFields.
+    """
+    fields, error = checkRegisterData(data)
+    if error is not None:
+        raise error
+    return fields
+
+def validateNewUser(data: dict) -> dict:
+    """
+    Validates a new user, uniqueness included, in a single query.
+    As with the per-field validators, a taken username, email or phone number
+    is reported ahead of a format error in any field checked after it.
+    """
+    fields, error = checkRegisterData(data)
+    validateUniqueUserFields(fields.get("username"), fields.get("email"), fields.get("phone_number"))
+    if error is not None:
+        raise error
+    return fields
+
+async def avalidateNewUser(data: dict) -> dict:
+    """
+    Async version of validateNewUser.
+    """
+    fields, error = checkRegisterData(data)
+    await avalidateUniqueUserFields(fields.get("username"), fields.get("email"), fields.get("phone_number"))
+    if error is not None:
+        raise error
+    return fields
+
+def validateGetLookup(data: dict) -> tuple:
+    """
+    Returns (field, value, not found message) for a single user lookup without touching the database.
+    'id' takes precedence over 'username', which takes precedence over 'email'.
+    """
     if "id" in data:
-        validateGetUserID(data)
+        return "id", validateUserID(data["id"]), validators.ID_DOES_NOT_EXIST
     elif "username" in data:
-        validateGetUsername(data)
+        return "username", validateUsername(data["username"]), validators.USERNAME_DOES_NOT_EXIST
     elif "email" in data:
-        validateGetEmail(data)
+        return "email", validateEmail(data["email"]), validators.EMAIL_DOES_NOT_EXIST
     else:
         raise BadRequest("At least one of 'id', 'username', or 'email' must be provided.")
-    
-def validateDeleteStudentData(data: dict) -> None:
-    if "id" in data:
-        validateGetUserID(data)
-    else:
+
+def validateDeleteLookup(data: dict) -> int:
+    """
+    Returns the ID of the user to delete without touching the database.
+    """
+    if "id" not in data:
         raise BadRequest(validators.MISSING_USER_ID)
+    return validateUserID(data["id"])
 
 #OTHER FIELD VALIDATIONS    
 def validateFirstName(data: dict) -> str:
@@ -241,7 +288,7 @@ def validateDateOfBirth(data: dict):
     
     return dob
 
-def validatePhoneNumber(data: dict) -> str:
+def validatePhoneNumberFormat(data: dict) -> str:
     phone = data.get("phone_number")
     
     if phone is None:
@@ -260,14 +307,53 @@ def validatePhoneNumber(data: dict) -> str:
     except ValidationError:
         raise BadRequest(validators.INVALID_PHONE_NUMBER)
     
-    validateUniquePhoneNumber(phone)
-    
     return phone
 
 def validateUniquePhoneNumber(phone_number):
     if User.objects.filter(phone_number=phone_number).exists():
         raise BadRequest(validators.TAKEN_PHONE_NUMBER)
 
+#BATCHED UNIQUENESS VALIDATION
+def uniqueFieldsQuery(username, email, phone_number):
+    """
+    Returns the users holding any of the given values, or None when no value is given.
+    """
+    lookups = [Q(**{field: value}) for field, value in (("username", username), ("email", email), ("phone_number", phone_number)) if value is not None]
+    if not lookups:
+        return None
+    return User.objects.filter(reduce(or_, lookups)).values_list("username", "email", "phone_number")
+
+def raiseTakenField(clashes, username, email, phone_number) -> None:
+    taken_usernames, taken_emails, taken_phones = set(), set(), set()
+    for taken_username, taken_email, taken_phone in clashes:
+        taken_usernames.add(taken_username)
+        taken_emails.add(taken_email)
+        taken_phones.add(taken_phone)
+
+    if username is not None and username in taken_usernames:
+        raise BadRequest(validators.TAKEN_USERNAME)
+    if email is not None and email in taken_emails:
+        raise BadRequest(validators.TAKEN_EMAIL)
+    if phone_number is not None and phone_number in taken_phones:
+        raise BadRequest(validators.TAKEN_PHONE_NUMBER)
+
+def validateUniqueUserFields(username=None, email=None, phone_number=None) -> None:
+    """
+    Checks username, email and phone number uniqueness in a single query, skipping values that are None.
+    Errors are raised in the same order as the per-field validators.
+    """
+    clashes = uniqueFieldsQuery(username, email, phone_number)
+    if clashes is not None:
+        raiseTakenField(clashes, username, email, phone_number)
+
+async def avalidateUniqueUserFields(username=None, email=None, phone_number=None) -> None:
+    """
+    Async version of validateUniqueUserFields.
+    """
+    clashes = uniqueFieldsQuery(username, email, phone_number)
+    if clashes is not None:
+        raiseTakenField([row async for row in clashes], username, email, phone_number)
+
 # validators: weight/height
 
 from decimal import Decimal, InvalidOperation
@@ -2,7 +2,8 @@ from django.shortcuts import render
 from django.http import JsonResponse, HttpResponse
 from django.middleware.csrf import get_token
 from django.views.decorators.csrf import ensure_csrf_cookie
-from UserApp.viewHandling.userViews import userRegister, userLogin, userLogout, userDelete, userGet
+from UserApp.viewHandling.userViews import userRegister, userLogin, userLogout, userDelete, userGet, userBulkImport, userToken, userLookup
+from UserApp.viewHandling.asyncUserViews import userRegisterAsync, userLoginAsync, userLogoutAsync, userDeleteAsync, userGetAsync
 
 @ensure_csrf_cookie
 def get_CSRF_token(request):
@@ -49,3 +50,79 @@ def logout(request):
         content_type="text/plain",
         status=401)
 
+def user_import(request):
+    """
+    A view to handle bulk user imports.
+    """
+    if request.method == 'POST':
+        return userBulkImport(request)
+
+    return HttpResponse(
+        content="Method not allowed",
+        content_type="text/plain",
+        status=400)
+
+async def user_async(request):
+    """
+    Async version of the user view, used when USE_ASYNC_VIEWS is on.
+    """
+    if request.method == 'POST':
+        return await userRegisterAsync(request)
+    elif request.method == 'GET':
+        return await userGetAsync(request)
+    elif request.method == "DELETE":
+        return await userDeleteAsync(request)
+    else:
+        return HttpResponse(
+            content="Method not allowed",
+            content_type="text/plain",
+            status=400
+        )
+
+async def login_async(request):
+    """
+    Async version of the login view.
+    """
+    if request.method == 'POST':
+        return await userLoginAsync(request)
+
+    return HttpResponse(
+        content="Method not allowed",
+        content_type="text/plain",
+        status=401)
+
+async def logout_async(request):
+    """
+    Async version of the logout view.
+    """
+    if request.method == 'POST':
+        return await userLogoutAsync(request)
+
+    return HttpResponse(
+        content="Method not allowed",
+        content_type="text/plain",
+        status=401)
+
+def user_lookup(request):
+    """
+    A view to handle batch user lookups.
+    """
+    if request.method == 'GET':
+        return userLookup(request)
+
+    return HttpResponse(
+        content="Method not allowed",
+        content_type="text/plain",
+        status=400)
+
+def token(request):
+    """
+    A view to handle service token refresh.
+    """
+    if request.method == 'POST':
+        return userToken(request)
+
+    return HttpResponse(
+        content="Method not allowed",
+        content_type="text/plain",
+        status=400)
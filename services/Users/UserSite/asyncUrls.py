@@ -0,0 +1,8 @@
+"""
+URL configuration with the native async user, login and logout views.
+UserSite.urls serves it when USE_ASYNC_VIEWS is on; tests and benchmarks select it with ROOT_URLCONF.
+"""
+from UserApp.views import user_async, login_async, logout_async
+from UserSite.urls import sitePatterns
+
+urlpatterns = sitePatterns(user_async, login_async, logout_async)
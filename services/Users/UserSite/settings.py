@@ -12,10 +12,20 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 from pathlib import Path
 import os
+import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Code shared by the services (the gymcommon package) lives in services/common.
+# docker-compose mounts it at /common and points GYM_COMMON_DIR there.
+COMMON_DIR = Path(os.environ.get("GYM_COMMON_DIR", BASE_DIR.parent / "common"))
+if str(COMMON_DIR) not in sys.path:
+    sys.path.append(str(COMMON_DIR))
+
+from gymcommon.databaseSettings import postgresDatabase, sqliteDatabase  # noqa: E402  Importable once COMMON_DIR is on sys.path
+from gymcommon.serviceSettings import metricsSettings, serviceTokenSettings  # noqa: E402
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
@@ -48,6 +58,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'gymcommon.metricsMiddleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -77,17 +88,118 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'UserSite.wsgi.application'
 
+# Serve /user/, /login/ and /logout/ with native async views, meant for ASGI deployments
+USE_ASYNC_VIEWS = os.environ.get("USE_ASYNC_VIEWS", "0") == "1"
+
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# DATABASE_ENGINE selects the backend: "sqlite" (default) or "postgresql".
+DATABASE_ENGINE = os.environ.get("DATABASE_ENGINE", "sqlite")
+
+# SQLite tuned on every new connection, unless SQLITE_TUNING=0, see services/common/gymcommon/databaseSettings.py
+SQLITE_DATABASE = sqliteDatabase(BASE_DIR / 'db_data/db.sqlite3')
+
+# PostgreSQL, see services/common/gymcommon/databaseSettings.py for the POSTGRES_* variables
+POSTGRES_DATABASE = postgresDatabase("users")
+
 DATABASES = {
+    'default': POSTGRES_DATABASE if DATABASE_ENGINE == "postgresql" else SQLITE_DATABASE,
+}
+
+
+# Caches
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+# Backends the session cache can use, picked with SESSION_CACHE_BACKEND.
+# locmem is per process, file is shared by the workers of one container and redis by every container.
+# MAX_ENTRIES is raised from Django's default of 300 so active sessions are not culled.
+SESSION_CACHE_MAX_ENTRIES = int(os.environ.get("SESSION_CACHE_MAX_ENTRIES", "100000"))
+
+SESSION_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'sessions',
+        'OPTIONS': {'MAX_ENTRIES': SESSION_CACHE_MAX_ENTRIES},
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get("SESSION_CACHE_LOCATION", str(BASE_DIR / 'db_data/session_cache')),
+        'OPTIONS': {'MAX_ENTRIES': SESSION_CACHE_MAX_ENTRIES},
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get("REDIS_URL", 'redis://localhost:6379/0'),
+    },
+}
+
+# Backends the GET /user/ response cache can use, picked with USER_PROFILE_CACHE_BACKEND.
+# Entries are dropped when their user is saved or deleted, which only reaches other workers through a
+# shared backend, so the default is file. locmem is per process, only use it with a single worker.
+PROFILE_CACHE_TIMEOUT = int(os.environ.get("USER_PROFILE_CACHE_TIMEOUT", "300"))
+PROFILE_CACHE_MAX_ENTRIES = int(os.environ.get("USER_PROFILE_CACHE_MAX_ENTRIES", "10000"))
+
+PROFILE_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'user-profiles',
+        'TIMEOUT': PROFILE_CACHE_TIMEOUT,
+        'OPTIONS': {'MAX_ENTRIES': PROFILE_CACHE_MAX_ENTRIES},
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get("USER_PROFILE_CACHE_LOCATION", str(BASE_DIR / 'db_data/profile_cache')),
+        'TIMEOUT': PROFILE_CACHE_TIMEOUT,
+        'OPTIONS': {'MAX_ENTRIES': PROFILE_CACHE_MAX_ENTRIES},
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get("REDIS_URL", 'redis://localhost:6379/0'),
+        'KEY_PREFIX': 'user-profiles',
+        'TIMEOUT': PROFILE_CACHE_TIMEOUT,
+    },
+}
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db_data/db.sqlite3',
-    }
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'user_profiles': PROFILE_CACHE_BACKENDS[os.environ.get("USER_PROFILE_CACHE_BACKEND", "file")],
+    'sessions': SESSION_CACHE_BACKENDS[os.environ.get("SESSION_CACHE_BACKEND", "locmem")],
 }
 
+USER_PROFILE_CACHE = 'user_profiles'
+
+
+# Sessions
+# https://docs.djangoproject.com/en/5.1/topics/http/sessions/
+
+# SESSION_STORE picks where sessions live:
+#   db        - django_session table only (default)
+#   cached_db - written to the table and the session cache, read from the cache first
+#   cache     - session cache only, no database I/O. Use a shared backend (file or redis) with several workers.
+SESSION_ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+}
+
+SESSION_ENGINE = SESSION_ENGINES[os.environ.get("SESSION_STORE", "db")]
+SESSION_CACHE_ALIAS = 'sessions'
+
+
+# Service tokens
+# SERVICE_TOKEN_* and the key file every service must read, see services/common/gymcommon/serviceSettings.py.
+globals().update(serviceTokenSettings(COMMON_DIR))
+# `manage.py test` writes the key file to a temporary directory instead, see services/common/gymcommon/testRunner.py.
+TEST_RUNNER = "gymcommon.testRunner.TestRunner"
+
+
+# Request metrics
+# METRICS_* for the per-view request metrics and Server-Timing header, see services/common/gymcommon/serviceSettings.py.
+globals().update(metricsSettings(DEBUG))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -107,6 +219,12 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Worker processes used to hash passwords for bulk user creation (0 or 1 hashes inline)
+PASSWORD_HASHING_WORKERS = int(os.environ.get("PASSWORD_HASHING_WORKERS", "0"))
+
+# Maximum number of password chunks queued for the hashing workers before callers block
+PASSWORD_HASHING_MAX_PENDING = int(os.environ.get("PASSWORD_HASHING_MAX_PENDING", "64"))
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
@@ -14,15 +14,32 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path
 from UserApp.views import get_CSRF_token  # Importing the view to get CSRF token
+from UserApp.views import user_import, user_lookup  # Importing the bulk import and lookup views
+from UserApp.views import token  # Importing the service token view
 from UserApp.views import user, login, logout  # Importing user-related views
 
-urlpatterns = [
-    path('admin/', admin.site.urls),
-    path('get_csrf_token/', get_CSRF_token, name='get_csrf_token'), # URL to get CSRF token
-    path('user/', user, name='user'),  # URL for user actions
-    path('login/', login, name='login'),  # URL for user login
-    path('logout/', logout, name='logout'),  # URL for user logout
-]
+
+def sitePatterns(user, login, logout):
+    """
+    Returns the site's URL patterns with the given user, login and logout views, see UserSite.asyncUrls.
+    """
+    return [
+        path('admin/', admin.site.urls),
+        path('get_csrf_token/', get_CSRF_token, name='get_csrf_token'), # URL to get CSRF token
+        path('user/', user, name='user'),  # URL for user actions
+        path('user/import/', user_import, name='user_import'),  # URL for bulk user imports
+        path('user/lookup/', user_lookup, name='user_lookup'),  # URL for batch user lookups by the other services
+        path('login/', login, name='login'),  # URL for user login
+        path('logout/', logout, name='logout'),  # URL for user logout
+        path('token/', token, name='token'),  # URL for refreshing the service token
+    ]
+
+# Native async views avoid the sync_to_async hop per request under an ASGI server
+if settings.USE_ASYNC_VIEWS:
+    from UserSite.asyncUrls import urlpatterns
+else:
+    urlpatterns = sitePatterns(user, login, logout)
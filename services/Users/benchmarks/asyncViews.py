@@ -0,0 +1,86 @@
+"""
+Compares requests/sec and p99 latency of GET /user/?id= across serving paths:
+WSGI with the sync views, ASGI with the sync views and ASGI with the native async views.
+Requests go through the full middleware stack in-process, so the numbers isolate Django overhead.
+
+Usage: python -m benchmarks.asyncViews [--requests N] [--concurrency C]
+"""
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+
+from benchmarks import setupDjango, benchmarkDatabase
+
+
+def summarize(label: str, latencies: list, elapsed: float) -> None:
+    latencies = sorted(latencies)
+    p99 = latencies[max(0, int(len(latencies) * 0.99) - 1)]
+    print(f"{label:<24} {len(latencies) / elapsed:>10.1f} {statistics.median(latencies) * 1000:>10.2f} {p99 * 1000:>10.2f}")
+
+def runWsgi(path: str, requests: int, concurrency: int) -> None:
+    from django.test import Client
+
+    latencies = []
+    lock = threading.Lock()
+    def worker(count):
+        client = Client()
+        local = []
+        for _ in range(count):
+            started = time.perf_counter()
+            client.get(path)
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(requests // concurrency,)) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    summarize("WSGI, sync views", latencies, time.perf_counter() - started)
+
+def runAsgi(label: str, path: str, requests: int, concurrency: int) -> None:
+    from django.test import AsyncClient
+
+    async def worker(count, latencies):
+        client = AsyncClient()
+        for _ in range(count):
+            started = time.perf_counter()
+            await client.get(path)
+            latencies.append(time.perf_counter() - started)
+
+    async def main():
+        latencies = []
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(requests // concurrency, latencies) for _ in range(concurrency)))
+        summarize(label, latencies, time.perf_counter() - started)
+
+    asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    setupDjango()
+    from django.test import override_settings
+    from UserApp.models import User
+
+    with benchmarkDatabase():
+        user = User.objects.create_user(username="benchuser", email="bench@email.com", password="BenchPass123*")
+        path = f"/user/?id={user.id}"
+
+        print(f"{'path':<24} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10}")
+        runWsgi(path, args.requests, args.concurrency)
+        runAsgi("ASGI, sync views", path, args.requests, args.concurrency)
+        with override_settings(ROOT_URLCONF="UserSite.asyncUrls"):
+            runAsgi("ASGI, async views", path, args.requests, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
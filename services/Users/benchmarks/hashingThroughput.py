@@ -0,0 +1,42 @@
+"""
+Reports password hashes per second for the hashing pool at different worker counts.
+
+Usage: python -m benchmarks.hashingThroughput [--passwords N] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import time
+
+from benchmarks import setupDjango
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--passwords", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    setupDjango()
+    from django.conf import settings
+    from UserApp.passwordHashing import InlineHashingPool, PasswordHashingPool
+
+    passwords = [f"BenchPass{i}*" for i in range(args.passwords)]
+    print(f"hasher: {settings.PASSWORD_HASHERS[0]}")
+    print(f"{'workers':>8} {'hashes/sec':>12} {'speedup':>8}")
+
+    baseline = None
+    for workers in args.workers:
+        pool = InlineHashingPool() if workers <= 1 else PasswordHashingPool(workers)
+        pool.hashMany(passwords[:workers])  # Warm up the worker processes
+
+        started = time.perf_counter()
+        pool.hashMany(passwords)
+        rate = args.passwords / (time.perf_counter() - started)
+        pool.shutdown()
+
+        baseline = baseline or rate
+        print(f"{workers:>8} {rate:>12.1f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Compares JSON encoders on the login and GET /user/ payloads.
+
+Usage: python -m benchmarks.jsonEncoders [--iterations N]
+"""
+import argparse
+import timeit
+from datetime import date
+from decimal import Decimal
+
+from benchmarks import setupDjango
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100000)
+    args = parser.parse_args()
+
+    setupDjango()
+    from django.http import JsonResponse
+    from UserApp.models import User
+    from UserApp.viewHandling import jsonResponses
+    from UserApp.viewHandling.jsonResponses import encodeJsonStdlib, jsonResponse, rawJsonResponse
+    from UserApp.viewHandling.userViews import createUserResponseData
+
+    user = User(
+        id=1, username="testuser", first_name="Test", last_name="User", email="testuser@email.com",
+        date_of_birth=date(2000, 1, 1), phone_number="+447700900123", weight=Decimal("70.50"), height=180,
+    )
+    payloads = {
+        "login": dict(createUserResponseData(user), message="User logged in successfully"),
+        "get": dict(createUserResponseData(user), message="User data retrieved successfully"),
+    }
+
+    for name, payload in payloads.items():
+        cached = encodeJsonStdlib(payload)
+        cases = {
+            "JsonResponse (DjangoJSONEncoder)": lambda: JsonResponse(payload),
+            "jsonResponse (stdlib)": lambda: rawJsonResponse(encodeJsonStdlib(payload)),
+            "rawJsonResponse (cached bytes)": lambda: rawJsonResponse(cached),
+        }
+        if jsonResponses.orjson is not None:
+            cases["jsonResponse (orjson)"] = lambda: jsonResponse(payload)
+
+        print(f"{name} payload, {len(cached)} bytes")
+        for label, case in cases.items():
+            seconds = timeit.timeit(case, number=args.iterations)
+            print(f"  {label:<34} {seconds / args.iterations * 1e6:8.2f} us/response")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Measures what the request metrics middleware adds to each request and to each query.
+
+A whole request through the test client varies by more than the middleware costs, so the middleware
+is timed around a view that does nothing, and the query recorder around `SELECT 1`.
+
+Usage: python -m benchmarks.requestMetrics [--iterations N]
+"""
+import argparse
+import time
+
+from benchmarks import setupDjango, benchmarkDatabase
+
+
+def bestOf(function, iterations: int, repeats: int = 5) -> float:
+    """
+    Returns the fastest of repeats runs, in seconds per call.
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            function()
+        timings.append((time.perf_counter() - start) / iterations)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    setupDjango()
+    from django.http import JsonResponse
+    from django.test import RequestFactory
+    from django.urls import resolve
+    from gymcommon.metricsMiddleware import RequestMetricsMiddleware, currentStats, installQueryRecorder
+    from gymcommon.requestMetrics import RequestStats
+
+    with benchmarkDatabase() as connection:
+        request = RequestFactory().get("/user/", {"id": 1})
+        request.resolver_match = resolve("/user/")
+        payload = {"id": 1, "username": "benchuser", "message": "User data retrieved successfully"}
+
+        def view(request):
+            return JsonResponse(payload)
+
+        middleware = RequestMetricsMiddleware(view)
+        bare = bestOf(lambda: view(request), args.iterations)
+        measured = bestOf(lambda: middleware(request), args.iterations)
+        print(f"request overhead: {(measured - bare) * 1e6:6.1f} us ({bare * 1e6:.1f} us view alone)")
+
+        cursor = connection.cursor()
+        installQueryRecorder(connection)
+        timings = {"plain": [], "recorded": []}
+        for _ in range(5):  # Alternate, so warming up favours neither
+            timings["plain"].append(bestOf(lambda: cursor.execute("SELECT 1"), args.iterations, repeats=1))
+            token = currentStats.set(RequestStats())
+            try:
+                timings["recorded"].append(bestOf(lambda: cursor.execute("SELECT 1"), args.iterations, repeats=1))
+            finally:
+                currentStats.reset(token)
+        plain, recorded = min(timings["plain"]), min(timings["recorded"])
+        print(f"query overhead:   {(recorded - plain) * 1e6:6.1f} us ({plain * 1e6:.1f} us SELECT 1 alone)")
+
+
+if __name__ == "__main__":
+    main()
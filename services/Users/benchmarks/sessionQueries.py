@@ -0,0 +1,54 @@
+"""
+Reports database queries per authenticated request for each session store.
+
+Usage: python -m benchmarks.sessionQueries [--requests N]
+"""
+import argparse
+import json
+
+from benchmarks import setupDjango, benchmarkDatabase
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    setupDjango()
+    from django.conf import settings
+    from django.core.cache import caches
+    from django.test import Client, override_settings
+    from django.test.utils import CaptureQueriesContext
+    from UserApp.models import User
+    from UserApp.profileCache import getProfileCache
+
+    with benchmarkDatabase() as connection:
+        user = User.objects.create_user(username="benchuser", email="bench@email.com", password="BenchPass123*")
+        credentials = json.dumps({"username": "benchuser", "password": "BenchPass123*"})
+
+        print(f"{'session store':<14} {'GET /user/':>12} {'GET /user/?id=':>16} {'login':>8}")
+        for store, engine in settings.SESSION_ENGINES.items():
+            with override_settings(SESSION_ENGINE=engine):
+                caches["sessions"].clear()
+                getProfileCache().clear()
+                client = Client()
+
+                with CaptureQueriesContext(connection) as login_ctx:
+                    client.post("/login/", data=credentials, content_type="application/json")
+
+                with CaptureQueriesContext(connection) as self_ctx:
+                    for _ in range(args.requests):
+                        client.get("/user/")
+
+                with CaptureQueriesContext(connection) as lookup_ctx:
+                    for _ in range(args.requests):
+                        client.get("/user/", {"id": user.id})
+
+            print(
+                f"{store:<14} {len(self_ctx.captured_queries) / args.requests:>12.2f}"
+                f" {len(lookup_ctx.captured_queries) / args.requests:>16.2f} {len(login_ctx.captured_queries):>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Reports the number of SQL statements and the wall time per signup through POST /user/.
+
+Usage: python -m benchmarks.signupQueries [--signups N]
+"""
+import argparse
+import json
+import time
+
+from benchmarks import setupDjango, benchmarkDatabase
+
+
+def signupPayload(i: int) -> dict:
+    return {
+        "username": f"bench_user_{i}",
+        "password": "ValidPass123*",
+        "first_name": "Bench",
+        "last_name": "Mark",
+        "email": f"bench_user_{i}@email.com",
+        "date_of_birth": "2000-01-01",
+        "phone_number": f"+4477{i:09d}",
+        "weight": 70.5,
+        "height": 180,
+    }
+
+
+TRANSACTION_CONTROL = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE SAVEPOINT")
+
+
+def isDataStatement(sql: str) -> bool:
+    return not sql.startswith(TRANSACTION_CONTROL)
+
+
+def countLegacyUniquenessQueries(connection, payload: dict) -> int:
+    """
+    Counts the queries the per-field uniqueness validators would issue for one signup.
+    """
+    from django.test.utils import CaptureQueriesContext
+    from UserApp.viewHandling.viewHandlingValidators import validateUniqueUsername, validateUniqueEmail, validateUniquePhoneNumber
+
+    with CaptureQueriesContext(connection) as ctx:
+        validateUniqueUsername(payload["username"])
+        validateUniqueEmail(payload["email"])
+        validateUniquePhoneNumber(payload["phone_number"])
+    return len(ctx.captured_queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--signups", type=int, default=200)
+    args = parser.parse_args()
+
+    setupDjango()
+    from django.test import Client, override_settings
+    from django.test.utils import CaptureQueriesContext
+
+    with benchmarkDatabase() as connection, override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]):
+        client = Client()
+        started = time.perf_counter()
+        with CaptureQueriesContext(connection) as ctx:
+            for i in range(args.signups):
+                response = client.post("/user/", data=json.dumps(signupPayload(i)), content_type="application/json")
+                assert response.status_code == 201, response.content
+        elapsed = time.perf_counter() - started
+        statements = len(ctx.captured_queries)
+        data_statements = sum(1 for q in ctx.captured_queries if isDataStatement(q["sql"]))
+
+        legacy = countLegacyUniquenessQueries(connection, signupPayload(args.signups))
+
+    print(f"signups:                       {args.signups}")
+    print(f"queries per signup:            {data_statements / args.signups:.2f}")
+    print(f"statements incl. BEGIN/COMMIT: {statements / args.signups:.2f}")
+    print(f"legacy uniqueness queries:     {legacy} (+1 INSERT)")
+    print(f"mean signup time:              {elapsed / args.signups * 1000:.2f} ms (MD5 hasher)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Counts "database is locked" errors for concurrent session-style read/write transactions
+on a file database, with SQLite's defaults and with the PRAGMAs / transaction mode from gymcommon.databaseSettings.
+
+Usage: python -m benchmarks.sqliteLocking [--threads N] [--transactions N]
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from benchmarks import setupDjango
+
+
+def runWorkload(path: str, init_commands: list, begin: str, threads: int, transactions: int) -> tuple:
+    errors = []
+    lock = threading.Lock()
+
+    def worker(worker_id):
+        # isolation_level=None gives explicit transaction control, like Django's sqlite backend
+        conn = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        for command in init_commands:
+            conn.execute(command)
+
+        local_errors = 0
+        for i in range(transactions):
+            key = f"session-{worker_id}-{i % 20}"
+            try:
+                conn.execute(begin)
+                conn.execute("SELECT data FROM sessions WHERE key = ?", (key,)).fetchone()
+                conn.execute("SELECT COUNT(*) FROM sessions").fetchone()
+                conn.execute("INSERT OR REPLACE INTO sessions (key, data) VALUES (?, ?)", (key, "x" * 512))
+                conn.execute("COMMIT")
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e):
+                    raise
+                local_errors += 1
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+        conn.close()
+        with lock:
+            errors.append(local_errors)
+
+    setup = sqlite3.connect(path, isolation_level=None)
+    setup.execute("CREATE TABLE IF NOT EXISTS sessions (key TEXT PRIMARY KEY, data TEXT)")
+    setup.close()
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sum(errors), time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--transactions", type=int, default=200)
+    args = parser.parse_args()
+
+    setupDjango()
+    from gymcommon.databaseSettings import sqlitePragmas
+
+    tuned_commands = [f"PRAGMA {name}={value}" for name, value in sqlitePragmas().items()]
+    tuned_begin = f"BEGIN {os.environ.get('SQLITE_TRANSACTION_MODE', 'IMMEDIATE')}"
+    total = args.threads * args.transactions
+
+    print(f"{args.threads} threads x {args.transactions} transactions")
+    print(f"{'profile':<10} {'lock errors':>12} {'tx/s':>10}")
+    for label, commands, begin in [("default", [], "BEGIN"), ("tuned", tuned_commands, tuned_begin)]:
+        with tempfile.TemporaryDirectory() as tmp:
+            errors, elapsed = runWorkload(os.path.join(tmp, "bench.sqlite3"), commands, begin, args.threads, args.transactions)
+        print(f"{label:<10} {errors:>12} {(total - errors) / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
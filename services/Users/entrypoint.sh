@@ -0,0 +1,18 @@
+#!/bin/sh
+# Starts the service in the mode selected by SERVER_MODE:
+#   dev  - Django's development server (default)
+#   wsgi - gunicorn running UserSite.wsgi
+#   asgi - gunicorn with uvicorn workers running UserSite.asgi
+set -e
+
+case "${SERVER_MODE:-dev}" in
+    wsgi)
+        exec gunicorn UserSite.wsgi:application -c gunicorn.conf.py
+        ;;
+    asgi)
+        exec gunicorn UserSite.asgi:application -c gunicorn.conf.py
+        ;;
+    *)
+        exec python3 manage.py runserver 0.0.0.0:${PORT:-8000}
+        ;;
+esac
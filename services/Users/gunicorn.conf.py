@@ -0,0 +1,35 @@
+"""
+Gunicorn configuration for the production server modes, see entrypoint.sh.
+Every value can be overridden from the environment.
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Worker processes and threads per worker
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", "1"))
+
+# SERVER_MODE=asgi runs asgi.py under uvicorn workers, otherwise wsgi.py under sync or threaded workers
+if os.environ.get("SERVER_MODE") == "asgi":
+    worker_class = "uvicorn_worker.UvicornWorker"
+elif threads > 1:
+    worker_class = "gthread"
+else:
+    worker_class = "sync"
+
+# Import Django once in the master so workers share its memory copy-on-write.
+# Code changes then need a full restart (or USR2 + WINCH), HUP only restarts workers from the preloaded code.
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1") == "1"
+
+# Recycle workers periodically to cap memory growth, staggered so they do not restart together
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
@@ -0,0 +1,166 @@
+from array import array
+from datetime import date
+
+import numpy as np
+from django.db.models import FloatField
+from django.db.models.functions import Cast
+
+from WeightApp.models import Weights
+from WeightApp.rollups import KG_VALUE
+
+DEFAULT_EMA_ALPHA = 0.3
+DEFAULT_OUTLIER_THRESHOLD = 3.5
+MIN_SPREAD_KG = 0.25  # Floor for the residual spread so near-constant series do not flag every wobble
+MAD_TO_SIGMA = 1.4826
+
+
+class WeightSeries:
+    """
+    Weight readings of one or more users held as flat NumPy arrays, sorted by user then date.
+    Every statistic is computed for all users at once; per-user segments are described by
+    starts and counts rather than by looping over users in Python.
+    """
+
+    def __init__(self, user_ids, days, kg):
+        self.reading_user_ids = np.asarray(user_ids, dtype=np.int64)
+        self.days = np.asarray(days, dtype=np.int64)  # Proleptic ordinals, see date.toordinal
+        self.kg = np.asarray(kg, dtype=np.float64)
+
+        boundaries = np.flatnonzero(np.diff(self.reading_user_ids)) + 1
+        self.starts = np.concatenate(([0], boundaries)) if len(self.kg) else np.zeros(0, dtype=np.int64)
+        self.counts = np.diff(np.append(self.starts, len(self.kg)))
+        self.user_ids = self.reading_user_ids[self.starts]
+        self.segment = np.repeat(np.arange(len(self.starts)), self.counts)  # Index into user_ids for every reading
+        self.position = np.arange(len(self.kg)) - self.starts[self.segment]  # Index of a reading within its user
+
+    @classmethod
+    def load(cls, readings=None, chunk_size: int = 10000):
+        """
+        Loads readings, a Weights queryset defaulting to every reading, in a single ordered query.
+        Rows are streamed into typed arrays so no model instances or Decimals are built.
+        """
+        readings = Weights.objects.all() if readings is None else readings
+        rows = (
+            readings.order_by("user_id", "date_recorded", "id")
+            .annotate(kg=Cast(KG_VALUE, FloatField()))
+            .values_list("user_id", "date_recorded", "kg")
+        )
+
+        user_ids, days, kg = array("q"), array("q"), array("d")
+        for user_id, date_recorded, value in rows.iterator(chunk_size=chunk_size):
+            user_ids.append(user_id)
+            days.append(date_recorded.toordinal())
+            kg.append(value)
+
+        return cls(
+            np.frombuffer(user_ids, dtype=np.int64),
+            np.frombuffer(days, dtype=np.int64),
+            np.frombuffer(kg, dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.kg)
+
+    #PER-READING SERIES
+    def ema(self, alpha: float = DEFAULT_EMA_ALPHA) -> np.ndarray:
+        """
+        Exponential moving average of every user's readings, restarting at each user's first reading.
+        Steps through reading positions rather than readings, so the Python loop runs once per
+        position of the longest series and each step updates every user that has that position.
+        """
+        result = self.kg.copy()
+        if not len(result):
+            return result
+
+        order = np.argsort(self.position, kind="stable")
+        bounds = np.searchsorted(self.position[order], np.arange(1, self.position.max() + 2))
+        for step in range(len(bounds) - 1):
+            index = order[bounds[step]:bounds[step + 1]]
+            result[index] = alpha * self.kg[index] + (1 - alpha) * result[index - 1]
+        return result
+
+    def rateOfChange(self) -> np.ndarray:
+        """
+        kg per day between each reading and the user's previous one.
+        NaN for a user's first reading and for readings on the same day as the previous one.
+        """
+        rate = np.full(len(self.kg), np.nan)
+        if len(self.kg) < 2:
+            return rate
+
+        elapsed = np.diff(self.days).astype(np.float64)
+        valid = (self.position[1:] > 0) & (elapsed > 0)
+        rate[1:][valid] = np.diff(self.kg)[valid] / elapsed[valid]
+        return rate
+
+    #PER-USER STATISTICS
+    def segmentSum(self, values: np.ndarray) -> np.ndarray:
+        return np.bincount(self.segment, weights=values, minlength=len(self.starts))
+
+    def trend(self):
+        """
+        Least-squares line through every user's readings.
+        Returns (slope in kg/day, intercept in kg at the user's first reading) per user;
+        the slope is NaN for users whose readings all fall on one day.
+        """
+        elapsed = (self.days - self.days[self.starts][self.segment]).astype(np.float64)
+        n = self.counts.astype(np.float64)
+        sum_x, sum_y = self.segmentSum(elapsed), self.segmentSum(self.kg)
+        sum_xx, sum_xy = self.segmentSum(elapsed * elapsed), self.segmentSum(elapsed * self.kg)
+
+        denominator = n * sum_xx - sum_x * sum_x
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = np.where(denominator > 0, (n * sum_xy - sum_x * sum_y) / denominator, np.nan)
+        intercept = (sum_y - np.nan_to_num(slope) * sum_x) / n
+        return slope, intercept
+
+    def segmentMedian(self, values: np.ndarray) -> np.ndarray:
+        # Sort by segment then value with one float key, several times faster than np.lexsort
+        span = values.max() - values.min()
+        key = self.segment + (values - values.min()) / (span * 1.000001 if span else 1)
+        ranked = values[np.argsort(key)]
+        return (ranked[self.starts + (self.counts - 1) // 2] + ranked[self.starts + self.counts // 2]) / 2
+
+    def outliers(self, threshold: float = DEFAULT_OUTLIER_THRESHOLD) -> np.ndarray:
+        """
+        Flags readings far from the user's own trend line, such as a misread scale.
+        Uses a robust z-score of the residuals (median absolute deviation), so one bad
+        reading cannot hide itself by inflating the spread.
+        """
+        if not len(self.kg):
+            return np.zeros(0, dtype=bool)
+
+        slope, intercept = self.trend()
+        elapsed = (self.days - self.days[self.starts][self.segment]).astype(np.float64)
+        residual = self.kg - (intercept[self.segment] + np.nan_to_num(slope)[self.segment] * elapsed)
+
+        deviation = np.abs(residual - self.segmentMedian(residual)[self.segment])
+        spread = np.maximum(MAD_TO_SIGMA * self.segmentMedian(deviation), MIN_SPREAD_KG)
+        return (deviation / spread[self.segment] > threshold) & (self.counts[self.segment] >= 3)
+
+    def summary(self, alpha: float = DEFAULT_EMA_ALPHA, threshold: float = DEFAULT_OUTLIER_THRESHOLD) -> dict:
+        """
+        Per-user figures for the coach reports, keyed by user id.
+        """
+        if not len(self.kg):
+            return {}
+
+        last = self.starts + self.counts - 1
+        ema = self.ema(alpha)[last]
+        slope, _ = self.trend()
+        outliers = np.bincount(self.segment, weights=self.outliers(threshold), minlength=len(self.starts))
+
+        return {
+            int(user_id): {
+                "readings": int(count),
+                "first_date": date.fromordinal(int(first_day)).isoformat(),
+                "last_date": date.fromordinal(int(last_day)).isoformat(),
+                "latest_kg": round(float(latest), 2),
+                "ema_kg": round(float(smoothed), 2),
+                "slope_kg_per_week": None if np.isnan(per_day) else round(float(per_day) * 7, 3),
+                "outliers": int(flagged),
+            }
+            for user_id, count, first_day, last_day, latest, smoothed, per_day, flagged in zip(
+                self.user_ids, self.counts, self.days[self.starts], self.days[last], self.kg[last], ema, slope, outliers
+            )
+        }
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class WeightappConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'WeightApp'
+
+    def ready(self):
+        from WeightApp import signals  # noqa: F401  Connects the daily reading index receiver
@@ -0,0 +1,75 @@
+import logging
+
+from django.conf import settings
+from django.db import IntegrityError, connections
+
+from WeightApp.models import Weights
+
+DAILY_INDEX_NAME = "weights_one_per_user_day"
+DAILY_INDEX_FIELDS = ("user_id", "date_recorded")
+
+logger = logging.getLogger(__name__)
+
+# Databases the index has been seen in by this process, so ingest only looks for it until it is found
+_indexed = set()
+
+
+def onePerDay() -> bool:
+    return getattr(settings, "WEIGHTS_ONE_READING_PER_DAY", False)
+
+def dailyIndexPresent(using: str = "default") -> bool:
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        return DAILY_INDEX_NAME in connection.introspection.get_constraints(cursor, Weights._meta.db_table)
+
+def replacesDailyReadings(using: str = "default") -> bool:
+    """
+    Returns whether ingest should replace a user's earlier reading for the same day.
+    That needs the unique index as well as the setting: until `migrate` has created it,
+    readings are inserted as usual rather than failing the upsert.
+    """
+    if not onePerDay():
+        return False
+    if using in _indexed:
+        return True
+    if not dailyIndexPresent(using):
+        logger.warning("WEIGHTS_ONE_READING_PER_DAY is set but %s is missing, run migrate to create it.", DAILY_INDEX_NAME)
+        return False
+    _indexed.add(using)
+    return True
+
+def syncDailyReadingIndex(using: str = "default") -> bool:
+    """
+    Creates or drops the unique (user_id, date_recorded) index to match WEIGHTS_ONE_READING_PER_DAY.
+    Kept out of the migrations so each deployment can choose, and re-run safely after every migrate.
+    Returns whether the index exists afterwards.
+    """
+    connection = connections[using]
+    table = Weights._meta.db_table
+    present = dailyIndexPresent(using)
+
+    enabled = onePerDay()
+    if enabled == present:
+        return present
+
+    _indexed.discard(using)
+    quote = connection.ops.quote_name
+    with connection.schema_editor() as editor:
+        if enabled:
+            columns = ", ".join(quote(field) for field in DAILY_INDEX_FIELDS)
+            try:
+                editor.execute(f"CREATE UNIQUE INDEX {quote(DAILY_INDEX_NAME)} ON {quote(table)} ({columns})")
+            except IntegrityError as e:
+                raise IntegrityError(
+                    "Cannot enable WEIGHTS_ONE_READING_PER_DAY, some users already have several readings on one day."
+                ) from e
+        else:
+            editor.execute(f"DROP INDEX {quote(DAILY_INDEX_NAME)}")
+    return enabled
+
+def latestPerDay(readings: list) -> list:
+    """
+    Keeps the last reading for each (user_id, date_recorded) in a batch, in their original order.
+    """
+    latest = {(reading.user_id, reading.date_recorded): reading for reading in readings}
+    return list(latest.values())
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-18 03:48
+
+import django.core.validators
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Weights',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user_id', models.IntegerField(db_index=True)),
+                ('weight_value', models.DecimalField(decimal_places=2, max_digits=5, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(500)])),
+                ('weight_type', models.CharField(choices=[('kg', 'kg'), ('lb', 'lb')], default='kg', max_length=2)),
+                ('date_recorded', models.DateField(db_index=True, default=django.utils.timezone.now)),
+                ('note', models.CharField(blank=True, max_length=255)),
+            ],
+            options={
+                'ordering': ['-date_recorded'],
+                'indexes': [models.Index(fields=['user_id', 'date_recorded'], name='WeightApp_w_user_id_4da442_idx')],
+            },
+        ),
+    ]
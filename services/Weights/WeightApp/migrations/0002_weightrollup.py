@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-18 03:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('WeightApp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WeightRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user_id', models.IntegerField()),
+                ('period', models.CharField(choices=[('day', 'day'), ('week', 'week'), ('month', 'month')], max_length=5)),
+                ('period_start', models.DateField()),
+                ('reading_count', models.PositiveIntegerField()),
+                ('total_kg', models.DecimalField(decimal_places=3, max_digits=12)),
+                ('min_kg', models.DecimalField(decimal_places=3, max_digits=7)),
+                ('max_kg', models.DecimalField(decimal_places=3, max_digits=7)),
+            ],
+            options={
+                'ordering': ['user_id', 'period', 'period_start'],
+                'constraints': [models.UniqueConstraint(fields=('user_id', 'period', 'period_start'), name='unique_weight_rollup_bucket')],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-18 03:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('WeightApp', '0002_weightrollup'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='weights',
+            name='WeightApp_w_user_id_4da442_idx',
+        ),
+        migrations.AlterField(
+            model_name='weights',
+            name='user_id',
+            field=models.IntegerField(),
+        ),
+        migrations.AddIndex(
+            model_name='weights',
+            index=models.Index(fields=['user_id', 'date_recorded', 'id', 'weight_value', 'weight_type', 'note'], name='weights_user_history_idx'),
+        ),
+    ]
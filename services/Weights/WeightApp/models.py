@@ -1,12 +1,32 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
-class Weights(models.model):
-    user_id = models.IntegerField(db_index=True)
+class Weights(models.Model):
+    user_id = models.IntegerField()
     weight_value = models.DecimalField(max_digits=5, decimal_places=2, validators=[MinValueValidator(0), MaxValueValidator(500)])
-    weight_type = models.CharField(choices=[("kg", "kg"), ("lb", "lb")], default="kg")
-    date_recored = models.DateField(default=timezone.now, db_index=True)
+    weight_type = models.CharField(max_length=2, choices=[("kg", "kg"), ("lb", "lb")], default="kg")
+    date_recorded = models.DateField(default=timezone.now, db_index=True)
     note = models.CharField(max_length=255, blank=True)
     class Meta:
         ordering = ["-date_recorded"]
-        indexes = [models.Index(fields=["user_id", "date_recorded"])]
+        indexes = [
+            # Covers the history-by-user query: seek on user_id, walk (date_recorded, id) and read every column from the index.
+            # The returned columns are keyed rather than INCLUDEd, which SQLite ignores.
+            models.Index(fields=["user_id", "date_recorded", "id", "weight_value", "weight_type", "note"], name="weights_user_history_idx"),
+        ]
+
+class WeightRollup(models.Model):
+    """
+    Per-user weight aggregates for one day, week (starting Monday) or month, stored in kg.
+    Maintained by WeightApp.rollups whenever readings are ingested.
+    """
+    user_id = models.IntegerField()
+    period = models.CharField(max_length=5, choices=[("day", "day"), ("week", "week"), ("month", "month")])
+    period_start = models.DateField()
+    reading_count = models.PositiveIntegerField()
+    total_kg = models.DecimalField(max_digits=12, decimal_places=3)
+    min_kg = models.DecimalField(max_digits=7, decimal_places=3)
+    max_kg = models.DecimalField(max_digits=7, decimal_places=3)
+    class Meta:
+        ordering = ["user_id", "period", "period_start"]
+        constraints = [models.UniqueConstraint(fields=["user_id", "period", "period_start"], name="unique_weight_rollup_bucket")]
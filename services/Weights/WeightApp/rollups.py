@@ -0,0 +1,158 @@
+from datetime import timedelta
+from decimal import Decimal
+from functools import reduce
+from operator import or_
+
+from django.db import connection
+from django.db.models import Case, Count, DecimalField, F, Max, Min, Q, Sum, Value, When
+from django.db.models.functions import Trunc
+
+from WeightApp.models import Weights, WeightRollup
+
+PERIODS = ("day", "week", "month")
+# First key of the per-user PostgreSQL advisory locks held while rollups are refreshed, the user id is the second
+ROLLUP_LOCK_CLASS = 1301
+LB_TO_KG = Decimal("0.45359237")
+# Date ranges ORed into one aggregate query, which keeps SQLite well under its expression depth limit
+RANGES_PER_QUERY = 100
+
+# Every reading converted to kg, so rollups mix kg and lb readings correctly
+KG_VALUE = Case(
+    When(weight_type="lb", then=F("weight_value") * Value(LB_TO_KG)),
+    default=F("weight_value"),
+    output_field=DecimalField(max_digits=12, decimal_places=6),
+)
+
+
+#PERIOD HELPERS
+def periodStart(day, period: str):
+    if period == "day":
+        return day
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+def periodEnd(start, period: str):
+    """
+    Returns the last day of the bucket that begins on start.
+    """
+    if period == "day":
+        return start
+    if period == "week":
+        return start + timedelta(days=6)
+    return (start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+
+def toUnit(kg: Decimal, unit: str) -> Decimal:
+    value = kg / LB_TO_KG if unit == "lb" else kg
+    return value.quantize(Decimal("0.01"))
+
+
+#AGGREGATION
+def aggregateBuckets(readings, period: str):
+    """
+    Groups readings by (user_id, period_start) in the database and returns
+    one values() row per bucket with the rollup columns.
+    """
+    return (
+        readings.order_by()
+        .annotate(period_start=Trunc("date_recorded", period))
+        .values("user_id", "period_start")
+        .annotate(
+            reading_count=Count("id"),
+            total_kg=Sum(KG_VALUE, output_field=DecimalField(max_digits=12, decimal_places=3)),
+            min_kg=Min(KG_VALUE, output_field=DecimalField(max_digits=7, decimal_places=3)),
+            max_kg=Max(KG_VALUE, output_field=DecimalField(max_digits=7, decimal_places=3)),
+        )
+    )
+
+def saveRollups(rollups: list) -> None:
+    WeightRollup.objects.bulk_create(
+        rollups,
+        update_conflicts=True,
+        unique_fields=["user_id", "period", "period_start"],
+        update_fields=["reading_count", "total_kg", "min_kg", "max_kg"],
+    )
+
+def lockUsers(user_ids) -> None:
+    """
+    Holds each user's rollup lock until the transaction ends, taken in id order in one query.
+    Two ingests for the same user would otherwise aggregate without each other's uncommitted
+    readings, and whichever upserted last would leave its partial totals behind.
+    SQLite needs no lock: the readings INSERT already holds its single write lock.
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(%s, user_id) FROM (SELECT unnest(%s::integer[]) AS user_id ORDER BY 1) AS users",
+            [ROLLUP_LOCK_CLASS, sorted(user_ids)],
+        )
+
+def bucketRanges(buckets, period: str) -> list:
+    """
+    Returns [user_id, first_day, last_day] for every run of consecutive buckets of one user,
+    so each user's readings are only read for the buckets being refreshed.
+    """
+    ranges = []
+    for user_id, start in sorted(buckets):
+        if ranges and ranges[-1][0] == user_id and ranges[-1][2] + timedelta(days=1) == start:
+            ranges[-1][2] = periodEnd(start, period)
+        else:
+            ranges.append([user_id, start, periodEnd(start, period)])
+    return ranges
+
+def refreshRollups(readings) -> None:
+    """
+    Recomputes only the day, week and month buckets touched by readings,
+    an iterable of (user_id, date_recorded) pairs. Costs one aggregate query per RANGES_PER_QUERY
+    runs of buckets and one upsert per period, after locking the users on PostgreSQL.
+    Must run inside the transaction that wrote the readings.
+    """
+    readings = set(readings)
+    if not readings:
+        return
+
+    lockUsers({user_id for user_id, _ in readings})
+
+    for period in PERIODS:
+        buckets = {(user_id, periodStart(day, period)) for user_id, day in readings}
+        ranges = bucketRanges(buckets, period)
+
+        rollups = []
+        for i in range(0, len(ranges), RANGES_PER_QUERY):
+            bounded = reduce(or_, (Q(user_id=user_id, date_recorded__range=(first, last)) for user_id, first, last in ranges[i:i + RANGES_PER_QUERY]))
+            rollups.extend(WeightRollup(period=period, **row) for row in aggregateBuckets(Weights.objects.filter(bounded), period))
+        saveRollups(rollups)
+
+        # Buckets whose readings have all gone are removed rather than left at zero
+        emptied = buckets - {(rollup.user_id, rollup.period_start) for rollup in rollups}
+        if emptied:
+            stale = Q()
+            for user_id, start in emptied:
+                stale |= Q(user_id=user_id, period_start=start)
+            WeightRollup.objects.filter(stale, period=period).delete()
+
+def rebuildRollups(user_id=None, batch_size: int = 1000) -> int:
+    """
+    Drops and recomputes every rollup, or only those of one user. Used for backfills.
+    Returns the number of rollups written.
+    """
+    readings = Weights.objects.all()
+    rollups = WeightRollup.objects.all()
+    if user_id is not None:
+        readings = readings.filter(user_id=user_id)
+        rollups = rollups.filter(user_id=user_id)
+    rollups.delete()
+
+    written = 0
+    for period in PERIODS:
+        batch = []
+        for row in aggregateBuckets(readings, period).iterator(chunk_size=batch_size):
+            batch.append(WeightRollup(period=period, **row))
+            if len(batch) >= batch_size:
+                WeightRollup.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        WeightRollup.objects.bulk_create(batch)
+        written += len(batch)
+    return written
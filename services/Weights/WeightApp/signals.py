@@ -0,0 +1,10 @@
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+
+from WeightApp.dailyReadings import syncDailyReadingIndex
+
+
+@receiver(post_migrate)
+def syncDailyReadingIndexAfterMigrate(sender, using, **kwargs):
+    if sender.name == "WeightApp":
+        syncDailyReadingIndex(using)
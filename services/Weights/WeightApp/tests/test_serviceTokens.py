@@ -0,0 +1,125 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TestCase, Client, RequestFactory, override_settings
+from django.urls import reverse
+
+from WeightApp.models import Weights
+from WeightApp.viewHandling import viewHandlingConstants as V
+from gymcommon import serviceTokens
+from gymcommon.metricsMiddleware import registry
+from gymcommon.serviceTokens import KeyRing, issueToken
+from gymcommon.tokenMiddleware import KEYS_UNAVAILABLE, MISSING_TOKEN, WRONG_USER, ServiceTokenMiddleware
+
+
+class TokenSettingsMixin:
+    def setUp(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.key_path = Path(directory) / "service_tokens.json"
+        self.ring = KeyRing.generate()
+        self.ring.save(self.key_path)
+        self.enterContext(override_settings(SERVICE_TOKEN_KEY_FILE=str(self.key_path)))
+
+    def bearer(self, user_id=7, ttl=900, ring=None):
+        return f"Bearer {issueToken(ring or self.ring, user_id, ttl)}"
+
+
+class ServiceTokenMiddlewareTests(TokenSettingsMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.seen = []
+        self.middleware = ServiceTokenMiddleware(lambda request: self.seen.append(request.token_user_id) or HttpResponse("ok"))
+        self.factory = RequestFactory()
+
+    def call(self, path="/weight/", **headers):
+        return self.middleware(self.factory.get(path, headers=headers))
+
+    def test_valid_token_sets_user(self):
+        response = self.call(authorization=self.bearer(user_id=42))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.seen, [42])
+
+    def test_no_token(self):
+        self.assertEqual(self.call().status_code, 200)
+        self.assertEqual(self.seen, [None])
+
+    def test_invalid_tokens_rejected(self):
+        for header in [self.bearer(ttl=-1), self.bearer(ring=KeyRing.generate()), "Bearer not-a-token"]:
+            with self.subTest(header=header):
+                response = self.call(authorization=header)
+                self.assertEqual(response.status_code, 401)
+        self.assertEqual(self.seen, [])
+
+    @override_settings(SERVICE_TOKEN_REQUIRED=True)
+    def test_required(self):
+        response = self.call()
+        self.assertEqual(response.status_code, 401)
+        self.assertIn(MISSING_TOKEN, response.content.decode())
+        self.assertEqual(self.call(path="/get_csrf_token/").status_code, 200)
+
+    def test_verified_locally_once(self):
+        header = self.bearer()
+        with mock.patch.object(serviceTokens, "verifyToken", wraps=serviceTokens.verifyToken) as verify:
+            for _ in range(3):
+                self.call(authorization=header)
+        self.assertEqual(verify.call_count, 1)
+
+    def test_missing_key_file(self):
+        with override_settings(SERVICE_TOKEN_KEY_FILE=str(self.key_path.with_name("absent.json"))):
+            response = self.call(authorization=self.bearer())
+        self.assertEqual(response.status_code, 503)
+        self.assertIn(KEYS_UNAVAILABLE, response.content.decode())
+
+
+class ServiceTokenSiteTests(TokenSettingsMixin, TestCase):
+    def test_installed(self):
+        client = Client()
+        url = reverse("weight")
+
+        self.assertEqual(client.get(url, {"user_id": 7}, headers={"authorization": self.bearer(user_id=7)}).status_code, 200)
+        self.assertEqual(client.get(url, {"user_id": 1}, headers={"authorization": "Bearer x.y.z"}).status_code, 401)
+
+    @override_settings(SERVICE_TOKEN_REQUIRED=True, METRICS_TOKEN="scrape-secret")
+    def test_metrics_served_without_service_token(self):
+        registry.reset()
+        client = Client()
+        client.get(reverse("weight"), {"user_id": 1})
+
+        response = client.get("/metrics", headers={"authorization": "Bearer scrape-secret"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('gym_http_requests_total{view="weight",method="GET",status="4xx"} 1', response.content.decode())
+
+
+class TokenUserTests(TokenSettingsMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = Client(headers={"authorization": self.bearer(user_id=7)})
+
+    def assertForbidden(self, response):
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()["error"], WRONG_USER)
+
+    def test_reads_for_another_user_rejected(self):
+        for name in ("weight", "weight_trends", "weight_export"):
+            with self.subTest(view=name):
+                self.assertForbidden(self.client.get(reverse(name), {"user_id": 8}))
+                self.assertEqual(self.client.get(reverse(name), {"user_id": 7}).status_code, 200)
+
+    def test_export_needs_a_user(self):
+        response = self.client.get(reverse("weight_export"))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], V.MISSING_USER_ID)
+
+    def test_ingest_for_another_user_rejected(self):
+        readings = [{"user_id": 7, "weight": 80}, {"user_id": 8, "weight": 90}]
+        response = self.client.post(reverse("weight"), data=json.dumps(readings), content_type="application/json")
+
+        self.assertForbidden(response)
+        self.assertFalse(Weights.objects.exists())
+
+    def test_ingest_for_token_user(self):
+        response = self.client.post(reverse("weight"), data=json.dumps({"user_id": 7, "weight": 80}), content_type="application/json")
+        self.assertEqual(response.status_code, 201)
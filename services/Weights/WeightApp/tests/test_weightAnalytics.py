@@ -0,0 +1,84 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+from django.test import TestCase
+
+from WeightApp.analytics import WeightSeries
+from WeightApp.models import Weights
+
+
+def pythonEma(values, alpha):
+    smoothed = [values[0]]
+    for value in values[1:]:
+        smoothed.append(alpha * value + (1 - alpha) * smoothed[-1])
+    return smoothed
+
+
+class WeightSeriesTests(TestCase):
+    def setUp(self):
+        start = date(2024, 1, 1)
+        # User 1 loses 0.1 kg a day with one misread scale, user 2 logs in pounds, user 3 has one reading
+        readings = [
+            Weights(user_id=1, weight_value=Decimal("90.00") - Decimal("0.10") * i, date_recorded=start + timedelta(days=i))
+            for i in range(30)
+        ]
+        readings[15].weight_value = Decimal("45.00")
+        readings += [
+            Weights(user_id=2, weight_value=Decimal("220.46"), weight_type="lb", date_recorded=start + timedelta(days=2 * i))
+            for i in range(5)
+        ]
+        readings.append(Weights(user_id=3, weight_value=Decimal("70.00"), date_recorded=start))
+        Weights.objects.bulk_create(readings)
+
+        with self.assertNumQueries(1):
+            self.series = WeightSeries.load()
+
+    def test_load_groups_users(self):
+        self.assertEqual(len(self.series), 36)
+        self.assertEqual(self.series.user_ids.tolist(), [1, 2, 3])
+        self.assertEqual(self.series.counts.tolist(), [30, 5, 1])
+        self.assertAlmostEqual(self.series.kg[30], 99.999, places=3)  # Pounds converted to kg
+
+    def test_ema_matches_per_user_loop(self):
+        ema = self.series.ema(alpha=0.2)
+
+        for start, count in zip(self.series.starts, self.series.counts):
+            expected = pythonEma(self.series.kg[start:start + count].tolist(), 0.2)
+            np.testing.assert_allclose(ema[start:start + count], expected)
+
+    def test_trend(self):
+        slope, intercept = self.series.trend()
+
+        self.assertAlmostEqual(slope[1], 0.0)
+        self.assertTrue(np.isnan(slope[2]))
+        self.assertAlmostEqual(intercept[2], 70.0)
+        self.assertLess(slope[0], 0)
+
+    def test_rate_of_change(self):
+        rate = self.series.rateOfChange()
+
+        self.assertTrue(np.isnan(rate[0]))
+        self.assertAlmostEqual(rate[1], -0.1)
+        self.assertTrue(np.isnan(rate[30]))  # First reading of user 2
+        self.assertAlmostEqual(rate[31], 0.0)
+
+    def test_outliers(self):
+        flagged = np.flatnonzero(self.series.outliers())
+        self.assertEqual(flagged.tolist(), [15])
+
+    def test_summary(self):
+        summary = self.series.summary()
+
+        self.assertEqual(summary[1]["outliers"], 1)
+        self.assertEqual(summary[1]["latest_kg"], 87.1)
+        self.assertEqual(summary[1]["last_date"], "2024-01-30")
+        self.assertEqual(summary[2]["slope_kg_per_week"], 0.0)
+        self.assertIsNone(summary[3]["slope_kg_per_week"])
+
+    def test_filtered_and_empty_series(self):
+        self.assertEqual(WeightSeries.load(Weights.objects.filter(user_id=2)).user_ids.tolist(), [2])
+
+        empty = WeightSeries.load(Weights.objects.none())
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.summary(), {})
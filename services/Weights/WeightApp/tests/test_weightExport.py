@@ -0,0 +1,109 @@
+import csv
+import json
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+
+from gymcommon.metricsMiddleware import registry
+from WeightApp.models import Weights
+from WeightApp.viewHandling import viewHandlingConstants as V
+from WeightApp.viewHandling.weightExport import EXPORT_CHUNK_SIZE
+
+
+def addReadings(user_id, count):
+    start = date(2000, 1, 1)
+    Weights.objects.bulk_create(
+        (Weights(user_id=user_id, weight_value=Decimal("80.50"), date_recorded=start + timedelta(days=i), note="Morning")
+         for i in range(count)),
+        batch_size=5000,
+    )
+
+
+class WeightExportTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("weight_export")
+        addReadings(1, 3)
+        Weights.objects.create(user_id=2, weight_value=Decimal("150.00"), weight_type="lb", date_recorded=date(2024, 1, 1))
+
+    def test_csv_export(self):
+        response = self.client.get(self.url, {"user_id": 1})
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn('filename="weights-1.csv"', response["Content-Disposition"])
+        rows = list(csv.DictReader(StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual([row["date_recorded"] for row in rows], ["2000-01-01", "2000-01-02", "2000-01-03"])
+        self.assertEqual(list(rows[0]), ["id", "user_id", "date_recorded", "weight", "weight_type", "note"])
+        self.assertEqual(rows[0]["weight"], "80.50")
+
+    def test_ndjson_export(self):
+        response = self.client.get(self.url, {"user_id": 1, "format": "ndjson", "from": "2000-01-02", "to": "2000-01-02"})
+
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([(line["user_id"], line["date_recorded"]) for line in lines], [(1, "2000-01-02")])
+        self.assertEqual(list(lines[0]), ["id", "user_id", "date_recorded", "weight", "weight_type", "note"])
+        self.assertEqual(lines[0]["weight"], "80.50")
+
+    def test_invalid_parameters(self):
+        for params, message in [
+            ({}, V.MISSING_USER_ID),
+            ({"user_id": 1, "format": "xml"}, V.INVALID_EXPORT_FORMAT),
+            ({"user_id": "abc"}, V.INVALID_USER_ID_TYPE),
+            ({"user_id": 1, "from": "2024-02-01", "to": "2024-01-01"}, V.INVALID_DATE_RANGE),
+        ]:
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["error"], message)
+
+
+@override_settings(METRICS_TOKEN="scrape-secret")
+class WeightExportMetricsTests(TestCase):
+    def setUp(self):
+        registry.reset()
+        self.client = Client()
+        addReadings(1, 3)
+
+    def samples(self) -> dict:
+        lines = self.client.get("/metrics", headers={"authorization": "Bearer scrape-secret"}).content.decode().splitlines()
+        return dict(line.rsplit(" ", 1) for line in lines if not line.startswith("#"))
+
+    def test_recorded_once_the_body_is_sent(self):
+        response = self.client.get(reverse("weight_export"), {"user_id": 1})
+        self.assertNotIn('gym_http_requests_total{view="weight_export",method="GET",status="2xx"}', self.samples())
+
+        body = b"".join(response.streaming_content)
+        samples = self.samples()
+        labels = 'view="weight_export",method="GET",status="2xx"'
+        self.assertEqual(samples[f"gym_http_requests_total{{{labels}}}"], "1")
+        self.assertEqual(samples[f"gym_http_db_queries_total{{{labels}}}"], "1")  # The export query, run while streaming
+        self.assertEqual(samples[f"gym_http_response_bytes_total{{{labels}}}"], str(len(body)))
+
+
+class WeightExportMemoryTests(TestCase):
+    def peakWhileStreaming(self, user_id):
+        response = Client().get(reverse("weight_export"), {"user_id": user_id, "format": "ndjson"})
+
+        tracemalloc.start()
+        try:
+            exported = sum(chunk.count(b"\n") for chunk in response.streaming_content)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return exported, peak
+
+    def test_memory_does_not_grow_with_row_count(self):
+        addReadings(1, EXPORT_CHUNK_SIZE * 2)
+        addReadings(2, EXPORT_CHUNK_SIZE * 10)
+
+        small_rows, small_peak = self.peakWhileStreaming(1)
+        large_rows, large_peak = self.peakWhileStreaming(2)
+
+        self.assertEqual((small_rows, large_rows), (EXPORT_CHUNK_SIZE * 2, EXPORT_CHUNK_SIZE * 10))
+        # Five times the rows must not need meaningfully more memory than one chunk's worth
+        self.assertLess(large_peak, small_peak * 1.5)
@@ -0,0 +1,83 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import TestCase, Client
+from django.urls import reverse
+
+from WeightApp.models import Weights
+from WeightApp.viewHandling import viewHandlingConstants as V
+
+
+class WeightHistoryTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("weight")
+        start = date(2024, 1, 1)
+        Weights.objects.bulk_create([
+            Weights(user_id=1, weight_value=Decimal("80.00") + i, date_recorded=start + timedelta(days=i))
+            for i in range(10)
+        ])
+        # Two readings on the same day exercise the id tie-breaker
+        Weights.objects.create(user_id=1, weight_value=Decimal("90.00"), date_recorded=date(2024, 1, 10))
+        Weights.objects.create(user_id=2, weight_value=Decimal("70.00"), date_recorded=date(2024, 1, 5))
+
+    def get_history(self, **params):
+        return self.client.get(self.url, params)
+
+    def collect_pages(self, **params):
+        readings, cursor = [], None
+        while True:
+            page_params = dict(params, cursor=cursor) if cursor else params
+            body = self.get_history(**page_params).json()
+            readings.extend(body["results"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                return readings
+
+    def test_first_page(self):
+        response = self.get_history(user_id=1, limit=3)
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([r["date_recorded"] for r in body["results"]], ["2024-01-10", "2024-01-10", "2024-01-09"])
+        self.assertEqual(body["results"][0]["weight"], "90.00")
+        self.assertIsNotNone(body["next_cursor"])
+
+    def test_pages_cover_every_reading_once(self):
+        readings = self.collect_pages(user_id=1, limit=4)
+
+        ids = [r["id"] for r in readings]
+        self.assertEqual(len(ids), 11)
+        self.assertEqual(len(set(ids)), 11)
+        self.assertEqual(ids, list(Weights.objects.filter(user_id=1).order_by("-date_recorded", "-id").values_list("id", flat=True)))
+
+    def test_date_range(self):
+        readings = self.collect_pages(user_id=1, limit=2, **{"from": "2024-01-03", "to": "2024-01-05"})
+        self.assertEqual([r["date_recorded"] for r in readings], ["2024-01-05", "2024-01-04", "2024-01-03"])
+
+    def test_one_query_per_page(self):
+        cursor = self.get_history(user_id=1, limit=5).json()["next_cursor"]
+
+        with self.assertNumQueries(1):
+            response = self.get_history(user_id=1, limit=5, cursor=cursor)
+        self.assertEqual(len(response.json()["results"]), 5)
+
+    def test_last_page_has_no_cursor(self):
+        body = self.get_history(user_id=2).json()
+        self.assertEqual(len(body["results"]), 1)
+        self.assertIsNone(body["next_cursor"])
+
+    def test_invalid_parameters(self):
+        cases = [
+            ({}, V.MISSING_USER_ID),
+            ({"user_id": 1, "limit": 0}, V.INVALID_LIMIT),
+            ({"user_id": 1, "limit": "ten"}, V.INVALID_LIMIT),
+            ({"user_id": 1, "cursor": "not-a-cursor"}, V.INVALID_CURSOR),
+            ({"user_id": 1, "from": "01/01/2024"}, V.INVALID_DATE_FROM),
+            ({"user_id": 1, "from": "2024-02-01", "to": "2024-01-01"}, V.INVALID_DATE_RANGE),
+        ]
+        for params, message in cases:
+            with self.subTest(params=params):
+                response = self.get_history(**params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["error"], message)
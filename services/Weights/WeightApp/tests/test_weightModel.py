@@ -0,0 +1,95 @@
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db import IntegrityError, connection
+from django.test import TestCase, TransactionTestCase, Client, override_settings
+from django.urls import reverse
+
+from WeightApp.dailyReadings import DAILY_INDEX_NAME, syncDailyReadingIndex
+from WeightApp.models import Weights
+from WeightApp.viewHandling.weightViews import historyReadings
+
+
+def dailyIndexExists():
+    with connection.cursor() as cursor:
+        return DAILY_INDEX_NAME in connection.introspection.get_constraints(cursor, Weights._meta.db_table)
+
+
+class HistoryIndexTests(TestCase):
+    def setUp(self):
+        Weights.objects.bulk_create([
+            Weights(user_id=user_id, weight_value=Decimal("80.00"), date_recorded=date(2024, 1, 1) + timedelta(days=day))
+            for user_id in range(1, 51) for day in range(200)
+        ])
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE "{Weights._meta.db_table}"')  # Fresh statistics, or the planner guesses
+
+    def assertUsesHistoryIndex(self, readings):
+        plan = readings.explain()
+        self.assertIn("weights_user_history_idx", plan)
+        if connection.vendor == "sqlite":
+            self.assertIn("COVERING INDEX", plan)  # Answered from the index alone
+            self.assertNotIn("TEMP B-TREE", plan)  # No separate sort for the ORDER BY
+
+    def test_first_page_uses_covering_index(self):
+        self.assertUsesHistoryIndex(historyReadings(3)[:50])
+
+    def test_cursor_page_uses_covering_index(self):
+        self.assertUsesHistoryIndex(historyReadings(3, date_from=date(2024, 1, 2), cursor=(date(2024, 5, 10), 50))[:50])
+
+
+# Overridden per test, the flush after each TransactionTestCase test re-runs post_migrate and drops the index again
+class DailyReadingIndexTests(TransactionTestCase):
+    def setUp(self):
+        self.client = Client()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(syncDailyReadingIndex())
+        self.assertFalse(dailyIndexExists())
+
+    @override_settings(WEIGHTS_ONE_READING_PER_DAY=True)
+    def test_sync_creates_and_drops_index(self):
+        self.assertTrue(syncDailyReadingIndex())
+        self.assertTrue(syncDailyReadingIndex())  # Safe to run again
+        self.assertTrue(dailyIndexExists())
+
+        with override_settings(WEIGHTS_ONE_READING_PER_DAY=False):
+            syncDailyReadingIndex()
+        self.assertFalse(dailyIndexExists())
+
+    @override_settings(WEIGHTS_ONE_READING_PER_DAY=True)
+    def test_readings_inserted_until_index_is_created(self):
+        reading = {"user_id": 1, "weight": 80, "date_recorded": "2024-01-01"}
+        with self.assertLogs("WeightApp.dailyReadings", "WARNING"):
+            response = self.client.post(reverse("weight"), data=json.dumps([reading, dict(reading, weight=81)]), content_type="application/json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Weights.objects.count(), 2)
+
+    @override_settings(WEIGHTS_ONE_READING_PER_DAY=True)
+    def test_existing_duplicates_are_reported(self):
+        Weights.objects.create(user_id=1, weight_value=Decimal("80.00"), date_recorded=date(2024, 1, 1))
+        Weights.objects.create(user_id=1, weight_value=Decimal("81.00"), date_recorded=date(2024, 1, 1))
+
+        with self.assertRaisesMessage(IntegrityError, "several readings on one day"):
+            syncDailyReadingIndex()
+
+    @override_settings(WEIGHTS_ONE_READING_PER_DAY=True)
+    def test_later_reading_replaces_earlier_one(self):
+        syncDailyReadingIndex()
+        url = reverse("weight")
+        first = {"user_id": 1, "weight": 80, "date_recorded": "2024-01-01"}
+
+        self.client.post(url, data=json.dumps(first), content_type="application/json")
+        response = self.client.post(url, data=json.dumps([
+            dict(first, weight=81),
+            dict(first, weight=82, note="After breakfast"),
+            dict(first, date_recorded="2024-01-02"),
+        ]), content_type="application/json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Weights.objects.count(), 2)
+        reading = Weights.objects.get(date_recorded=date(2024, 1, 1))
+        self.assertEqual((reading.weight_value, reading.note), (Decimal("82.00"), "After breakfast"))
@@ -0,0 +1,181 @@
+import json
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.db import connection, transaction
+from django.test import TestCase, Client
+from django.urls import reverse
+
+from WeightApp.models import Weights, WeightRollup
+from WeightApp import rollups
+from WeightApp.rollups import ROLLUP_LOCK_CLASS, bucketRanges, periodEnd, refreshRollups
+from WeightApp.viewHandling import viewHandlingConstants as V
+
+
+def locks() -> int:
+    return 1 if connection.vendor == "postgresql" else 0  # The rollup lock query
+
+
+class RollupMaintenanceTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+
+    def ingest(self, readings):
+        response = self.client.post(reverse("weight"), data=json.dumps(readings), content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+
+    def rollup(self, period, start, user_id=1):
+        return WeightRollup.objects.get(user_id=user_id, period=period, period_start=start)
+
+    def test_ingest_updates_every_period(self):
+        self.ingest([
+            {"user_id": 1, "weight": 80, "date_recorded": "2024-01-02"},
+            {"user_id": 1, "weight": 82, "date_recorded": "2024-01-03"},
+        ])
+
+        self.assertEqual(self.rollup("day", date(2024, 1, 2)).reading_count, 1)
+        week = self.rollup("week", date(2024, 1, 1))
+        self.assertEqual((week.reading_count, week.total_kg, week.min_kg, week.max_kg),
+                         (2, Decimal("162.000"), Decimal("80.000"), Decimal("82.000")))
+        self.assertEqual(self.rollup("month", date(2024, 1, 1)).reading_count, 2)
+
+    def test_pounds_are_normalised_to_kg(self):
+        self.ingest([
+            {"user_id": 1, "weight": 100, "date_recorded": "2024-01-02"},
+            {"user_id": 1, "weight": 220.46, "weight_type": "lb", "date_recorded": "2024-01-02"},
+        ])
+
+        day = self.rollup("day", date(2024, 1, 2))
+        self.assertEqual(day.total_kg, Decimal("199.999"))  # 220.46 lb is 99.999 kg
+        self.assertEqual(day.max_kg, Decimal("100.000"))
+
+    def test_only_affected_buckets_change(self):
+        self.ingest([{"user_id": 1, "weight": 80, "date_recorded": "2024-01-02"}])
+        self.ingest([{"user_id": 2, "weight": 70, "date_recorded": "2024-02-10"}])
+        before = WeightRollup.objects.filter(user_id=1).count()
+
+        self.ingest([{"user_id": 1, "weight": 90, "date_recorded": "2024-01-03"}])
+
+        self.assertEqual(WeightRollup.objects.filter(user_id=1).count(), before + 1)  # Only the new day bucket
+        self.assertEqual(self.rollup("week", date(2024, 1, 1)).reading_count, 2)
+        self.assertEqual(self.rollup("month", date(2024, 2, 1), user_id=2).reading_count, 1)
+
+    def test_constant_queries_per_batch(self):
+        readings = [{"user_id": i % 5 + 1, "weight": 80, "date_recorded": f"2024-01-{i % 28 + 1:02d}"} for i in range(100)]
+
+        # Savepoint, INSERT, the user locks on PostgreSQL, then an aggregate and an upsert per period
+        with self.assertNumQueries(2 + 1 + locks() + 3 * 2):
+            self.ingest(readings)
+
+    @skipUnless(connection.vendor == "postgresql", "advisory locks are PostgreSQL only")
+    def test_users_locked_until_commit(self):
+        with transaction.atomic():
+            refreshRollups([(3, date(2024, 1, 2)), (1, date(2024, 1, 2))])
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT objid FROM pg_locks WHERE locktype = 'advisory' AND classid = %s AND pid = pg_backend_pid() ORDER BY objid",
+                    [ROLLUP_LOCK_CLASS],
+                )
+                self.assertEqual([row[0] for row in cursor.fetchall()], [1, 3])
+
+    def test_ranges_bounded_per_user(self):
+        buckets = {(1, date(2020, 1, 6)), (1, date(2020, 1, 13)), (1, date(2024, 1, 1)), (2, date(2024, 1, 1))}
+
+        self.assertEqual(bucketRanges(buckets, "week"), [
+            [1, date(2020, 1, 6), date(2020, 1, 19)],
+            [1, date(2024, 1, 1), date(2024, 1, 7)],
+            [2, date(2024, 1, 1), date(2024, 1, 7)],
+        ])
+
+    def test_backfill_does_not_widen_other_users_refresh(self):
+        Weights.objects.bulk_create([
+            Weights(user_id=user_id, weight_value=Decimal("80.00"), date_recorded=date(2022, 6, 1)) for user_id in (1, 2)
+        ] + [
+            Weights(user_id=1, weight_value=Decimal("80.00"), date_recorded=date(2020, 1, 2)),
+            Weights(user_id=2, weight_value=Decimal("70.00"), date_recorded=date(2024, 1, 2)),
+        ])
+
+        with patch.object(rollups, "RANGES_PER_QUERY", 1), self.assertNumQueries(locks() + 3 * 3):  # Two aggregates and an upsert per period
+            refreshRollups([(1, date(2020, 1, 2)), (2, date(2024, 1, 2))])
+
+        self.assertEqual(set(WeightRollup.objects.filter(period="month").values_list("user_id", "period_start")),
+                         {(1, date(2020, 1, 1)), (2, date(2024, 1, 1))})  # No bucket between the two is touched
+
+    def test_emptied_bucket_is_removed(self):
+        self.ingest([{"user_id": 1, "weight": 80, "date_recorded": "2024-01-02"}])
+        Weights.objects.filter(user_id=1).delete()
+
+        refreshRollups([(1, date(2024, 1, 2))])
+        self.assertFalse(WeightRollup.objects.filter(user_id=1).exists())
+
+    def test_period_end(self):
+        self.assertEqual(periodEnd(date(2024, 2, 1), "month"), date(2024, 2, 29))
+        self.assertEqual(periodEnd(date(2024, 12, 1), "month"), date(2024, 12, 31))
+        self.assertEqual(periodEnd(date(2024, 1, 1), "week"), date(2024, 1, 7))
+
+    def test_rebuild_command(self):
+        Weights.objects.bulk_create([
+            Weights(user_id=1, weight_value=Decimal("80.00"), date_recorded=date(2024, 1, 2)),
+            Weights(user_id=2, weight_value=Decimal("70.00"), date_recorded=date(2024, 1, 2)),
+        ])
+
+        out = StringIO()
+        call_command("rebuild_weight_rollups", stdout=out)
+        self.assertIn("Wrote 6 rollups.", out.getvalue())
+
+        call_command("rebuild_weight_rollups", "--user-id", "1", stdout=out)
+        self.assertEqual(WeightRollup.objects.count(), 6)
+        self.assertEqual(self.rollup("week", date(2024, 1, 1), user_id=2).total_kg, Decimal("70.000"))
+
+
+class WeightTrendsViewTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("weight_trends")
+        Weights.objects.bulk_create([
+            Weights(user_id=1, weight_value=Decimal("80.00"), date_recorded=date(2024, 1, 1)),
+            Weights(user_id=1, weight_value=Decimal("82.00"), date_recorded=date(2024, 1, 3)),
+            Weights(user_id=1, weight_value=Decimal("79.00"), date_recorded=date(2024, 1, 8)),
+            Weights(user_id=1, weight_value=Decimal("176.37"), weight_type="lb", date_recorded=date(2024, 2, 5)),
+        ])
+        call_command("rebuild_weight_rollups", stdout=StringIO())
+
+    def test_weekly_trends(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"user_id": 1, "period": "week"})
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([r["period_start"] for r in results], ["2024-01-01", "2024-01-08", "2024-02-05"])
+        self.assertEqual(results[0], {"period_start": "2024-01-01", "readings": 2, "average": "81.00",
+                                      "min": "80.00", "max": "82.00", "change": None})
+        self.assertEqual(results[1]["change"], "-2.00")
+        self.assertEqual(results[2]["average"], "80.00")
+
+    def test_monthly_trends_in_pounds_with_range(self):
+        response = self.client.get(self.url, {"user_id": 1, "period": "month", "unit": "lb", "from": "2024-02-01"})
+
+        results = response.json()["results"]
+        self.assertEqual(response.json()["unit"], "lb")
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["average"], "176.37")
+
+    def test_invalid_parameters(self):
+        for params, message in [
+            ({"period": "week"}, V.MISSING_USER_ID),
+            ({"user_id": 1, "period": "year"}, V.INVALID_PERIOD),
+            ({"user_id": 1, "unit": "st"}, V.INVALID_WEIGHT_UNIT),
+        ]:
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["error"], message)
+
+    def test_method_not_allowed(self):
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,123 @@
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from WeightApp.models import Weights
+from WeightApp.viewHandling import viewHandlingConstants as V
+
+
+class WeightIngestTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("weight")
+        self.reading = {
+            "user_id": 1,
+            "weight": 80.25,
+            "weight_type": "kg",
+            "date_recorded": "2024-01-01",
+            "note": "Morning",
+        }
+
+    def post_json(self, data):
+        return self.client.post(self.url, data=json.dumps(data), content_type="application/json")
+
+    def test_url_exists(self):
+        response = self.client.get(self.url)
+        self.assertNotEqual(response.status_code, 404)
+
+    def test_invalid_json(self):
+        response = self.client.post(self.url, data="Not a JSON", content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.json())
+
+    def test_single_reading(self):
+        response = self.post_json(self.reading)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {"accepted": 1, "rejected": 0, "errors": []})
+        weight = Weights.objects.get()
+        self.assertEqual(weight.user_id, 1)
+        self.assertEqual(weight.weight_value, Decimal("80.25"))
+        self.assertEqual(weight.date_recorded, date(2024, 1, 1))
+        self.assertEqual(weight.note, "Morning")
+
+    def test_defaults(self):
+        response = self.post_json({"user_id": 1, "weight": "70"})
+
+        self.assertEqual(response.status_code, 201)
+        weight = Weights.objects.get()
+        self.assertEqual(weight.weight_type, "kg")
+        self.assertEqual(weight.date_recorded, date.today())
+        self.assertEqual(weight.note, "")
+
+    def test_batch_is_one_insert(self):
+        readings = [dict(self.reading, date_recorded=f"2024-01-{day:02d}") for day in range(1, 11)]
+
+        # One INSERT for all rows, the rest of the transaction maintains the rollups
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post_json(readings)
+        inserts = [q["sql"] for q in queries.captured_queries if q["sql"].startswith('INSERT INTO "WeightApp_weights"')]
+        self.assertEqual(len(inserts), 1)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["accepted"], 10)
+        self.assertEqual(Weights.objects.count(), 10)
+
+    def test_partial_batch_reports_rejected(self):
+        readings = [
+            self.reading,
+            dict(self.reading, weight=-1),
+            dict(self.reading, weight=501),
+            dict(self.reading, weight_type="stone"),
+            dict(self.reading, date_recorded=(date.today() + timedelta(days=1)).isoformat()),
+            "not an object",
+            dict(self.reading, user_id="abc"),
+        ]
+        response = self.post_json(readings)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {
+            "accepted": 1,
+            "rejected": 6,
+            "errors": [
+                {"index": 1, "error": V.SMALL_WEIGHT},
+                {"index": 2, "error": V.LARGE_WEIGHT},
+                {"index": 3, "error": V.INVALID_WEIGHT_UNIT},
+                {"index": 4, "error": V.FUTURE_DATE_RECORDED},
+                {"index": 5, "error": V.INVALID_READING},
+                {"index": 6, "error": V.INVALID_USER_ID_TYPE},
+            ],
+        })
+
+    def test_all_rejected(self):
+        response = self.post_json([dict(self.reading, weight=None)])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["errors"], [{"index": 0, "error": V.MISSING_WEIGHT}])
+        self.assertFalse(Weights.objects.exists())
+
+    def test_weight_rules(self):
+        cases = [
+            ("", V.EMPTY_WEIGHT),
+            ([80], V.INVALID_WEIGHT_TYPE),
+            (True, V.INVALID_WEIGHT_TYPE),
+            ("heavy", V.INVALID_WEIGHT),
+        ]
+        for value, message in cases:
+            response = self.post_json(dict(self.reading, weight=value))
+            self.assertEqual(response.json()["errors"], [{"index": 0, "error": message}], value)
+
+    def test_empty_array(self):
+        response = self.post_json([])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], V.NO_READINGS)
+
+    def test_too_many_readings(self):
+        response = self.post_json([self.reading] * (V.MAX_READINGS_PER_REQUEST + 1))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], V.TOO_MANY_READINGS)
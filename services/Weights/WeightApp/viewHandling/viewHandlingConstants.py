@@ -0,0 +1,36 @@
+MISSING_WEIGHT = "Weight is missing."
+EMPTY_WEIGHT = "Weight cannot be empty."
+INVALID_WEIGHT = "Weight is invalid. It must be a valid decimal number."
+SMALL_WEIGHT = "Weight cannot be less than 0."
+LARGE_WEIGHT = "Weight cannot be more than 500."
+INVALID_WEIGHT_TYPE = "Weight must be a float."
+
+INVALID_WEIGHT_UNIT = "Weight type is invalid. It must be 'kg' or 'lb'."
+
+INVALID_DATE_RECORDED = "Date recorded is invalid. It must be a valid date format (YYYY-MM-DD)."
+FUTURE_DATE_RECORDED = "Date recorded cannot be a future date."
+
+INVALID_NOTE_TYPE = "Note must be a string."
+LONG_NOTE = "Note cannot be more than 255 characters long."
+
+MISSING_USER_ID = "User ID is missing."
+EMPTY_USER_ID = "User ID cannot be empty."
+INVALID_USER_ID_VALUE = "User ID is invalid. It must be a valid integer."
+INVALID_USER_ID_TYPE = "User ID must be an integer."
+
+INVALID_READING = "Reading must be a JSON object."
+NO_READINGS = "At least one reading must be provided."
+TOO_MANY_READINGS = "Too many readings in one request. The maximum is 1000."
+MAX_READINGS_PER_REQUEST = 1000
+
+INVALID_LIMIT = "Limit is invalid. It must be an integer between 1 and 500."
+INVALID_CURSOR = "Cursor is invalid."
+INVALID_DATE_FROM = "'from' is invalid. It must be a valid date format (YYYY-MM-DD)."
+INVALID_DATE_TO = "'to' is invalid. It must be a valid date format (YYYY-MM-DD)."
+INVALID_DATE_RANGE = "'from' cannot be after 'to'."
+DEFAULT_HISTORY_LIMIT = 50
+MAX_HISTORY_LIMIT = 500
+
+INVALID_PERIOD = "Period is invalid. It must be 'day', 'week' or 'month'."
+
+INVALID_EXPORT_FORMAT = "Export format is invalid. It must be 'csv' or 'ndjson'."
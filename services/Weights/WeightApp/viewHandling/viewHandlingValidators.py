@@ -0,0 +1,224 @@
+import base64
+import binascii
+
+from django.core.exceptions import BadRequest
+from decimal import Decimal, InvalidOperation
+from datetime import datetime
+
+from WeightApp.viewHandling import viewHandlingConstants as validators  # Importing validation messages
+
+#WEIGHT VALIDATIONS
+def validateWeight(data: dict) -> Decimal:
+    weight = data.get("weight")
+
+    if weight is None:
+        raise BadRequest(validators.MISSING_WEIGHT)
+
+    if isinstance(weight, str) and not weight.strip():
+        raise BadRequest(validators.EMPTY_WEIGHT)
+
+    if isinstance(weight, (list, dict, bool)):
+        raise BadRequest(validators.INVALID_WEIGHT_TYPE)
+
+    try:
+        w = Decimal(str(weight))
+    except (InvalidOperation, TypeError, ValueError):
+        raise BadRequest(validators.INVALID_WEIGHT)
+
+    if not w.is_finite():
+        raise BadRequest(validators.INVALID_WEIGHT)
+    if w < 0:
+        raise BadRequest(validators.SMALL_WEIGHT)
+    if w > Decimal("500"):
+        raise BadRequest(validators.LARGE_WEIGHT)
+
+    return w.quantize(Decimal("0.01"))
+
+def validateWeightType(data: dict) -> str:
+    weight_type = data.get("weight_type", "kg")
+
+    if not isinstance(weight_type, str) or weight_type.strip().lower() not in ("kg", "lb"):
+        raise BadRequest(validators.INVALID_WEIGHT_UNIT)
+
+    return weight_type.strip().lower()
+
+#DATE VALIDATIONS
+def validateDateRecorded(data: dict, today=None):
+    today = today or datetime.now().date()
+    date_str = data.get("date_recorded")
+
+    if date_str is None:
+        return today
+
+    if not isinstance(date_str, str):
+        raise BadRequest(validators.INVALID_DATE_RECORDED)
+
+    try:
+        date_recorded = datetime.strptime(date_str.strip(), "%Y-%m-%d").date()
+    except ValueError:
+        raise BadRequest(validators.INVALID_DATE_RECORDED)
+
+    if date_recorded > today:
+        raise BadRequest(validators.FUTURE_DATE_RECORDED)
+
+    return date_recorded
+
+def validateDateParam(value, message: str):
+    if value is None:
+        return None
+
+    try:
+        return datetime.strptime(value.strip(), "%Y-%m-%d").date()
+    except ValueError:
+        raise BadRequest(message)
+
+#PAGINATION VALIDATIONS
+def validateLimit(data: dict) -> int:
+    limit = data.get("limit")
+
+    if limit is None:
+        return validators.DEFAULT_HISTORY_LIMIT
+
+    try:
+        limit = int(limit)
+    except (ValueError, TypeError):
+        raise BadRequest(validators.INVALID_LIMIT)
+
+    if limit < 1 or limit > validators.MAX_HISTORY_LIMIT:
+        raise BadRequest(validators.INVALID_LIMIT)
+
+    return limit
+
+def encodeCursor(date_recorded, reading_id: int) -> str:
+    """
+    Encodes the (date_recorded, id) of the last row on a page as an opaque cursor.
+    """
+    raw = f"{date_recorded.isoformat()}|{reading_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def validateCursor(data: dict):
+    """
+    Decodes a cursor back to (date_recorded, id), or returns None for the first page.
+    """
+    cursor = data.get("cursor")
+
+    if cursor is None:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        date_str, reading_id = raw.split("|")
+        return datetime.strptime(date_str, "%Y-%m-%d").date(), int(reading_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequest(validators.INVALID_CURSOR)
+
+#OTHER FIELD VALIDATIONS
+def validateNote(data: dict) -> str:
+    note = data.get("note", "")
+
+    if note is None:
+        return ""
+
+    if not isinstance(note, str):
+        raise BadRequest(validators.INVALID_NOTE_TYPE)
+
+    note = note.strip()
+    if len(note) > 255:
+        raise BadRequest(validators.LONG_NOTE)
+
+    return note
+
+#User ID VALIDATIONS
+def validateUserID(user_id) -> int:
+    if user_id is None:
+        raise BadRequest(validators.MISSING_USER_ID)
+
+    if isinstance(user_id, str) and not user_id.strip():
+        raise BadRequest(validators.EMPTY_USER_ID)
+
+    if isinstance(user_id, (bool, float, list, dict)):
+        raise BadRequest(validators.INVALID_USER_ID_TYPE)
+
+    try:
+        uid = int(user_id)
+    except (ValueError, TypeError):
+        raise BadRequest(validators.INVALID_USER_ID_TYPE)
+
+    if uid <= 0:
+        raise BadRequest(validators.INVALID_USER_ID_VALUE)
+
+    return uid
+
+#VALIDATIONS FOR VIEW DATA
+def validateReading(data, today=None) -> dict:
+    """
+    Validates one weight reading and returns the model field values.
+    """
+    if not isinstance(data, dict):
+        raise BadRequest(validators.INVALID_READING)
+
+    return {
+        "user_id": validateUserID(data.get("user_id")),
+        "weight_value": validateWeight(data),
+        "weight_type": validateWeightType(data),
+        "date_recorded": validateDateRecorded(data, today),
+        "note": validateNote(data),
+    }
+
+def validateHistoryQuery(data: dict) -> dict:
+    """
+    Validates the query string of a weight history request.
+    """
+    date_from = validateDateParam(data.get("from"), validators.INVALID_DATE_FROM)
+    date_to = validateDateParam(data.get("to"), validators.INVALID_DATE_TO)
+    if date_from and date_to and date_from > date_to:
+        raise BadRequest(validators.INVALID_DATE_RANGE)
+
+    return {
+        "user_id": validateUserID(data.get("user_id")),
+        "limit": validateLimit(data),
+        "cursor": validateCursor(data),
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+
+def validateTrendsQuery(data: dict) -> dict:
+    """
+    Validates the query string of a weight trends request.
+    """
+    period = data.get("period", "week")
+    if period not in ("day", "week", "month"):
+        raise BadRequest(validators.INVALID_PERIOD)
+
+    date_from = validateDateParam(data.get("from"), validators.INVALID_DATE_FROM)
+    date_to = validateDateParam(data.get("to"), validators.INVALID_DATE_TO)
+    if date_from and date_to and date_from > date_to:
+        raise BadRequest(validators.INVALID_DATE_RANGE)
+
+    return {
+        "user_id": validateUserID(data.get("user_id")),
+        "period": period,
+        "unit": validateWeightType({"weight_type": data.get("unit", "kg")}),
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+
+def validateExportQuery(data: dict) -> dict:
+    """
+    Validates the query string of a weight export request.
+    """
+    export_format = data.get("format", "csv")
+    if export_format not in ("csv", "ndjson"):
+        raise BadRequest(validators.INVALID_EXPORT_FORMAT)
+
+    date_from = validateDateParam(data.get("from"), validators.INVALID_DATE_FROM)
+    date_to = validateDateParam(data.get("to"), validators.INVALID_DATE_TO)
+    if date_from and date_to and date_from > date_to:
+        raise BadRequest(validators.INVALID_DATE_RANGE)
+
+    return {
+        "user_id": validateUserID(data.get("user_id")),
+        "format": export_format,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
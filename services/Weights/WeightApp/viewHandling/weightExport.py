@@ -0,0 +1,73 @@
+import csv
+import json
+
+from WeightApp.models import Weights
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_FIELDS = ("id", "user_id", "date_recorded", "weight_value", "weight_type", "note")
+# The names the readings are exported under, in both formats; weight_value goes out as weight, as in the API
+EXPORT_COLUMNS = ("id", "user_id", "date_recorded", "weight", "weight_type", "note")
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+class EchoBuffer:
+    """
+    File-like object whose write returns the value, so csv.writer encodes one row at a time.
+    """
+
+    def write(self, value):
+        return value
+
+
+#ROW ENCODERS
+def encodeCsvRows(rows):
+    writer = csv.writer(EchoBuffer())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for reading_id, user_id, date_recorded, weight_value, weight_type, note in rows:
+        yield writer.writerow((reading_id, user_id, date_recorded.isoformat(), weight_value, weight_type, note))
+
+def encodeNdjsonRows(rows):
+    for reading_id, user_id, date_recorded, weight_value, weight_type, note in rows:
+        yield json.dumps({
+            "id": reading_id,
+            "user_id": user_id,
+            "date_recorded": date_recorded.isoformat(),
+            "weight": str(weight_value),
+            "weight_type": weight_type,
+            "note": note,
+        }) + "\n"
+
+ENCODERS = {
+    "csv": encodeCsvRows,
+    "ndjson": encodeNdjsonRows,
+}
+
+
+#EXPORT
+def exportReadings(user_id: int, date_from=None, date_to=None):
+    """
+    Returns a user's readings to export, oldest first, optionally for a date range.
+    """
+    readings = Weights.objects.filter(user_id=user_id)
+    if date_from:
+        readings = readings.filter(date_recorded__gte=date_from)
+    if date_to:
+        readings = readings.filter(date_recorded__lte=date_to)
+    return readings.order_by("date_recorded", "id").values_list(*EXPORT_FIELDS)
+
+def streamExport(readings, export_format: str, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """
+    Yields the encoded export in pieces of about chunk_size rows.
+    The queryset is read with iterator(), so only one chunk of rows is held in memory at a time.
+    """
+    piece = []
+    for line in ENCODERS[export_format](readings.iterator(chunk_size=chunk_size)):
+        piece.append(line)
+        if len(piece) >= chunk_size:
+            yield "".join(piece)
+            piece = []
+    if piece:
+        yield "".join(piece)
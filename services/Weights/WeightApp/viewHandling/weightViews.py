@@ -0,0 +1,186 @@
+import json
+from datetime import datetime
+
+from WeightApp.models import Weights, WeightRollup
+from WeightApp.rollups import refreshRollups, toUnit
+from WeightApp.dailyReadings import DAILY_INDEX_FIELDS, replacesDailyReadings, latestPerDay
+from django.http import JsonResponse, StreamingHttpResponse
+from django.core.exceptions import BadRequest, PermissionDenied
+from django.db import transaction
+from django.db.models import Q
+
+from WeightApp.viewHandling import viewHandlingConstants as validators
+from WeightApp.viewHandling.viewHandlingValidators import validateReading, validateHistoryQuery, validateTrendsQuery, validateExportQuery, encodeCursor
+from WeightApp.viewHandling.weightExport import EXPORT_CONTENT_TYPES, exportReadings, streamExport
+from gymcommon.tokenMiddleware import validateTokenUser
+
+HISTORY_FIELDS = ("id", "date_recorded", "weight_value", "weight_type", "note")
+
+def weightIngest(request):
+    """
+    A view to handle recording one weight reading or an array of readings.
+    Valid readings are inserted with a single bulk_create in one transaction, invalid ones are reported by index.
+    """
+    try:
+        data = json.loads(request.body.decode("utf-8"))
+    except ValueError:
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    readings = data if isinstance(data, list) else [data]
+    if not readings:
+        return JsonResponse({"error": validators.NO_READINGS}, status=400)
+    if len(readings) > validators.MAX_READINGS_PER_REQUEST:
+        return JsonResponse({"error": validators.TOO_MANY_READINGS}, status=400)
+
+    today = datetime.now().date()
+    accepted, errors = [], []
+    for index, reading in enumerate(readings):
+        try:
+            accepted.append(Weights(**validateReading(reading, today)))
+        except BadRequest as e:
+            errors.append({"index": index, "error": str(e)})
+
+    try:
+        validateTokenUser(request, *{reading.user_id for reading in accepted})
+    except PermissionDenied as e:
+        return JsonResponse({"error": str(e)}, status=403)
+
+    if accepted:
+        with transaction.atomic():
+            if replacesDailyReadings():
+                # A later reading for the same user and day replaces the earlier one
+                Weights.objects.bulk_create(
+                    latestPerDay(accepted),
+                    update_conflicts=True,
+                    unique_fields=DAILY_INDEX_FIELDS,
+                    update_fields=["weight_value", "weight_type", "note"],
+                )
+            else:
+                Weights.objects.bulk_create(accepted)
+            refreshRollups((reading.user_id, reading.date_recorded) for reading in accepted)
+
+    return JsonResponse(
+        {"accepted": len(accepted), "rejected": len(errors), "errors": errors},
+        status=201 if accepted else 400,
+    )
+
+def seekBefore(readings, cursor_date, cursor_id):
+    """
+    Keeps the readings that sort after (cursor_date, cursor_id) in newest-first order.
+    The leading date_recorded <= cursor_date bound lets the database seek straight into
+    the user's history index rather than scanning from the newest reading.
+    """
+    return readings.filter(date_recorded__lte=cursor_date).filter(
+        Q(date_recorded__lt=cursor_date) | Q(id__lt=cursor_id)
+    )
+
+def historyReadings(user_id, date_from=None, date_to=None, cursor=None):
+    """
+    Returns a user's readings newest first as HISTORY_FIELDS tuples, after the cursor when one is given.
+    """
+    readings = Weights.objects.filter(user_id=user_id)
+    if date_from:
+        readings = readings.filter(date_recorded__gte=date_from)
+    if date_to:
+        readings = readings.filter(date_recorded__lte=date_to)
+    if cursor:
+        readings = seekBefore(readings, *cursor)
+    return readings.order_by("-date_recorded", "-id").values_list(*HISTORY_FIELDS)
+
+def weightHistory(request):
+    """
+    A view to handle retrieval of a user's weight history, newest first.
+    Pages are fetched with keyset pagination on (date_recorded, id), so every page
+    costs one index seek no matter how far back the client has paged.
+    """
+    try:
+        query = validateHistoryQuery(request.GET.dict())
+    except BadRequest as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    try:
+        validateTokenUser(request, query["user_id"])
+    except PermissionDenied as e:
+        return JsonResponse({"error": str(e)}, status=403)
+
+    # One extra row tells us whether there is a next page
+    limit = query["limit"]
+    rows = list(historyReadings(query["user_id"], query["date_from"], query["date_to"], query["cursor"])[:limit + 1])
+    page = rows[:limit]
+
+    results = [
+        {
+            "id": reading_id,
+            "date_recorded": date_recorded.isoformat(),
+            "weight": str(weight_value),
+            "weight_type": weight_type,
+            "note": note,
+        }
+        for reading_id, date_recorded, weight_value, weight_type, note in page
+    ]
+    next_cursor = encodeCursor(page[-1][1], page[-1][0]) if len(rows) > limit else None
+
+    return JsonResponse({"results": results, "next_cursor": next_cursor}, status=200)
+
+def weightTrends(request):
+    """
+    A view to handle retrieval of a user's daily, weekly or monthly weight rollups.
+    Reads the precomputed buckets only, raw readings are never scanned.
+    """
+    try:
+        query = validateTrendsQuery(request.GET.dict())
+    except BadRequest as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    try:
+        validateTokenUser(request, query["user_id"])
+    except PermissionDenied as e:
+        return JsonResponse({"error": str(e)}, status=403)
+
+    rollups = WeightRollup.objects.filter(user_id=query["user_id"], period=query["period"])
+    if query["date_from"]:
+        rollups = rollups.filter(period_start__gte=query["date_from"])
+    if query["date_to"]:
+        rollups = rollups.filter(period_start__lte=query["date_to"])
+
+    unit = query["unit"]
+    results, previous = [], None
+    for reading_count, total_kg, min_kg, max_kg, period_start in rollups.order_by("period_start").values_list(
+        "reading_count", "total_kg", "min_kg", "max_kg", "period_start"
+    ):
+        average = toUnit(total_kg / reading_count, unit)
+        results.append({
+            "period_start": period_start.isoformat(),
+            "readings": reading_count,
+            "average": str(average),
+            "min": str(toUnit(min_kg, unit)),
+            "max": str(toUnit(max_kg, unit)),
+            "change": str(average - previous) if previous is not None else None,  # Against the previous bucket returned
+        })
+        previous = average
+
+    return JsonResponse({"period": query["period"], "unit": unit, "results": results}, status=200)
+
+def weightExport(request):
+    """
+    A view to handle exporting weight readings as CSV or NDJSON.
+    The body is streamed while the readings are read, so memory stays flat however long the history is.
+    """
+    try:
+        query = validateExportQuery(request.GET.dict())
+    except BadRequest as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    try:
+        validateTokenUser(request, query["user_id"])
+    except PermissionDenied as e:
+        return JsonResponse({"error": str(e)}, status=403)
+
+    readings = exportReadings(query["user_id"], query["date_from"], query["date_to"])
+    response = StreamingHttpResponse(
+        streamExport(readings, query["format"]),
+        content_type=EXPORT_CONTENT_TYPES[query["format"]],
+    )
+    filename = f"weights-{query['user_id']}.{query['format']}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
@@ -1,8 +1,47 @@
 from django.shortcuts import render
-from django.http import JsonResponse
+from django.http import JsonResponse, HttpResponse
 from django.middleware.csrf import get_token
 from django.views.decorators.csrf import ensure_csrf_cookie
+from WeightApp.viewHandling.weightViews import weightIngest, weightHistory, weightTrends, weightExport
 
 @ensure_csrf_cookie
 def get_CSRF_token(request):
-    return JsonResponse({'csrfToken': get_token(request)})    
\ No newline at end of file
+    return JsonResponse({'csrfToken': get_token(request)})    
+
+def weight(request):
+    """
+    A view to handle weight functions.
+    """
+    if request.method == 'POST':
+        return weightIngest(request)
+    elif request.method == 'GET':
+        return weightHistory(request)
+
+    return HttpResponse(
+        content="Method not allowed",
+        content_type="text/plain",
+        status=400)
+
+def weight_trends(request):
+    """
+    A view to handle weight trend rollups.
+    """
+    if request.method == 'GET':
+        return weightTrends(request)
+
+    return HttpResponse(
+        content="Method not allowed",
+        content_type="text/plain",
+        status=400)
+
+def weight_export(request):
+    """
+    A view to handle weight exports.
+    """
+    if request.method == 'GET':
+        return weightExport(request)
+
+    return HttpResponse(
+        content="Method not allowed",
+        content_type="text/plain",
+        status=400)
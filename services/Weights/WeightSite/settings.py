@@ -11,10 +11,21 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 from pathlib import Path
+import os
+import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Code shared by the services (the gymcommon package) lives in services/common.
+# docker-compose mounts it at /common and points GYM_COMMON_DIR there.
+COMMON_DIR = Path(os.environ.get("GYM_COMMON_DIR", BASE_DIR.parent / "common"))
+if str(COMMON_DIR) not in sys.path:
+    sys.path.append(str(COMMON_DIR))
+
+from gymcommon.databaseSettings import postgresDatabase, sqliteDatabase  # noqa: E402  Importable once COMMON_DIR is on sys.path
+from gymcommon.serviceSettings import metricsSettings, serviceTokenSettings, userServiceSettings  # noqa: E402
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
@@ -40,14 +51,17 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'WeightApp',
 ]
 
 MIDDLEWARE = [
+    'gymcommon.metricsMiddleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'gymcommon.tokenMiddleware.ServiceTokenMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -76,13 +90,40 @@ WSGI_APPLICATION = 'WeightSite.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# DATABASE_ENGINE selects the backend: "sqlite" (default) or "postgresql".
+DATABASE_ENGINE = os.environ.get("DATABASE_ENGINE", "sqlite")
+
+# SQLite tuned on every new connection, unless SQLITE_TUNING=0, see services/common/gymcommon/databaseSettings.py
+SQLITE_DATABASE = sqliteDatabase(BASE_DIR / 'db_data/db.sqlite3')
+
+# PostgreSQL, see services/common/gymcommon/databaseSettings.py for the POSTGRES_* variables
+POSTGRES_DATABASE = postgresDatabase("weights")
+
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db_data/db.sqlite3',
-    }
+    'default': POSTGRES_DATABASE if DATABASE_ENGINE == "postgresql" else SQLITE_DATABASE,
 }
 
+# Set WEIGHTS_ONE_READING_PER_DAY=1 to allow one reading per user per day. `migrate` then
+# creates a unique index on (user_id, date_recorded) and a second reading for the same day
+# replaces the first; until it has, readings are inserted as usual. Turning it off again drops the index on the next `migrate`.
+WEIGHTS_ONE_READING_PER_DAY = os.environ.get("WEIGHTS_ONE_READING_PER_DAY", "0") == "1"
+
+
+# Service tokens
+# SERVICE_TOKEN_* and the key file every service must read, see services/common/gymcommon/serviceSettings.py.
+globals().update(serviceTokenSettings(COMMON_DIR))
+# `manage.py test` writes the key file to a temporary directory instead, see services/common/gymcommon/testRunner.py.
+TEST_RUNNER = "gymcommon.testRunner.TestRunner"
+
+# Users service
+# USER_SERVICE_* for reaching the Users service, see services/common/gymcommon/serviceSettings.py.
+globals().update(userServiceSettings())
+
+
+# Request metrics
+# METRICS_* for the per-view request metrics and Server-Timing header, see services/common/gymcommon/serviceSettings.py.
+globals().update(metricsSettings(DEBUG))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -17,8 +17,12 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path
 from WeightApp.views import get_CSRF_token
+from WeightApp.views import weight, weight_trends, weight_export  # Importing weight-related views
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('get_csrf_token/', get_CSRF_token, name='get_csrf_token')
+    path('get_csrf_token/', get_CSRF_token, name='get_csrf_token'),
+    path('weight/', weight, name='weight'),  # URL for weight actions
+    path('weight/trends/', weight_trends, name='weight_trends'),  # URL for weight rollups
+    path('weight/export/', weight_export, name='weight_export'),  # URL for streaming weight exports
     ]
@@ -0,0 +1,58 @@
+"""
+Compares the latency of fetching a page of weight history at increasing depths,
+using OFFSET pagination against the (date_recorded, id) keyset seek used by GET /weight/.
+
+Usage: python -m benchmarks.historyPagination [--readings N] [--limit 50] [--repeat 20]
+"""
+import argparse
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from benchmarks import setupDjango, benchmarkDatabase
+
+
+def timeIt(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readings", type=int, default=100000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setupDjango()
+    from WeightApp.models import Weights
+    from WeightApp.viewHandling.weightViews import HISTORY_FIELDS, seekBefore
+
+    with benchmarkDatabase():
+        start = date(1900, 1, 1)
+        Weights.objects.bulk_create(
+            (Weights(user_id=1, weight_value=Decimal("80.00"), date_recorded=start + timedelta(days=i // 2))
+             for i in range(args.readings)),
+            batch_size=5000,
+        )
+        ordered = Weights.objects.filter(user_id=1).order_by("-date_recorded", "-id")
+
+        print(f"{'depth':>10} {'offset ms':>12} {'keyset ms':>12}")
+        depth = args.limit
+        while depth < args.readings:
+            def offsetPage():
+                list(ordered.values_list(*HISTORY_FIELDS)[depth:depth + args.limit])
+
+            last_id, last_date = ordered.values_list("id", "date_recorded")[depth - 1]
+
+            def keysetPage():
+                list(seekBefore(ordered, last_date, last_id).values_list(*HISTORY_FIELDS)[:args.limit])
+
+            print(f"{depth:>10} {timeIt(offsetPage, args.repeat):>12.2f} {timeIt(keysetPage, args.repeat):>12.2f}")
+            depth *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Reports readings/sec for POST /weight/ with different batch sizes.
+
+Usage: python -m benchmarks.ingestThroughput [--readings N] [--batch-sizes 1 10 100 1000]
+"""
+import argparse
+import json
+import time
+from datetime import date, timedelta
+
+from benchmarks import setupDjango, benchmarkDatabase
+
+
+def makeReadings(count: int, offset: int) -> list:
+    start = date(2020, 1, 1)
+    return [
+        {
+            "user_id": (offset + i) % 500 + 1,
+            "weight": 60 + (i % 400) / 10,
+            "weight_type": "kg",
+            "date_recorded": (start + timedelta(days=(offset + i) // 500)).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readings", type=int, default=5000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    args = parser.parse_args()
+
+    setupDjango()
+    from django.test import Client
+    from WeightApp.models import Weights
+
+    with benchmarkDatabase():
+        client = Client()
+        print(f"{'batch size':>10} {'requests':>10} {'readings/s':>12}")
+        for batch_size in args.batch_sizes:
+            Weights.objects.all().delete()
+            bodies = [
+                json.dumps(makeReadings(batch_size, offset))
+                for offset in range(0, args.readings, batch_size)
+            ]
+
+            started = time.perf_counter()
+            for body in bodies:
+                response = client.post("/weight/", data=body, content_type="application/json")
+                assert response.status_code == 201, response.content
+            elapsed = time.perf_counter() - started
+
+            print(f"{batch_size:>10} {len(bodies):>10} {Weights.objects.count() / elapsed:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Times the vectorised weight analytics against a per-user Python loop.
+
+Builds --readings readings spread over --users users (1M over 10k by default), times
+WeightSeries.load from the database, then every statistic for all users at once.
+The Python baseline runs the same EMA/trend/rate-of-change loop over --baseline-users users
+and is scaled up to the full user count.
+
+Usage: python -m benchmarks.weightAnalytics [--readings N] [--users N] [--skip-load]
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from benchmarks import setupDjango, benchmarkDatabase
+
+
+def makeArrays(readings: int, users: int, seed: int = 1):
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    user_ids = np.sort(rng.integers(1, users + 1, readings))
+    counts = np.bincount(user_ids, minlength=users + 1)[1:]
+    position = np.arange(readings) - np.repeat(np.cumsum(counts) - counts, counts)
+    days = date(2020, 1, 1).toordinal() + position * 2
+    kg = 60 + rng.random(users + 1)[user_ids] * 40 - position * 0.01 + rng.normal(0, 0.4, readings)
+    return user_ids, days, kg
+
+
+def pythonAnalytics(user_ids, days, kg, alpha: float) -> int:
+    """
+    The loop this module replaces: one pass per user over plain Python lists.
+    """
+    series = {}
+    for user_id, day, value in zip(user_ids, days, kg):
+        series.setdefault(user_id, []).append((day, value))
+
+    for points in series.values():
+        smoothed = points[0][1]
+        for _, value in points[1:]:
+            smoothed = alpha * value + (1 - alpha) * smoothed
+        rates = [(b[1] - a[1]) / (b[0] - a[0]) for a, b in zip(points, points[1:]) if b[0] != a[0]]
+        n = len(points)
+        mean_x = sum(p[0] for p in points) / n
+        mean_y = sum(p[1] for p in points) / n
+        sxx = sum((p[0] - mean_x) ** 2 for p in points)
+        slope = sum((p[0] - mean_x) * (p[1] - mean_y) for p in points) / sxx if sxx else None
+    return len(series)
+
+
+def timeIt(fn):
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readings", type=int, default=1000000)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--baseline-users", type=int, default=1000)
+    parser.add_argument("--skip-load", action="store_true", help="Skip inserting into and loading from the database.")
+    args = parser.parse_args()
+
+    setupDjango()
+    from WeightApp.analytics import WeightSeries, DEFAULT_EMA_ALPHA
+    from WeightApp.models import Weights
+
+    user_ids, days, kg = makeArrays(args.readings, args.users)
+    print(f"{args.readings} readings across {args.users} users")
+
+    if args.skip_load:
+        series = WeightSeries(user_ids, days, kg)
+    else:
+        with benchmarkDatabase():
+            started = time.perf_counter()
+            Weights.objects.bulk_create(
+                (Weights(user_id=int(u), weight_value=Decimal(f"{v:.2f}"), date_recorded=date.fromordinal(int(d)))
+                 for u, d, v in zip(user_ids, days, kg)),
+                batch_size=5000,
+            )
+            print(f"{'insert':<24} {time.perf_counter() - started:>9.2f} s")
+
+            elapsed, series = timeIt(WeightSeries.load)
+            print(f"{'WeightSeries.load':<24} {elapsed:>9.2f} s")
+
+    for name, fn in [
+        ("ema", series.ema),
+        ("trend", series.trend),
+        ("rateOfChange", series.rateOfChange),
+        ("outliers", series.outliers),
+        ("summary", series.summary),
+    ]:
+        elapsed, _ = timeIt(fn)
+        print(f"{name:<24} {elapsed:>9.3f} s")
+
+    keep = set(random.Random(1).sample(range(1, args.users + 1), min(args.baseline_users, args.users)))
+    mask = [int(u) in keep for u in user_ids]
+    subset = [column[mask].tolist() for column in (user_ids, days, kg)]
+    elapsed, covered = timeIt(lambda: pythonAnalytics(*subset, DEFAULT_EMA_ALPHA))
+    print(f"{'python loop (scaled)':<24} {elapsed * args.users / max(covered, 1):>9.3f} s  (ema, trend, rate of change only)")
+
+
+if __name__ == "__main__":
+    main()
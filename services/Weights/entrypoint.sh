@@ -0,0 +1,18 @@
+#!/bin/sh
+# Starts the service in the mode selected by SERVER_MODE:
+#   dev  - Django's development server (default)
+#   wsgi - gunicorn running WeightSite.wsgi
+#   asgi - gunicorn with uvicorn workers running WeightSite.asgi
+set -e
+
+case "${SERVER_MODE:-dev}" in
+    wsgi)
+        exec gunicorn WeightSite.wsgi:application -c gunicorn.conf.py
+        ;;
+    asgi)
+        exec gunicorn WeightSite.asgi:application -c gunicorn.conf.py
+        ;;
+    *)
+        exec python3 manage.py runserver 0.0.0.0:${PORT:-8001}
+        ;;
+esac
@@ -1,3 +1,15 @@
 from django.contrib import admin
 
-# Register your models here.
+from WorkoutApp.models import Exercise, ExerciseAlias
+
+
+class ExerciseAliasInline(admin.TabularInline):
+    model = ExerciseAlias
+    extra = 1
+
+
+@admin.register(Exercise)
+class ExerciseAdmin(admin.ModelAdmin):
+    list_display = ("name", "category")
+    search_fields = ("name", "aliases__alias")
+    inlines = [ExerciseAliasInline]
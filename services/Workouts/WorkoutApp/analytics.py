@@ -0,0 +1,203 @@
+import math
+from array import array
+from datetime import date, timedelta
+
+import numpy as np
+from django.db.models import FloatField
+from django.db.models.functions import Cast
+
+from WorkoutApp.models import WorkoutSet
+
+CHRONIC_WEEKS = 4
+BRZYCKI_MAX_REPS = 36  # The formula divides by 37 - reps
+
+
+def weekStart(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+class TrainingSeries:
+    """
+    Logged sets held as compact NumPy arrays, sorted by user then day.
+    Metrics are computed for every user and exercise at once from these arrays.
+    """
+
+    def __init__(self, user_ids, exercise_ids, days, reps, weight_kg):
+        self.user_ids = np.asarray(user_ids, dtype=np.int32)
+        self.exercise_ids = np.asarray(exercise_ids, dtype=np.int16)
+        self.days = np.asarray(days, dtype=np.int32)  # Proleptic ordinals, see date.toordinal
+        self.reps = np.asarray(reps, dtype=np.int16)
+        self.weight_kg = np.asarray(weight_kg, dtype=np.float32)
+
+    @classmethod
+    def load(cls, sets=None, chunk_size: int = 10000):
+        """
+        Loads sets, a WorkoutSet queryset defaulting to every set, with one values_list query.
+        Rows are streamed into typed arrays, no model instances or Decimals are built.
+        """
+        sets = WorkoutSet.objects.all() if sets is None else sets
+        rows = (
+            sets.order_by("user_id", "workout__started_at", "id")
+            .annotate(weight=Cast("weight_kg", FloatField()))
+            .values_list("user_id", "exercise_id", "workout__started_at", "reps", "weight")
+        )
+
+        user_ids, exercise_ids, days, reps, weight_kg = array("i"), array("h"), array("i"), array("h"), array("f")
+        for user_id, exercise_id, started_at, set_reps, weight in rows.iterator(chunk_size=chunk_size):
+            user_ids.append(user_id)
+            exercise_ids.append(exercise_id)
+            days.append(started_at.date().toordinal())
+            reps.append(set_reps)
+            weight_kg.append(weight)
+
+        return cls(user_ids, exercise_ids, days, reps, weight_kg)
+
+    def __len__(self) -> int:
+        return len(self.reps)
+
+    #PER-SET METRICS
+    def tonnage(self) -> np.ndarray:
+        return self.weight_kg.astype(np.float64) * self.reps
+
+    def epley(self) -> np.ndarray:
+        """
+        Epley 1RM estimate of every set, weight x (1 + reps / 30). A single rep is its own 1RM.
+        """
+        weight = self.weight_kg.astype(np.float64)
+        return np.where(self.reps == 1, weight, weight * (1 + self.reps / 30))
+
+    def brzycki(self) -> np.ndarray:
+        """
+        Brzycki 1RM estimate of every set, weight x 36 / (37 - reps). NaN past 36 reps.
+        """
+        weight = self.weight_kg.astype(np.float64)
+        valid = self.reps <= BRZYCKI_MAX_REPS
+        estimate = np.full(len(weight), np.nan)
+        estimate[valid] = weight[valid] * 36 / (37 - self.reps[valid])
+        return estimate
+
+    def weekStarts(self) -> np.ndarray:
+        return self.days - (self.days - 1) % 7  # Ordinal 1 is a Monday
+
+    #GROUPED METRICS
+    def weeklyTonnage(self):
+        """
+        Returns (user_ids, week_starts, tonnage) with one entry per user and week that has sets.
+        Sets are already ordered by user and day, so groups are contiguous and no sort is needed.
+        """
+        if not len(self):
+            return np.zeros(0, np.int32), np.zeros(0, np.int32), np.zeros(0)
+
+        weeks = self.weekStarts()
+        changed = (np.diff(self.user_ids) != 0) | (np.diff(weeks) != 0)
+        starts = np.concatenate(([0], np.flatnonzero(changed) + 1))
+        return self.user_ids[starts], weeks[starts], np.add.reduceat(self.tonnage(), starts)
+
+    def bestOneRepMax(self, mask=None):
+        """
+        Returns (user_ids, exercise_ids, best Epley, best Brzycki, sets, tonnage)
+        per user and exercise, optionally over the sets selected by mask.
+        """
+        index = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        keys = self.user_ids[index].astype(np.int64) << 16 | self.exercise_ids[index].astype(np.int64)
+        order = np.argsort(keys, kind="stable")
+        index, keys = index[order], keys[order]
+        if not len(keys):
+            empty = np.zeros(0)
+            return np.zeros(0, np.int32), np.zeros(0, np.int16), empty, empty, np.zeros(0, np.int64), empty
+
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(keys)) + 1))
+        groups = keys[starts]
+        return (
+            (groups >> 16).astype(np.int32),
+            (groups & 0xFFFF).astype(np.int16),
+            np.maximum.reduceat(self.epley()[index], starts),
+            np.fmax.reduceat(self.brzycki()[index], starts),  # fmax skips the NaN of sets past 36 reps
+            np.diff(np.append(starts, len(keys))),
+            np.add.reduceat(self.tonnage()[index], starts),
+        )
+
+    def select(self, mask) -> "TrainingSeries":
+        return TrainingSeries(self.user_ids[mask], self.exercise_ids[mask], self.days[mask], self.reps[mask], self.weight_kg[mask])
+
+    def workloadRatios(self, chronic_weeks: int = CHRONIC_WEEKS):
+        """
+        Acute:chronic workload ratio of every user for every week between the first and last set.
+        Acute load is the week's tonnage, chronic load the mean over the chronic_weeks ending with it,
+        or over the weeks since the user's first set while they have fewer.
+        Returns (user_ids, week_starts, ratios) where ratios is a users x weeks matrix, NaN without chronic load.
+        """
+        users, weeks, tonnage = self.weeklyTonnage()
+        if not len(users):
+            return users, weeks, np.zeros((0, 0))
+
+        user_ids, user_index = np.unique(users, return_inverse=True)
+        first_week = weeks.min()
+        week_starts = np.arange(first_week, weeks.max() + 1, 7, dtype=np.int32)
+
+        load = np.zeros((len(user_ids), len(week_starts)))
+        load[user_index, (weeks - first_week) // 7] = tonnage
+
+        window = np.cumsum(load, axis=1)
+        window[:, chronic_weeks:] -= window[:, :-chronic_weeks].copy()
+        first_column = np.argmax(load > 0, axis=1)  # Users only appear here with at least one week of tonnage
+        history = np.arange(len(week_starts)) - first_column[:, None] + 1
+        chronic = window / np.clip(history, 1, chronic_weeks)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(chronic > 0, load / chronic, np.nan)
+        return user_ids, week_starts, ratios
+
+
+def historyWeeks(series: TrainingSeries, user_ids, week_start: int, chronic_weeks: int, earlier_user_ids=()) -> np.ndarray:
+    """
+    Returns how many of the chronic_weeks ending with the week starting on week_start each user had trained by,
+    counting from the week of their first set in series.
+    """
+    series_users, first_sets = np.unique(series.user_ids, return_index=True)  # Sets are sorted by user then day
+    first_days = series.days[first_sets][np.searchsorted(series_users, user_ids)]
+    first_weeks = first_days - (first_days - 1) % 7
+    weeks = np.clip((week_start - first_weeks) // 7 + 1, 1, chronic_weeks)
+    weeks[np.isin(user_ids, list(earlier_user_ids))] = chronic_weeks
+    return weeks
+
+
+def summariseWeek(series: TrainingSeries, week: date, chronic_weeks: int = CHRONIC_WEEKS, earlier_user_ids=()) -> dict:
+    """
+    Builds the weekly summary of every user with sets in the chronic_weeks ending with the week starting on week.
+    Chronic load is averaged over the weeks since the user's first set in series, at most chronic_weeks;
+    earlier_user_ids lists the users known to have sets before series starts, whose window is always full.
+    """
+    start = week.toordinal()
+    window_start = start - 7 * (chronic_weeks - 1)
+    window = series.select((series.days >= window_start) & (series.days < start + 7))
+    in_week = window.days >= start
+
+    user_ids, user_index = np.unique(window.user_ids, return_inverse=True)
+    tonnage = window.tonnage()
+    acute = np.bincount(user_index, weights=np.where(in_week, tonnage, 0), minlength=len(user_ids))
+    chronic = np.bincount(user_index, weights=tonnage, minlength=len(user_ids)) / historyWeeks(series, user_ids, start, chronic_weeks, earlier_user_ids)
+    set_counts = np.bincount(user_index[in_week], minlength=len(user_ids))
+
+    summaries = {
+        user_id: {
+            "user_id": user_id,
+            "week_start": week.isoformat(),
+            "sets": sets,
+            "tonnage_kg": round(week_tonnage, 2),
+            "acwr": round(week_tonnage / chronic_load, 3) if chronic_load > 0 else None,
+            "exercises": [],
+        }
+        # tolist() turns each column into Python numbers at once, far cheaper than converting scalars one by one
+        for user_id, sets, week_tonnage, chronic_load in zip(user_ids.tolist(), set_counts.tolist(), acute.tolist(), chronic.tolist())
+    }
+
+    columns = (column.tolist() for column in window.bestOneRepMax(in_week))
+    for user_id, exercise_id, epley, brzycki, sets, exercise_tonnage in zip(*columns):
+        summaries[user_id]["exercises"].append({
+            "exercise_id": exercise_id,
+            "sets": sets,
+            "tonnage_kg": round(exercise_tonnage, 2),
+            "epley_1rm_kg": round(epley, 2),
+            "brzycki_1rm_kg": None if math.isnan(brzycki) else round(brzycki, 2),
+        })
+    return summaries
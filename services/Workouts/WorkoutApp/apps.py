@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class WorkoutappConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'WorkoutApp'
+
+    def ready(self):
+        from WorkoutApp import signals  # noqa: F401  Connects the catalogue version receivers
@@ -0,0 +1,169 @@
+import re
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import F
+
+from WorkoutApp.models import CatalogueVersion, Exercise, ExerciseAlias
+
+MAX_SUGGESTIONS = 20
+
+# Match kinds, best first: the name starts with the query, an alias does, a later word of the name does
+NAME_MATCH, ALIAS_MATCH, WORD_MATCH = 0, 1, 2
+
+
+def normalise(text: str) -> str:
+    """
+    Lowercases text and reduces it to words separated by single spaces, so "Back-Squat " matches "back squat".
+    """
+    return " ".join(re.findall(r"[^\W_]+", text.casefold()))
+
+
+class PrefixIndex:
+    """
+    A character trie over exercise names and aliases. Every node keeps the ids of the best
+    MAX_SUGGESTIONS exercises below it, so a lookup is one walk down the query's characters.
+    """
+
+    def __init__(self):
+        self.root = ({}, {})  # (children, {exercise id: best rank}) while building
+
+    def add(self, term: str, exercise_id: int, rank: tuple) -> None:
+        node = self.root
+        for char in term:
+            node = node[0].setdefault(char, ({}, {}))
+            current = node[1].get(exercise_id)
+            if current is None or rank < current:
+                node[1][exercise_id] = rank
+
+    def freeze(self) -> None:
+        """
+        Replaces every node's candidates by its top MAX_SUGGESTIONS ids, in rank order.
+        """
+        stack = [self.root]
+        while stack:
+            children, candidates = stack.pop()
+            stack.extend(children.values())
+            ranked = sorted(candidates, key=candidates.get)[:MAX_SUGGESTIONS]
+            candidates.clear()
+            candidates.update(dict.fromkeys(ranked))
+
+    def search(self, query: str, limit: int) -> list:
+        node = self.root
+        for char in query:
+            node = node[0].get(char)
+            if node is None:
+                return []
+        return list(node[1])[:limit]
+
+
+class ExerciseCatalogue:
+    """
+    An immutable snapshot of every exercise with its aliases, and a prefix index over them.
+    """
+
+    def __init__(self, version: int, exercises, aliases):
+        self.version = version
+        self.exercises = {
+            exercise_id: {"id": exercise_id, "name": name, "category": category, "aliases": []}
+            for exercise_id, name, category in exercises
+        }
+        for exercise_id, alias in aliases:
+            self.exercises[exercise_id]["aliases"].append(alias)
+
+        self.index = PrefixIndex()
+        for exercise in self.exercises.values():
+            name = normalise(exercise["name"])
+            order = (name, exercise["id"])
+            self.index.add(name, exercise["id"], (NAME_MATCH, *order))
+            for alias in exercise["aliases"]:
+                self.index.add(normalise(alias), exercise["id"], (ALIAS_MATCH, *order))
+            for match in re.finditer(r" ", name):
+                self.index.add(name[match.end():], exercise["id"], (WORD_MATCH, *order))
+        self.index.freeze()
+
+    @classmethod
+    def load(cls, version: int):
+        return cls(
+            version,
+            Exercise.objects.values_list("id", "name", "category"),
+            ExerciseAlias.objects.order_by("alias").values_list("exercise_id", "alias"),
+        )
+
+    def __contains__(self, exercise_id) -> bool:
+        return exercise_id in self.exercises
+
+    def get(self, exercise_id):
+        return self.exercises.get(exercise_id)
+
+    def search(self, query: str, limit: int = 10) -> list:
+        query = normalise(query)
+        if not query:
+            return []
+        return [self.exercises[exercise_id] for exercise_id in self.index.search(query, limit)]
+
+
+#VERSIONING
+def currentVersion() -> int:
+    return CatalogueVersion.objects.values_list("version", flat=True).first() or 0
+
+def bumpCatalogueVersion() -> None:
+    """
+    Records a change to the catalogue. Call it after bulk_create, update() or raw SQL on
+    Exercise or ExerciseAlias; saves and deletes through the ORM call it from signals.
+    """
+    if not CatalogueVersion.objects.filter(pk=1).update(version=F("version") + 1):
+        _, created = CatalogueVersion.objects.get_or_create(pk=1, defaults={"version": 1})
+        if not created:  # Another worker created the row first
+            CatalogueVersion.objects.filter(pk=1).update(version=F("version") + 1)
+    markCatalogueStale()  # This worker need not wait for its next version check
+
+
+#IN-PROCESS CACHE
+class _CatalogueState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.catalogue = None
+        self.checked_at = 0.0
+        self.stale = True
+
+
+_state = _CatalogueState()
+
+
+def getCatalogue() -> ExerciseCatalogue:
+    """
+    Returns this worker's catalogue, loading it on first use. At most once every
+    EXERCISE_CATALOGUE_CHECK_SECONDS the stored version is read, one single-row query,
+    and the catalogue is reloaded only if another worker has bumped it. Every other call is a dictionary read.
+    """
+    interval = getattr(settings, "EXERCISE_CATALOGUE_CHECK_SECONDS", 5)
+    catalogue = _state.catalogue
+    if catalogue is not None and not _state.stale and time.monotonic() - _state.checked_at < interval:
+        return catalogue
+
+    with _state.lock:
+        if _state.catalogue is not None and _state.catalogue is not catalogue:
+            return _state.catalogue  # Another thread refreshed it while this one waited
+
+        version = currentVersion()
+        if catalogue is None or _state.stale or version != catalogue.version:
+            _state.stale = False
+            catalogue = ExerciseCatalogue.load(version)
+            _state.catalogue = catalogue
+        _state.checked_at = time.monotonic()
+        return catalogue
+
+def markCatalogueStale() -> None:
+    """
+    Makes the next getCatalogue() in this worker reload, without bumping the version for the others.
+    """
+    _state.stale = True
+
+def clearCatalogue() -> None:
+    """
+    Drops this worker's catalogue so the next getCatalogue() reloads it.
+    """
+    with _state.lock:
+        _state.catalogue = None
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from WorkoutApp.records import rebuildRecords
+
+
+class Command(BaseCommand):
+    help = "Recomputes personal records and rep maxes from every logged set."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user-id", type=int, help="Only rebuild the records of this user.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of records per bulk INSERT.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            written = rebuildRecords(user_id=options["user_id"], batch_size=max(1, options["batch_size"]))
+
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} personal records."))
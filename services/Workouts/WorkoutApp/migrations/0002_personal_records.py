@@ -0,0 +1,42 @@
+# Generated by Django 5.2.5 on 2026-10-18 04:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('WorkoutApp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PersonalRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user_id', models.IntegerField()),
+                ('best_e1rm_kg', models.DecimalField(decimal_places=2, max_digits=7)),
+                ('best_volume_kg', models.DecimalField(decimal_places=2, max_digits=9)),
+                ('heaviest_kg', models.DecimalField(decimal_places=2, max_digits=6)),
+                ('exercise', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='WorkoutApp.exercise')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user_id', 'exercise'), name='unique_record_per_user_exercise')],
+            },
+        ),
+        migrations.CreateModel(
+            name='RepRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user_id', models.IntegerField()),
+                ('weight_kg', models.DecimalField(decimal_places=2, max_digits=6)),
+                ('reps', models.PositiveSmallIntegerField()),
+                ('exercise', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='WorkoutApp.exercise')),
+            ],
+            options={
+                'ordering': ['user_id', 'exercise', 'weight_kg'],
+                'constraints': [models.UniqueConstraint(fields=('user_id', 'exercise', 'weight_kg'), name='unique_rep_record_per_weight')],
+            },
+        ),
+    ]
@@ -1,3 +1,72 @@
 from django.db import models
+from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
+class Exercise(models.Model):
+    id = models.SmallAutoField(primary_key=True)  # A small catalogue, so every set stores a 2-byte key
+    name = models.CharField(max_length=100, unique=True)
+    category = models.CharField(max_length=50, blank=True)
+    class Meta:
+        ordering = ["name"]
 
-# Create your models here.
+class ExerciseAlias(models.Model):
+    """
+    Another name an exercise can be searched by, e.g. "RDL" for Romanian Deadlift.
+    """
+    exercise = models.ForeignKey(Exercise, on_delete=models.CASCADE, related_name="aliases")
+    alias = models.CharField(max_length=100, unique=True)
+    class Meta:
+        ordering = ["alias"]
+
+class CatalogueVersion(models.Model):
+    """
+    A single row counting changes to the exercise catalogue, so every worker can tell when its copy is stale.
+    """
+    version = models.PositiveBigIntegerField(default=0)
+
+class Workout(models.Model):
+    user_id = models.IntegerField()
+    started_at = models.DateTimeField(default=timezone.now)
+    ended_at = models.DateTimeField(null=True, blank=True)
+    note = models.CharField(max_length=255, blank=True)
+    class Meta:
+        ordering = ["-started_at"]
+        indexes = [
+            # Latest sessions for a user: seek on user_id and read started_at newest first
+            models.Index(fields=["user_id", "-started_at"], name="workout_user_latest_idx"),
+        ]
+
+class WorkoutSet(models.Model):
+    workout = models.ForeignKey(Workout, on_delete=models.CASCADE, related_name="sets")
+    exercise = models.ForeignKey(Exercise, on_delete=models.PROTECT, related_name="sets")
+    user_id = models.IntegerField()  # Copied from the workout so per-user queries skip the join
+    set_number = models.PositiveSmallIntegerField()
+    reps = models.PositiveSmallIntegerField(validators=[MinValueValidator(1), MaxValueValidator(1000)])
+    weight_kg = models.DecimalField(max_digits=6, decimal_places=2, validators=[MinValueValidator(0), MaxValueValidator(1000)])
+    class Meta:
+        ordering = ["workout", "set_number"]
+        constraints = [models.UniqueConstraint(fields=["workout", "set_number"], name="unique_set_number_per_workout")]
+        indexes = [models.Index(fields=["user_id", "exercise"], name="set_user_exercise_idx")]
+
+class PersonalRecord(models.Model):
+    """
+    A user's bests for one exercise, kept up to date by WorkoutApp.records as sets are logged.
+    """
+    user_id = models.IntegerField()
+    exercise = models.ForeignKey(Exercise, on_delete=models.PROTECT, related_name="+")
+    best_e1rm_kg = models.DecimalField(max_digits=7, decimal_places=2)  # Epley estimate from a single set
+    best_volume_kg = models.DecimalField(max_digits=9, decimal_places=2)  # Weight x reps of a single set
+    heaviest_kg = models.DecimalField(max_digits=6, decimal_places=2)
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["user_id", "exercise"], name="unique_record_per_user_exercise")]
+
+class RepRecord(models.Model):
+    """
+    The most reps a user has done at one weight of an exercise.
+    """
+    user_id = models.IntegerField()
+    exercise = models.ForeignKey(Exercise, on_delete=models.PROTECT, related_name="+")
+    weight_kg = models.DecimalField(max_digits=6, decimal_places=2)
+    reps = models.PositiveSmallIntegerField()
+    class Meta:
+        ordering = ["user_id", "exercise", "weight_kg"]
+        constraints = [models.UniqueConstraint(fields=["user_id", "exercise", "weight_kg"], name="unique_rep_record_per_weight")]
@@ -0,0 +1,201 @@
+from decimal import Decimal
+
+from django.db import connection
+
+from WorkoutApp.models import PersonalRecord, RepRecord, WorkoutSet
+
+RECORD_FIELDS = ("best_e1rm_kg", "best_volume_kg", "heaviest_kg")
+TWO_PLACES = Decimal("0.01")
+
+
+def estimateOneRepMax(weight_kg: Decimal, reps: int) -> Decimal:
+    """
+    Epley estimate, weight x (1 + reps / 30). A single rep is its own 1RM.
+    """
+    if reps == 1:
+        return weight_kg
+    return (weight_kg * (1 + Decimal(reps) / 30)).quantize(TWO_PLACES)
+
+def bestsFromSets(sets):
+    """
+    Reduces (exercise_id, reps, weight_kg) tuples to the bests they contain.
+    Returns ({exercise_id: {record field: value}}, {(exercise_id, weight_kg): reps}).
+    """
+    records, rep_maxes = {}, {}
+    for exercise_id, reps, weight_kg in sets:
+        candidate = {
+            "best_e1rm_kg": estimateOneRepMax(weight_kg, reps),
+            "best_volume_kg": (weight_kg * reps).quantize(TWO_PLACES),
+            "heaviest_kg": weight_kg,
+        }
+        best = records.setdefault(exercise_id, candidate)
+        for field in RECORD_FIELDS:
+            best[field] = max(best[field], candidate[field])
+
+        key = (exercise_id, weight_kg)
+        rep_maxes[key] = max(rep_maxes.get(key, 0), reps)
+    return records, rep_maxes
+
+
+#INCREMENTAL MAINTENANCE
+def mergeRecords(user_id: int, records: dict) -> list:
+    """
+    Returns the PersonalRecord rows that the new bests create or improve.
+    """
+    existing = {
+        record.exercise_id: record
+        for record in PersonalRecord.objects.select_for_update().filter(user_id=user_id, exercise_id__in=records)
+    }
+
+    changed = []
+    for exercise_id, best in records.items():
+        current = existing.get(exercise_id)
+        if current is not None:
+            if all(best[field] <= getattr(current, field) for field in RECORD_FIELDS):
+                continue
+            best = {field: max(best[field], getattr(current, field)) for field in RECORD_FIELDS}
+        changed.append(PersonalRecord(user_id=user_id, exercise_id=exercise_id, **best))
+    return changed
+
+def mergeRepMaxes(user_id: int, rep_maxes: dict) -> list:
+    """
+    Returns the RepRecord rows that the new rep counts create or improve.
+    """
+    exercise_ids = {exercise_id for exercise_id, _ in rep_maxes}
+    weights = {weight_kg for _, weight_kg in rep_maxes}
+    existing = {
+        (exercise_id, weight_kg): reps
+        for exercise_id, weight_kg, reps in RepRecord.objects.select_for_update()
+        .filter(user_id=user_id, exercise_id__in=exercise_ids, weight_kg__in=weights)
+        .values_list("exercise_id", "weight_kg", "reps")
+    }
+
+    return [
+        RepRecord(user_id=user_id, exercise_id=exercise_id, weight_kg=weight_kg, reps=reps)
+        for (exercise_id, weight_kg), reps in rep_maxes.items()
+        if reps > existing.get((exercise_id, weight_kg), 0)
+    ]
+
+def upsertBests(model, rows: list, unique_fields: tuple, best_fields: tuple) -> None:
+    """
+    Inserts the rows, or raises the stored values to theirs, in one INSERT ... ON CONFLICT DO UPDATE.
+    A stored value is never lowered, so a session that committed first with a better set keeps it
+    even though the read in mergeRecords could not lock a row that did not exist yet.
+    """
+    fields = [model._meta.get_field(name) for name in unique_fields + best_fields]
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    greatest = "GREATEST" if connection.vendor == "postgresql" else "MAX"  # SQLite's MAX with two arguments is scalar
+    row_sql = f"({', '.join(['%s'] * len(fields))})"
+    updates = ", ".join(
+        f"{quote(field.column)} = {greatest}({table}.{quote(field.column)}, EXCLUDED.{quote(field.column)})"
+        for field in fields[len(unique_fields):]
+    )
+    sql = (
+        f"INSERT INTO {table} ({', '.join(quote(field.column) for field in fields)}) "
+        f"VALUES {', '.join([row_sql] * len(rows))} "
+        f"ON CONFLICT ({', '.join(quote(field.column) for field in fields[:len(unique_fields)])}) DO UPDATE SET {updates}"
+    )
+    params = [field.get_db_prep_save(getattr(row, field.attname), connection) for row in rows for field in fields]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+def saveRecords(records: list, rep_records: list) -> None:
+    if records:
+        upsertBests(PersonalRecord, records, ("user_id", "exercise"), RECORD_FIELDS)
+    if rep_records:
+        upsertBests(RepRecord, rep_records, ("user_id", "exercise", "weight_kg"), ("reps",))
+
+def updateRecords(user_id: int, sets) -> None:
+    """
+    Folds newly logged sets, (exercise_id, reps, weight_kg) tuples, into the user's records.
+    Only the exercises and weights in the sets are read, never the user's set history.
+    Must run inside the transaction that inserts the sets.
+    """
+    records, rep_maxes = bestsFromSets(sets)
+    if not records:
+        return
+    saveRecords(mergeRecords(user_id, records), mergeRepMaxes(user_id, rep_maxes))
+
+
+#REBUILD
+def rebuildRecords(user_id=None, batch_size: int = 1000) -> int:
+    """
+    Drops and recomputes every record, or only those of one user, from the logged sets.
+    Sets are streamed in user order so only one user's bests are held at a time.
+    Returns the number of PersonalRecord rows written.
+    """
+    sets = WorkoutSet.objects.all()
+    records = PersonalRecord.objects.all()
+    rep_records = RepRecord.objects.all()
+    if user_id is not None:
+        sets = sets.filter(user_id=user_id)
+        records = records.filter(user_id=user_id)
+        rep_records = rep_records.filter(user_id=user_id)
+    records.delete()
+    rep_records.delete()
+
+    written = 0
+    pending_records, pending_rep_records = [], []
+
+    def addUser(current_user, user_sets):
+        user_records, user_rep_maxes = bestsFromSets(user_sets)
+        pending_records.extend(
+            PersonalRecord(user_id=current_user, exercise_id=exercise_id, **best) for exercise_id, best in user_records.items()
+        )
+        pending_rep_records.extend(
+            RepRecord(user_id=current_user, exercise_id=exercise_id, weight_kg=weight_kg, reps=reps)
+            for (exercise_id, weight_kg), reps in user_rep_maxes.items()
+        )
+
+    def flush():
+        PersonalRecord.objects.bulk_create(pending_records, batch_size=batch_size)
+        RepRecord.objects.bulk_create(pending_rep_records, batch_size=batch_size)
+        count = len(pending_records)
+        pending_records.clear()
+        pending_rep_records.clear()
+        return count
+
+    current_user, user_sets = None, []
+    rows = sets.order_by("user_id", "exercise_id").values_list("user_id", "exercise_id", "reps", "weight_kg")
+    for set_user_id, exercise_id, reps, weight_kg in rows.iterator(chunk_size=batch_size):
+        if set_user_id != current_user:
+            if user_sets:
+                addUser(current_user, user_sets)
+            current_user, user_sets = set_user_id, []
+            if len(pending_records) >= batch_size:
+                written += flush()
+        user_sets.append((exercise_id, reps, weight_kg))
+    if user_sets:
+        addUser(current_user, user_sets)
+    return written + flush()
+
+
+#READS
+def readRecords(user_id: int, exercise_id=None) -> list:
+    """
+    Returns the user's records, for one exercise or all of them, each with its rep maxes by weight.
+    Two indexed lookups whatever the size of the user's set history.
+    """
+    records = PersonalRecord.objects.filter(user_id=user_id)
+    rep_records = RepRecord.objects.filter(user_id=user_id)
+    if exercise_id is not None:
+        records = records.filter(exercise_id=exercise_id)
+        rep_records = rep_records.filter(exercise_id=exercise_id)
+
+    rep_maxes = {}
+    for record_exercise_id, weight_kg, reps in rep_records.order_by("exercise_id", "weight_kg").values_list("exercise_id", "weight_kg", "reps"):
+        rep_maxes.setdefault(record_exercise_id, []).append({"weight_kg": str(weight_kg), "reps": reps})
+
+    return [
+        {
+            "exercise_id": record_exercise_id,
+            "best_e1rm_kg": str(best_e1rm_kg),
+            "best_volume_kg": str(best_volume_kg),
+            "heaviest_kg": str(heaviest_kg),
+            "rep_maxes": rep_maxes.get(record_exercise_id, []),
+        }
+        for record_exercise_id, best_e1rm_kg, best_volume_kg, heaviest_kg in records.order_by("exercise_id").values_list(
+            "exercise_id", *RECORD_FIELDS
+        )
+    ]
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from WorkoutApp.catalogue import bumpCatalogueVersion
+from WorkoutApp.models import Exercise, ExerciseAlias
+
+
+@receiver(post_save, sender=Exercise)
+@receiver(post_delete, sender=Exercise)
+@receiver(post_save, sender=ExerciseAlias)
+@receiver(post_delete, sender=ExerciseAlias)
+def bumpCatalogueOnChange(sender, **kwargs):
+    bumpCatalogueVersion()
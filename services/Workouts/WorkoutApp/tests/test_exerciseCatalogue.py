@@ -0,0 +1,159 @@
+import json
+
+from django.db.models import F
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, Client, override_settings
+from django.urls import reverse
+
+from WorkoutApp.catalogue import ExerciseCatalogue, clearCatalogue, getCatalogue, normalise
+from WorkoutApp.models import CatalogueVersion, Exercise, ExerciseAlias
+from WorkoutApp.viewHandling import viewHandlingConstants as V
+
+
+class ExerciseCatalogueTests(TestCase):
+    def setUp(self):
+        self.catalogue = ExerciseCatalogue(1, [
+            (1, "Back Squat", "legs"),
+            (2, "Bench Press", "chest"),
+            (3, "Romanian Deadlift", "legs"),
+            (4, "Squat Jump", "legs"),
+            (5, "Bent-Over Row", "back"),
+        ], [(3, "RDL"), (2, "Flat Bench")])
+
+    def names(self, query, limit=10):
+        return [exercise["name"] for exercise in self.catalogue.search(query, limit)]
+
+    def test_normalise(self):
+        self.assertEqual(normalise("  Bent-Over   ROW "), "bent over row")
+
+    def test_name_prefix(self):
+        self.assertEqual(self.names("be"), ["Bench Press", "Bent-Over Row"])
+        self.assertEqual(self.names("BENT-o"), ["Bent-Over Row"])
+
+    def test_alias_prefix(self):
+        self.assertEqual(self.names("rd"), ["Romanian Deadlift"])
+        self.assertEqual(self.names("flat"), ["Bench Press"])
+
+    def test_name_matches_rank_before_later_words(self):
+        self.assertEqual(self.names("squat"), ["Squat Jump", "Back Squat"])
+        self.assertEqual(self.names("dead"), ["Romanian Deadlift"])
+
+    def test_limit_and_misses(self):
+        self.assertEqual(self.names("b", limit=1), ["Back Squat"])
+        self.assertEqual(self.names("curl"), [])
+        self.assertEqual(self.names("  - "), [])
+
+    def test_aliases_are_returned(self):
+        self.assertEqual(self.catalogue.get(3)["aliases"], ["RDL"])
+        self.assertIn(5, self.catalogue)
+        self.assertNotIn(6, self.catalogue)
+
+
+class CatalogueCacheTests(TestCase):
+    def setUp(self):
+        self.squat = Exercise.objects.create(name="Back Squat", category="legs")
+        ExerciseAlias.objects.create(exercise=self.squat, alias="Squat")
+        clearCatalogue()
+
+    def test_loaded_once_per_worker(self):
+        with self.assertNumQueries(3):  # Version, exercises, aliases
+            catalogue = getCatalogue()
+        with self.assertNumQueries(0):
+            self.assertIs(getCatalogue(), catalogue)
+
+    def test_local_changes_reload(self):
+        getCatalogue()
+        Exercise.objects.create(name="Bench Press")
+
+        self.assertEqual([e["name"] for e in getCatalogue().search("ben")], ["Bench Press"])
+
+    def test_version_bump_from_another_worker(self):
+        catalogue = getCatalogue()
+        Exercise.objects.bulk_create([Exercise(name="Deadlift")])  # No signals, as if another worker had written it
+        CatalogueVersion.objects.update(version=F("version") + 1)
+
+        self.assertIs(getCatalogue(), catalogue)  # Not checked again until the interval passes
+        with override_settings(EXERCISE_CATALOGUE_CHECK_SECONDS=0):
+            self.assertEqual(getCatalogue().search("dead")[0]["name"], "Deadlift")
+
+    def test_unchanged_version_keeps_catalogue(self):
+        catalogue = getCatalogue()
+        with override_settings(EXERCISE_CATALOGUE_CHECK_SECONDS=0), self.assertNumQueries(1):
+            self.assertIs(getCatalogue(), catalogue)
+
+    def test_logging_accepts_exercises_newer_than_the_catalogue(self):
+        getCatalogue()
+        deadlift = Exercise.objects.bulk_create([Exercise(name="Deadlift")])[0]
+
+        response = Client().post(reverse("workout"), data=json.dumps({
+            "user_id": 1, "sets": [{"exercise_id": deadlift.id, "reps": 5, "weight": 140}],
+        }), content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+        self.assertIn(deadlift.id, getCatalogue())
+
+
+class DeletedExerciseTests(TransactionTestCase):
+    """
+    Foreign keys are checked when the transaction commits, which a TestCase never does.
+    """
+
+    def test_exercise_deleted_since_the_catalogue_loaded(self):
+        squat = Exercise.objects.create(name="Back Squat")
+        bench = Exercise.objects.create(name="Bench Press")
+        clearCatalogue()
+        getCatalogue()
+        with connection.cursor() as cursor:  # No signals, as if another worker had deleted it
+            cursor.execute('DELETE FROM "WorkoutApp_exercise" WHERE id = %s', [bench.id])
+
+        response = Client().post(reverse("workout"), data=json.dumps({"user_id": 1, "sets": [
+            {"exercise_id": squat.id, "reps": 5, "weight": 100},
+            {"exercise_id": bench.id, "reps": 5, "weight": 80},
+        ]}), content_type="application/json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": V.UNKNOWN_EXERCISE, "set": 1})
+        self.assertNotIn(bench.id, getCatalogue())
+
+
+class ExerciseSearchViewTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("exercise")
+        squat = Exercise.objects.create(name="Back Squat", category="legs")
+        Exercise.objects.create(name="Bench Press", category="chest")
+        ExerciseAlias.objects.create(exercise=squat, alias="Squat")
+        getCatalogue()
+
+    def test_autocomplete_never_queries(self):
+        with self.assertNumQueries(0):
+            for prefix in ["s", "sq", "squ", "squa", "squat"]:
+                response = self.client.get(self.url, {"q": prefix})
+                self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(response.json()["results"], [
+            {"id": response.json()["results"][0]["id"], "name": "Back Squat", "category": "legs", "aliases": ["Squat"]},
+        ])
+
+    def test_whole_catalogue_without_query(self):
+        response = self.client.get(self.url)
+        self.assertEqual([e["name"] for e in response.json()["results"]], ["Back Squat", "Bench Press"])
+
+    def test_limit_without_query(self):
+        response = self.client.get(self.url, {"limit": 1})
+        self.assertEqual([e["name"] for e in response.json()["results"]], ["Back Squat"])
+
+    def test_invalid_parameters(self):
+        cases = [
+            ({"q": "s" * 101}, V.LONG_SEARCH_QUERY),
+            ({"q": "s", "limit": "ten"}, V.INVALID_SEARCH_LIMIT),
+            ({"q": "s", "limit": 21}, V.INVALID_SEARCH_LIMIT),
+        ]
+        for params, message in cases:
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["error"], message)
+
+    def test_method_not_allowed(self):
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,133 @@
+import json
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, Client
+from django.urls import reverse
+
+from WorkoutApp.models import Exercise, PersonalRecord, RepRecord, WorkoutSet
+from WorkoutApp.records import estimateOneRepMax, readRecords, saveRecords
+from WorkoutApp.viewHandling import viewHandlingConstants as V
+
+
+class PersonalRecordTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.squat = Exercise.objects.create(name="Back Squat")
+        self.bench = Exercise.objects.create(name="Bench Press")
+
+    def log(self, sets, user_id=1):
+        response = self.client.post(reverse("workout"), data=json.dumps({"user_id": user_id, "sets": sets}), content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+
+    def squat_set(self, reps, weight):
+        return {"exercise_id": self.squat.id, "reps": reps, "weight": weight}
+
+    def test_epley(self):
+        self.assertEqual(estimateOneRepMax(Decimal("100.00"), 1), Decimal("100.00"))
+        self.assertEqual(estimateOneRepMax(Decimal("100.00"), 5), Decimal("116.67"))
+
+    def test_first_session_creates_records(self):
+        self.log([self.squat_set(5, 100), self.squat_set(3, 110), self.squat_set(8, 100)])
+
+        record = PersonalRecord.objects.get(user_id=1, exercise=self.squat)
+        self.assertEqual(record.heaviest_kg, Decimal("110.00"))
+        self.assertEqual(record.best_volume_kg, Decimal("800.00"))
+        self.assertEqual(record.best_e1rm_kg, Decimal("126.67"))  # 100 x (1 + 8/30)
+        self.assertEqual(
+            list(RepRecord.objects.filter(user_id=1).values_list("weight_kg", "reps")),
+            [(Decimal("100.00"), 8), (Decimal("110.00"), 3)],
+        )
+
+    def test_records_only_improve(self):
+        self.log([self.squat_set(5, 100)])
+        self.log([self.squat_set(3, 100), self.squat_set(1, 120)])
+
+        record = PersonalRecord.objects.get(user_id=1, exercise=self.squat)
+        self.assertEqual(record.heaviest_kg, Decimal("120.00"))
+        self.assertEqual(record.best_volume_kg, Decimal("500.00"))  # The earlier 5 x 100 still stands
+        self.assertEqual(RepRecord.objects.get(user_id=1, weight_kg=100).reps, 5)
+
+    def test_lower_session_committing_last_keeps_the_best(self):
+        self.log([self.squat_set(5, 100)])
+
+        # What a concurrent session that read no record yet would write after this one committed
+        saveRecords(
+            [PersonalRecord(user_id=1, exercise=self.squat, best_e1rm_kg=Decimal("90.00"), best_volume_kg=Decimal("900.00"), heaviest_kg=Decimal("60.00"))],
+            [RepRecord(user_id=1, exercise=self.squat, weight_kg=Decimal("100.00"), reps=3)],
+        )
+
+        record = PersonalRecord.objects.get(user_id=1, exercise=self.squat)
+        self.assertEqual(record.heaviest_kg, Decimal("100.00"))
+        self.assertEqual(record.best_volume_kg, Decimal("900.00"))
+        self.assertEqual(record.best_e1rm_kg, Decimal("116.67"))
+        self.assertEqual(RepRecord.objects.get(user_id=1, weight_kg=100).reps, 5)
+
+    def test_update_reads_only_touched_records(self):
+        self.log([self.squat_set(5, 100), {"exercise_id": self.bench.id, "reps": 5, "weight": 80}])
+        sets = [self.squat_set(5, 100 + i) for i in range(50)]
+
+        # SAVEPOINT, workout and sets INSERTs, then a read and an upsert per record table, RELEASE
+        with self.assertNumQueries(8):
+            self.log(sets)
+        self.assertEqual(PersonalRecord.objects.count(), 2)
+
+    def test_rebuild_matches_incremental(self):
+        self.log([self.squat_set(5, 100), self.squat_set(2, 130)])
+        self.log([self.squat_set(10, 90), {"exercise_id": self.bench.id, "reps": 5, "weight": 80}])
+        self.log([self.squat_set(5, 60)], user_id=2)
+        incremental = readRecords(1)
+
+        out = StringIO()
+        call_command("rebuild_personal_records", "--batch-size", "1", stdout=out)
+
+        self.assertIn("Wrote 3 personal records.", out.getvalue())
+        self.assertEqual(readRecords(1), incremental)
+
+    def test_rebuild_one_user(self):
+        self.log([self.squat_set(5, 100)])
+        self.log([self.squat_set(5, 60)], user_id=2)
+        WorkoutSet.objects.filter(user_id=1).update(weight_kg=Decimal("50.00"))
+
+        call_command("rebuild_personal_records", "--user-id", "1", stdout=StringIO())
+        self.assertEqual(PersonalRecord.objects.get(user_id=1).heaviest_kg, Decimal("50.00"))
+        self.assertEqual(PersonalRecord.objects.get(user_id=2).heaviest_kg, Decimal("60.00"))
+
+
+class PersonalRecordViewTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("workout_records")
+        squat = Exercise.objects.create(name="Back Squat")
+        self.squat_id = squat.id
+        PersonalRecord.objects.create(user_id=1, exercise=squat, best_e1rm_kg=Decimal("120.00"), best_volume_kg=Decimal("500.00"), heaviest_kg=Decimal("110.00"))
+        RepRecord.objects.create(user_id=1, exercise=squat, weight_kg=Decimal("100.00"), reps=5)
+
+    def test_records_for_exercise(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"user_id": 1, "exercise_id": self.squat_id})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"], [{
+            "exercise_id": self.squat_id,
+            "best_e1rm_kg": "120.00",
+            "best_volume_kg": "500.00",
+            "heaviest_kg": "110.00",
+            "rep_maxes": [{"weight_kg": "100.00", "reps": 5}],
+        }])
+
+    def test_no_records(self):
+        response = self.client.get(self.url, {"user_id": 2})
+        self.assertEqual(response.json()["results"], [])
+
+    def test_invalid_parameters(self):
+        for params, message in [({}, V.MISSING_USER_ID), ({"user_id": 1, "exercise_id": "squat"}, V.INVALID_EXERCISE_ID)]:
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["error"], message)
+
+    def test_method_not_allowed(self):
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,74 @@
+import json
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+
+from gymcommon.metricsMiddleware import registry
+from gymcommon.serviceTokens import KeyRing, issueToken
+from gymcommon.tokenMiddleware import WRONG_USER
+from WorkoutApp.models import Exercise, Workout
+
+
+class ServiceTokenSiteTests(TestCase):
+    def setUp(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        key_path = Path(directory) / "service_tokens.json"
+        self.ring = KeyRing.generate()
+        self.ring.save(key_path)
+        self.enterContext(override_settings(SERVICE_TOKEN_KEY_FILE=str(key_path)))
+        self.client = Client()
+        self.url = reverse("workout")
+
+    def test_token_accepted(self):
+        headers = {"authorization": f"Bearer {issueToken(self.ring, 1, 900)}"}
+        self.assertEqual(self.client.get(self.url, {"user_id": 1}, headers=headers).status_code, 200)
+
+    def test_expired_token_rejected(self):
+        headers = {"authorization": f"Bearer {issueToken(self.ring, 1, -1)}"}
+        self.assertEqual(self.client.get(self.url, {"user_id": 1}, headers=headers).status_code, 401)
+
+    @override_settings(SERVICE_TOKEN_REQUIRED=True)
+    def test_required(self):
+        self.assertEqual(self.client.get(self.url, {"user_id": 1}).status_code, 401)
+        self.assertEqual(self.client.get(reverse("get_csrf_token")).status_code, 200)
+
+    @override_settings(SERVICE_TOKEN_REQUIRED=True, METRICS_TOKEN="scrape-secret")
+    def test_metrics_served_without_service_token(self):
+        registry.reset()
+        self.client.get(self.url, {"user_id": 1})
+
+        response = self.client.get("/metrics", headers={"authorization": "Bearer scrape-secret"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('gym_http_requests_total{view="workout",method="GET",status="4xx"} 1', response.content.decode())
+
+
+    def test_other_users_rejected(self):
+        client = Client(headers={"authorization": f"Bearer {issueToken(self.ring, 7, 900)}"})
+        requests = [
+            (self.url, {"user_id": 8}),
+            (reverse("workout_records"), {"user_id": 8}),
+            (reverse("workout_analytics"), {"user_ids": "7,8"}),
+        ]
+        for url, params in requests:
+            with self.subTest(url=url):
+                response = client.get(url, params)
+                self.assertEqual(response.status_code, 403)
+                self.assertEqual(response.json()["error"], WRONG_USER)
+
+        self.assertEqual(client.get(reverse("workout_analytics"), {"user_ids": "7"}).status_code, 200)
+        self.assertEqual(client.get(reverse("workout_records"), {"user_id": 7}).status_code, 200)
+
+    def test_logging_for_another_user_rejected(self):
+        client = Client(headers={"authorization": f"Bearer {issueToken(self.ring, 7, 900)}"})
+        squat = Exercise.objects.create(name="Back Squat", category="legs")
+        session = {"user_id": 8, "started_at": "2024-01-01T18:00:00Z", "sets": [{"exercise_id": squat.id, "reps": 5, "weight": 100}]}
+
+        response = client.post(self.url, data=json.dumps(session), content_type="application/json")
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Workout.objects.exists())
+
+        session["user_id"] = 7
+        response = client.post(self.url, data=json.dumps(session), content_type="application/json")
+        self.assertEqual(response.status_code, 201)
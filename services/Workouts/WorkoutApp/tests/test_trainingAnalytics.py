@@ -0,0 +1,187 @@
+import json
+import os
+from unittest import skipIf
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase, Client
+from django.urls import reverse
+
+from WorkoutApp.analytics import TrainingSeries, summariseWeek, weekStart
+from WorkoutApp.models import Exercise
+from WorkoutApp.trainingCache import getTrainingCache, getWeeklySummaries, trainingCacheKey
+from WorkoutApp.viewHandling import viewHandlingConstants as V
+
+MONDAY = date(2024, 1, 29)
+
+
+def ordinals(*days):
+    return [day.toordinal() for day in days]
+
+
+class TrainingSeriesTests(TestCase):
+    def test_one_rep_max_estimates(self):
+        series = TrainingSeries([1, 1, 1], [1, 1, 1], ordinals(MONDAY, MONDAY, MONDAY), [1, 5, 40], [100, 100, 50])
+
+        np.testing.assert_allclose(series.epley(), [100, 116.6667, 116.6667], rtol=1e-5)
+        np.testing.assert_allclose(series.brzycki(), [100, 112.5, np.nan], rtol=1e-5)
+        np.testing.assert_allclose(series.tonnage(), [100, 500, 2000])
+
+    def test_week_starts_are_mondays(self):
+        days = [MONDAY + timedelta(days=i) for i in range(14)]
+        series = TrainingSeries([1] * 14, [1] * 14, ordinals(*days), [1] * 14, [1] * 14)
+
+        weeks = {date.fromordinal(int(week)) for week in series.weekStarts()}
+        self.assertEqual(weeks, {MONDAY, MONDAY + timedelta(weeks=1)})
+        self.assertEqual(weekStart(MONDAY + timedelta(days=6)), MONDAY)
+
+    def test_weekly_tonnage_and_workload_ratios(self):
+        # User 1 lifts 1000 kg a week for three weeks, then 3000 kg; user 2 only trains in the last week
+        days = [MONDAY + timedelta(weeks=w) for w in range(4)]
+        series = TrainingSeries([1, 1, 1, 1, 2], [1] * 5, ordinals(*days, days[3]), [10, 10, 10, 30, 5], [100] * 5)
+
+        users, weeks, tonnage = series.weeklyTonnage()
+        self.assertEqual(list(users), [1, 1, 1, 1, 2])
+        self.assertEqual(list(tonnage), [1000, 1000, 1000, 3000, 500])
+
+        user_ids, week_starts, ratios = series.workloadRatios(chronic_weeks=4)
+        self.assertEqual(list(user_ids), [1, 2])
+        self.assertEqual(len(week_starts), 4)
+        self.assertAlmostEqual(ratios[0, 3], 3000 / 1500)
+        self.assertAlmostEqual(ratios[1, 3], 1.0)  # One week of history is its own chronic load
+        self.assertAlmostEqual(ratios[0, 1], 1.0)
+        self.assertTrue(np.isnan(ratios[1, 0]))
+
+    def test_best_one_rep_max_per_user_and_exercise(self):
+        series = TrainingSeries([1, 1, 1, 2], [1, 1, 2, 1], ordinals(*[MONDAY] * 4), [5, 1, 8, 3], [100, 120, 60, 90])
+
+        users, exercises, epley, brzycki, sets, tonnage = series.bestOneRepMax()
+        self.assertEqual(list(zip(users, exercises)), [(1, 1), (1, 2), (2, 1)])
+        np.testing.assert_allclose(epley, [120, 76, 99], rtol=1e-5)
+        self.assertEqual(list(sets), [2, 1, 1])
+        self.assertEqual(list(tonnage), [620, 480, 270])
+
+    def test_summarise_week(self):
+        days = [MONDAY - timedelta(weeks=1), MONDAY, MONDAY + timedelta(days=2)]
+        series = TrainingSeries([1, 1, 1], [1, 1, 2], ordinals(*days), [10, 5, 10], [100, 100, 50])
+
+        summary = summariseWeek(series, MONDAY)[1]
+        self.assertEqual(summary["sets"], 2)
+        self.assertEqual(summary["tonnage_kg"], 1000.0)
+        self.assertEqual(summary["acwr"], 1.0)  # 1000 against (1000 + 1000) / 2, the user's first two weeks
+        self.assertEqual([e["exercise_id"] for e in summary["exercises"]], [1, 2])
+        self.assertEqual(summary["exercises"][0]["brzycki_1rm_kg"], 112.5)
+
+    def test_summarise_week_with_earlier_history(self):
+        days = [MONDAY - timedelta(weeks=8), MONDAY]
+        series = TrainingSeries([1, 1], [1, 1], ordinals(*days), [10, 10], [100, 100])
+
+        self.assertEqual(summariseWeek(series, MONDAY)[1]["acwr"], 4.0)  # 1000 against 1000 / 4
+        self.assertEqual(summariseWeek(series.select(series.days >= MONDAY.toordinal()), MONDAY)[1]["acwr"], 1.0)
+        self.assertEqual(summariseWeek(series.select(series.days >= MONDAY.toordinal()), MONDAY, earlier_user_ids=[1])[1]["acwr"], 4.0)
+
+
+class TrainingAnalyticsViewTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("workout_analytics")
+        self.squat = Exercise.objects.create(name="Back Squat")
+        getTrainingCache().clear()
+
+    def log(self, user_id, started_at, reps=5, weight=100):
+        response = self.client.post(reverse("workout"), data=json.dumps({
+            "user_id": user_id,
+            "started_at": started_at.isoformat(),
+            "sets": [{"exercise_id": self.squat.id, "reps": reps, "weight": weight}],
+        }), content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+
+    def at(self, day):
+        return datetime(day.year, day.month, day.day, 18, tzinfo=dt_timezone.utc)
+
+    def test_summaries_for_many_users(self):
+        self.log(1, self.at(MONDAY))
+        self.log(1, self.at(MONDAY - timedelta(weeks=2)))
+        self.log(2, self.at(MONDAY + timedelta(days=3)), reps=3, weight=80)
+
+        response = self.client.get(self.url, {"user_ids": "2,1,3", "week": "2024-01-31"})
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([r["user_id"] for r in results], [2, 1, 3])
+        self.assertEqual(results[0]["tonnage_kg"], 240.0)
+        self.assertEqual(results[1]["week_start"], "2024-01-29")
+        self.assertEqual(results[1]["acwr"], 1.5)  # 500 against 1000 over the three weeks since the first set
+        self.assertEqual(results[2], {
+            "user_id": 3, "week_start": "2024-01-29", "sets": 0, "tonnage_kg": 0.0, "acwr": None, "exercises": [],
+        })
+
+    def test_chronic_load_of_new_and_returning_users(self):
+        self.log(1, self.at(MONDAY - timedelta(weeks=8)))
+        self.log(1, self.at(MONDAY))
+        self.log(2, self.at(MONDAY))
+
+        results = self.client.get(self.url, {"user_ids": "1,2", "week": MONDAY.isoformat()}).json()["results"]
+        self.assertEqual([r["acwr"] for r in results], [4.0, 1.0])
+
+    def test_cached_weeks_skip_the_database(self):
+        self.log(1, self.at(MONDAY))
+
+        with self.assertNumQueries(2):  # The second asks whether user 1 trained before the window
+            first = getWeeklySummaries([1, 2], MONDAY)
+        with self.assertNumQueries(0):
+            self.assertEqual(getWeeklySummaries([1, 2], MONDAY), first)
+        with self.assertNumQueries(1):
+            getWeeklySummaries([1, 2, 3], MONDAY)  # Only user 3 is loaded
+
+    def test_new_sets_invalidate_affected_weeks(self):
+        self.log(1, self.at(MONDAY))
+        for offset in range(5):
+            getWeeklySummaries([1], MONDAY + timedelta(weeks=offset))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.log(1, self.at(MONDAY + timedelta(days=1)), reps=10)
+
+        cache = getTrainingCache()
+        cached = [cache.get(trainingCacheKey(1, MONDAY + timedelta(weeks=offset))) is not None for offset in range(5)]
+        self.assertEqual(cached, [False, False, False, False, True])
+        self.assertEqual(getWeeklySummaries([1], MONDAY)[0]["tonnage_kg"], 1500.0)
+
+    def test_uses_configured_cache(self):
+        self.assertIs(getTrainingCache(), caches["training_summaries"])
+
+    @skipIf("TRAINING_CACHE_BACKEND" in os.environ, "backend chosen by the environment")
+    def test_default_backend_is_shared_by_workers(self):
+        self.assertNotEqual(settings.CACHES["training_summaries"]["BACKEND"], "django.core.cache.backends.locmem.LocMemCache")
+
+    def test_new_sets_reach_other_workers(self):
+        self.log(1, self.at(MONDAY))
+        getWeeklySummaries([1], MONDAY)
+        other_worker = caches.create_connection(settings.TRAINING_SUMMARY_CACHE)  # What another process would open
+        self.assertIsNotNone(other_worker.get(trainingCacheKey(1, MONDAY)))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.log(1, self.at(MONDAY + timedelta(days=1)))
+
+        self.assertIsNone(other_worker.get(trainingCacheKey(1, MONDAY)))
+
+    def test_invalid_parameters(self):
+        cases = [
+            ({}, V.MISSING_USER_IDS),
+            ({"user_ids": "1,x"}, V.INVALID_USER_IDS),
+            ({"user_ids": "1,-2"}, V.INVALID_USER_IDS),
+            ({"user_ids": ",".join(str(i) for i in range(1, 502))}, V.TOO_MANY_USER_IDS),
+            ({"user_ids": "1", "week": "last week"}, V.INVALID_WEEK),
+            ({"user_ids": "1", "week": "2024-02-30"}, V.INVALID_WEEK),
+        ]
+        for params, message in cases:
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["error"], message)
+
+    def test_method_not_allowed(self):
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 400)
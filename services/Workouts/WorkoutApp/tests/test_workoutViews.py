@@ -0,0 +1,133 @@
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.utils import timezone
+
+from WorkoutApp.catalogue import getCatalogue
+from WorkoutApp.models import Exercise, Workout, WorkoutSet
+from WorkoutApp.viewHandling import viewHandlingConstants as V
+
+
+class WorkoutLogTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("workout")
+        self.squat = Exercise.objects.create(name="Back Squat", category="legs")
+        self.bench = Exercise.objects.create(name="Bench Press", category="chest")
+        self.session = {
+            "user_id": 1,
+            "started_at": "2024-01-01T18:00:00Z",
+            "ended_at": "2024-01-01T19:00:00Z",
+            "note": "Leg day",
+            "sets": [
+                {"exercise_id": self.squat.id, "reps": 5, "weight": 100},
+                {"exercise_id": self.squat.id, "reps": 5, "weight": 105.5},
+                {"exercise_id": self.bench.id, "reps": 8, "weight": 135, "weight_type": "lb"},
+            ],
+        }
+
+    def post_json(self, data):
+        return self.client.post(self.url, data=json.dumps(data), content_type="application/json")
+
+    def test_url_exists(self):
+        response = self.client.get(self.url)
+        self.assertNotEqual(response.status_code, 404)
+
+    def test_invalid_json(self):
+        response = self.client.post(self.url, data="Not a JSON", content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.json())
+
+    def test_logs_whole_session(self):
+        response = self.post_json(self.session)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["sets"], 3)
+        workout = Workout.objects.get(id=response.json()["id"])
+        self.assertEqual(workout.note, "Leg day")
+        sets = list(workout.sets.all())
+        self.assertEqual([s.set_number for s in sets], [1, 2, 3])
+        self.assertEqual(sets[1].weight_kg, Decimal("105.50"))
+        self.assertEqual(sets[2].weight_kg, Decimal("61.23"))  # 135 lb
+        self.assertTrue(all(s.user_id == 1 for s in sets))
+
+    def test_session_is_one_transaction(self):
+        sets = [{"exercise_id": self.squat.id, "reps": 5, "weight": 100}] * 50
+        getCatalogue()  # Exercises are checked in memory once the catalogue is loaded
+
+        # SAVEPOINT, workout INSERT, one INSERT for every set,
+        # a read and an upsert for each personal record table, RELEASE
+        with self.assertNumQueries(8):
+            response = self.post_json(dict(self.session, sets=sets))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(WorkoutSet.objects.count(), 50)
+
+    def test_invalid_set_rejects_session(self):
+        self.session["sets"][1]["reps"] = 0
+
+        response = self.post_json(self.session)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": V.INVALID_REPS, "set": 1})
+        self.assertFalse(Workout.objects.exists())
+
+    def test_unknown_exercise(self):
+        self.session["sets"][2]["exercise_id"] = 999
+
+        response = self.post_json(self.session)
+        self.assertEqual(response.json(), {"error": V.UNKNOWN_EXERCISE, "set": 2})
+        self.assertFalse(Workout.objects.exists())
+
+    def test_invalid_sessions(self):
+        future = (timezone.now() + timedelta(days=1)).isoformat()
+        cases = [
+            (dict(self.session, sets=[]), V.MISSING_SETS),
+            (dict(self.session, sets={"reps": 5}), V.INVALID_SETS),
+            (dict(self.session, sets=self.session["sets"] * 200), V.TOO_MANY_SETS),
+            (dict(self.session, user_id=None), V.MISSING_USER_ID),
+            (dict(self.session, started_at="yesterday"), V.INVALID_STARTED_AT),
+            (dict(self.session, started_at=future, ended_at=None), V.FUTURE_STARTED_AT),
+            (dict(self.session, ended_at="2024-01-01T17:00:00Z"), V.ENDED_BEFORE_STARTED),
+            (["not", "an", "object"], V.INVALID_WORKOUT),
+        ]
+        for data, message in cases:
+            with self.subTest(message=message):
+                response = self.post_json(data)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["error"], message)
+
+    def test_method_not_allowed(self):
+        response = self.client.put(self.url)
+        self.assertEqual(response.status_code, 400)
+
+
+class WorkoutListTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("workout")
+        start = timezone.now() - timedelta(days=30)
+        Workout.objects.bulk_create([Workout(user_id=1, started_at=start + timedelta(days=i)) for i in range(30)])
+        Workout.objects.create(user_id=2, started_at=timezone.now())
+
+    def test_latest_sessions_first(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"user_id": 1, "limit": 5})
+
+        results = response.json()["results"]
+        self.assertEqual(len(results), 5)
+        started = [r["started_at"] for r in results]
+        self.assertEqual(started, sorted(started, reverse=True))
+
+    def test_latest_sessions_use_index(self):
+        plan = Workout.objects.filter(user_id=1).order_by("-started_at")[:5].explain()
+        self.assertIn("workout_user_latest_idx", plan)
+
+    def test_invalid_parameters(self):
+        for params, message in [({}, V.MISSING_USER_ID), ({"user_id": 1, "limit": 500}, V.INVALID_LIMIT)]:
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["error"], message)
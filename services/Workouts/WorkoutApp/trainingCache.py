@@ -0,0 +1,80 @@
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import caches
+
+from WorkoutApp.analytics import CHRONIC_WEEKS, TrainingSeries, summariseWeek, weekStart
+from WorkoutApp.models import WorkoutSet
+
+
+def getTrainingCache():
+    """
+    Returns the cache configured by TRAINING_SUMMARY_CACHE, local memory unless the settings say otherwise.
+    """
+    return caches[getattr(settings, "TRAINING_SUMMARY_CACHE", "default")]
+
+def trainingCacheKey(user_id, week: date) -> str:
+    return f"training-week:{user_id}:{week.isoformat()}"
+
+def emptySummary(user_id: int, week: date) -> dict:
+    return {"user_id": user_id, "week_start": week.isoformat(), "sets": 0, "tonnage_kg": 0.0, "acwr": None, "exercises": []}
+
+def trainedBefore(series: TrainingSeries, window_start: date) -> list:
+    """
+    Returns the users of series with sets before window_start, among those whose first set in series is later than its first week.
+    Their chronic load is the mean of the whole window even though its first weeks are empty.
+    """
+    user_ids, first_sets = np.unique(series.user_ids, return_index=True)
+    late = user_ids[series.days[first_sets] >= (window_start + timedelta(weeks=1)).toordinal()].tolist()
+    if not late:
+        return []
+    return list(WorkoutSet.objects.filter(
+        user_id__in=late, workout__started_at__lt=datetime.combine(window_start, time.min, dt_timezone.utc),
+    ).values_list("user_id", flat=True).distinct())
+
+def loadWeek(user_ids, week: date) -> dict:
+    """
+    Computes the summaries of the given users for one week with a single query over the chronic window,
+    and one more for the users whose first set in it comes after its first week.
+    """
+    window_start = week - timedelta(weeks=CHRONIC_WEEKS - 1)
+    sets = WorkoutSet.objects.filter(
+        user_id__in=user_ids,
+        workout__started_at__gte=datetime.combine(window_start, time.min, dt_timezone.utc),
+        workout__started_at__lt=datetime.combine(week + timedelta(weeks=1), time.min, dt_timezone.utc),
+    )
+    series = TrainingSeries.load(sets)
+    summaries = summariseWeek(series, week, earlier_user_ids=trainedBefore(series, window_start))
+    return {user_id: summaries.get(user_id) or emptySummary(user_id, week) for user_id in user_ids}
+
+def getWeeklySummaries(user_ids, day: date) -> list:
+    """
+    Returns the summary of every user for the week containing day, in the order of user_ids.
+    Cached weeks are read in one round trip; the misses are computed together and stored in another.
+    """
+    week = weekStart(day)
+    cache = getTrainingCache()
+    keys = {user_id: trainingCacheKey(user_id, week) for user_id in user_ids}
+    cached = cache.get_many(keys.values())
+
+    summaries = {user_id: cached[key] for user_id, key in keys.items() if key in cached}
+    misses = [user_id for user_id in keys if user_id not in summaries]
+    if misses:
+        computed = loadWeek(misses, week)
+        cache.set_many({keys[user_id]: summary for user_id, summary in computed.items()})
+        summaries.update(computed)
+
+    return [summaries[user_id] for user_id in user_ids]
+
+def invalidateTraining(user_id: int, days) -> None:
+    """
+    Drops the cached weeks that sets logged on the given days feed into: the week itself and,
+    because its tonnage is part of their chronic load, the CHRONIC_WEEKS - 1 weeks after it.
+    """
+    keys = {
+        trainingCacheKey(user_id, weekStart(day) + timedelta(weeks=offset))
+        for day in days
+        for offset in range(CHRONIC_WEEKS)
+    }
+    getTrainingCache().delete_many(keys)
@@ -0,0 +1,47 @@
+MISSING_USER_ID = "User ID is missing."
+EMPTY_USER_ID = "User ID cannot be empty."
+INVALID_USER_ID_VALUE = "User ID is invalid. It must be a valid integer."
+INVALID_USER_ID_TYPE = "User ID must be an integer."
+
+INVALID_STARTED_AT = "Started at is invalid. It must be an ISO 8601 date and time."
+INVALID_ENDED_AT = "Ended at is invalid. It must be an ISO 8601 date and time."
+FUTURE_STARTED_AT = "Started at cannot be in the future."
+ENDED_BEFORE_STARTED = "Ended at cannot be before started at."
+
+INVALID_NOTE_TYPE = "Note must be a string."
+LONG_NOTE = "Note cannot be more than 255 characters long."
+
+MISSING_SETS = "A workout must contain at least one set."
+INVALID_SETS = "Sets must be a JSON array."
+TOO_MANY_SETS = "Too many sets in one workout. The maximum is 500."
+MAX_SETS_PER_WORKOUT = 500
+INVALID_SET = "Set must be a JSON object."
+
+MISSING_EXERCISE_ID = "Exercise ID is missing."
+INVALID_EXERCISE_ID = "Exercise ID must be a positive integer."
+UNKNOWN_EXERCISE = "Exercise does not exist."
+
+MISSING_REPS = "Reps are missing."
+INVALID_REPS = "Reps must be an integer between 1 and 1000."
+
+MISSING_WEIGHT = "Weight is missing."
+INVALID_WEIGHT = "Weight is invalid. It must be a valid decimal number."
+SMALL_WEIGHT = "Weight cannot be less than 0."
+LARGE_WEIGHT = "Weight cannot be more than 1000 kg."
+INVALID_WEIGHT_UNIT = "Weight type is invalid. It must be 'kg' or 'lb'."
+
+INVALID_WORKOUT = "Workout must be a JSON object."
+INVALID_LIMIT = "Limit is invalid. It must be an integer between 1 and 100."
+DEFAULT_WORKOUTS_LIMIT = 20
+MAX_WORKOUTS_LIMIT = 100
+
+LONG_SEARCH_QUERY = "Search query cannot be more than 100 characters long."
+INVALID_SEARCH_LIMIT = "Limit is invalid. It must be an integer between 1 and 20."
+DEFAULT_SEARCH_LIMIT = 10
+MAX_SEARCH_LIMIT = 20
+
+MISSING_USER_IDS = "User IDs are missing."
+INVALID_USER_IDS = "User IDs must be a comma separated list of positive integers."
+TOO_MANY_USER_IDS = "Too many user IDs in one request. The maximum is 500."
+MAX_ANALYTICS_USERS = 500
+INVALID_WEEK = "Week is invalid. It must be a date in YYYY-MM-DD format."
@@ -0,0 +1,260 @@
+from django.core.exceptions import BadRequest
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from decimal import Decimal, InvalidOperation
+from datetime import timezone as dt_timezone
+
+from WorkoutApp.viewHandling import viewHandlingConstants as validators  # Importing validation messages
+
+LB_TO_KG = Decimal("0.45359237")
+
+
+class SetError(BadRequest):
+    """
+    A BadRequest raised for one set of a workout, carrying the set's index in the request.
+    """
+
+    def __init__(self, index: int, message: str):
+        super().__init__(message)
+        self.index = index
+
+
+#WEIGHT VALIDATIONS
+def validateWeightKg(data: dict) -> Decimal:
+    """
+    Validates a set's weight and returns it in kg, converting from lb when weight_type says so.
+    """
+    weight = data.get("weight")
+
+    if weight is None:
+        raise BadRequest(validators.MISSING_WEIGHT)
+
+    if isinstance(weight, (list, dict, bool)) or (isinstance(weight, str) and not weight.strip()):
+        raise BadRequest(validators.INVALID_WEIGHT)
+
+    try:
+        w = Decimal(str(weight))
+    except (InvalidOperation, TypeError, ValueError):
+        raise BadRequest(validators.INVALID_WEIGHT)
+
+    if not w.is_finite():
+        raise BadRequest(validators.INVALID_WEIGHT)
+
+    weight_type = data.get("weight_type", "kg")
+    if not isinstance(weight_type, str) or weight_type.strip().lower() not in ("kg", "lb"):
+        raise BadRequest(validators.INVALID_WEIGHT_UNIT)
+    if weight_type.strip().lower() == "lb":
+        w = w * LB_TO_KG
+
+    if w < 0:
+        raise BadRequest(validators.SMALL_WEIGHT)
+    if w > Decimal("1000"):
+        raise BadRequest(validators.LARGE_WEIGHT)
+
+    return w.quantize(Decimal("0.01"))
+
+#SET VALIDATIONS
+def validatePositiveInteger(value, missing: str, invalid: str, maximum=None) -> int:
+    if value is None:
+        raise BadRequest(missing)
+
+    if isinstance(value, (bool, float, list, dict)):
+        raise BadRequest(invalid)
+
+    try:
+        number = int(value)
+    except (ValueError, TypeError):
+        raise BadRequest(invalid)
+
+    if number <= 0 or (maximum is not None and number > maximum):
+        raise BadRequest(invalid)
+
+    return number
+
+def validateSet(data) -> dict:
+    """
+    Validates one set and returns its WorkoutSet field values, minus the workout and numbering.
+    """
+    if not isinstance(data, dict):
+        raise BadRequest(validators.INVALID_SET)
+
+    return {
+        "exercise_id": validatePositiveInteger(data.get("exercise_id"), validators.MISSING_EXERCISE_ID, validators.INVALID_EXERCISE_ID, 32767),
+        "reps": validatePositiveInteger(data.get("reps"), validators.MISSING_REPS, validators.INVALID_REPS, 1000),
+        "weight_kg": validateWeightKg(data),
+    }
+
+def validateSets(data: dict) -> list:
+    sets = data.get("sets")
+
+    if sets is None:
+        raise BadRequest(validators.MISSING_SETS)
+    if not isinstance(sets, list):
+        raise BadRequest(validators.INVALID_SETS)
+    if not sets:
+        raise BadRequest(validators.MISSING_SETS)
+    if len(sets) > validators.MAX_SETS_PER_WORKOUT:
+        raise BadRequest(validators.TOO_MANY_SETS)
+
+    validated = []
+    for index, set_data in enumerate(sets):
+        try:
+            validated.append(validateSet(set_data))
+        except BadRequest as e:
+            raise SetError(index, str(e))
+    return validated
+
+#DATE VALIDATIONS
+def validateDateTime(value, message: str):
+    if value is None:
+        return None
+
+    if not isinstance(value, str):
+        raise BadRequest(message)
+
+    try:
+        parsed = parse_datetime(value.strip())
+    except ValueError:
+        raise BadRequest(message)
+    if parsed is None:
+        raise BadRequest(message)
+
+    return parsed if timezone.is_aware(parsed) else timezone.make_aware(parsed, dt_timezone.utc)
+
+#OTHER FIELD VALIDATIONS
+def validateNote(data: dict) -> str:
+    note = data.get("note", "")
+
+    if note is None:
+        return ""
+
+    if not isinstance(note, str):
+        raise BadRequest(validators.INVALID_NOTE_TYPE)
+
+    note = note.strip()
+    if len(note) > 255:
+        raise BadRequest(validators.LONG_NOTE)
+
+    return note
+
+#User ID VALIDATIONS
+def validateUserID(user_id) -> int:
+    if user_id is None:
+        raise BadRequest(validators.MISSING_USER_ID)
+
+    if isinstance(user_id, str) and not user_id.strip():
+        raise BadRequest(validators.EMPTY_USER_ID)
+
+    if isinstance(user_id, (bool, float, list, dict)):
+        raise BadRequest(validators.INVALID_USER_ID_TYPE)
+
+    try:
+        uid = int(user_id)
+    except (ValueError, TypeError):
+        raise BadRequest(validators.INVALID_USER_ID_TYPE)
+
+    if uid <= 0:
+        raise BadRequest(validators.INVALID_USER_ID_VALUE)
+
+    return uid
+
+#VALIDATIONS FOR VIEW DATA
+def validateWorkout(data, now=None) -> dict:
+    """
+    Validates a whole logged session and returns the Workout fields plus its validated sets.
+    """
+    if not isinstance(data, dict):
+        raise BadRequest(validators.INVALID_WORKOUT)
+
+    now = now or timezone.now()
+    started_at = validateDateTime(data.get("started_at"), validators.INVALID_STARTED_AT) or now
+    ended_at = validateDateTime(data.get("ended_at"), validators.INVALID_ENDED_AT)
+    if started_at > now:
+        raise BadRequest(validators.FUTURE_STARTED_AT)
+    if ended_at is not None and ended_at < started_at:
+        raise BadRequest(validators.ENDED_BEFORE_STARTED)
+
+    return {
+        "user_id": validateUserID(data.get("user_id")),
+        "started_at": started_at,
+        "ended_at": ended_at,
+        "note": validateNote(data),
+        "sets": validateSets(data),
+    }
+
+def validateLimit(data: dict) -> int:
+    limit = data.get("limit")
+
+    if limit is None:
+        return validators.DEFAULT_WORKOUTS_LIMIT
+
+    try:
+        limit = int(limit)
+    except (ValueError, TypeError):
+        raise BadRequest(validators.INVALID_LIMIT)
+
+    if limit < 1 or limit > validators.MAX_WORKOUTS_LIMIT:
+        raise BadRequest(validators.INVALID_LIMIT)
+
+    return limit
+
+def validateUserIDs(value) -> list:
+    """
+    Validates a comma separated list of user IDs and returns them without duplicates, in order.
+    """
+    if value is None or not value.strip():
+        raise BadRequest(validators.MISSING_USER_IDS)
+
+    user_ids = []
+    for part in value.split(","):
+        try:
+            user_id = int(part)
+        except ValueError:
+            raise BadRequest(validators.INVALID_USER_IDS)
+        if user_id <= 0:
+            raise BadRequest(validators.INVALID_USER_IDS)
+        user_ids.append(user_id)
+
+    user_ids = list(dict.fromkeys(user_ids))
+    if len(user_ids) > validators.MAX_ANALYTICS_USERS:
+        raise BadRequest(validators.TOO_MANY_USER_IDS)
+    return user_ids
+
+def validateAnalyticsQuery(data: dict):
+    """
+    Validates the analytics query string and returns (user_ids, week), the week defaulting to the current one.
+    """
+    week = data.get("week")
+    if week is None:
+        week = timezone.now().date()
+    else:
+        try:
+            week = parse_date(week.strip())
+        except ValueError:
+            raise BadRequest(validators.INVALID_WEEK)
+        if week is None:
+            raise BadRequest(validators.INVALID_WEEK)
+
+    return validateUserIDs(data.get("user_ids")), week
+
+def validateSearchQuery(data: dict):
+    """
+    Validates the autocomplete query string and returns (query, limit). An empty query lists the catalogue from the start.
+    """
+    query = data.get("q", "").strip()
+    if len(query) > 100:
+        raise BadRequest(validators.LONG_SEARCH_QUERY)
+
+    limit = data.get("limit")
+    if limit is None:
+        return query, validators.DEFAULT_SEARCH_LIMIT
+
+    try:
+        limit = int(limit)
+    except (ValueError, TypeError):
+        raise BadRequest(validators.INVALID_SEARCH_LIMIT)
+
+    if limit < 1 or limit > validators.MAX_SEARCH_LIMIT:
+        raise BadRequest(validators.INVALID_SEARCH_LIMIT)
+
+    return query, limit
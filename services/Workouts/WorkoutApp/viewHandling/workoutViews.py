@@ -0,0 +1,166 @@
+import json
+from itertools import islice
+
+from WorkoutApp.models import Exercise, Workout, WorkoutSet
+from WorkoutApp.catalogue import getCatalogue, markCatalogueStale
+from WorkoutApp.records import readRecords, updateRecords
+from WorkoutApp.trainingCache import getWeeklySummaries, invalidateTraining
+from datetime import timezone as dt_timezone
+from django.http import JsonResponse
+from django.core.exceptions import BadRequest, PermissionDenied
+from django.db import IntegrityError, transaction
+
+from gymcommon.tokenMiddleware import validateTokenUser
+from WorkoutApp.viewHandling import viewHandlingConstants as validators
+from WorkoutApp.viewHandling.viewHandlingValidators import SetError, validateWorkout, validateUserID, validateLimit, validatePositiveInteger, validateAnalyticsQuery, validateSearchQuery
+
+WORKOUT_FIELDS = ("id", "started_at", "ended_at", "note")
+
+def unknownExerciseIndex(sets: list):
+    """
+    Returns the index of the first set whose exercise does not exist, or None.
+    Checked against the in-process catalogue; only ids it lacks are looked up, in one query,
+    in case another worker added them since this worker's catalogue was loaded.
+    """
+    catalogue = getCatalogue()
+    missing = {set_fields["exercise_id"] for set_fields in sets} - catalogue.exercises.keys()
+    if not missing:
+        return None
+
+    known = set(Exercise.objects.filter(id__in=missing).values_list("id", flat=True))
+    if known:
+        markCatalogueStale()  # Another worker added them, reload this worker's copy on next use
+    for index, set_fields in enumerate(sets):
+        if set_fields["exercise_id"] in missing and set_fields["exercise_id"] not in known:
+            return index
+    return None
+
+def saveWorkout(fields: dict, sets: list) -> Workout:
+    """
+    Inserts the workout and all of its sets in one transaction, the sets with a single bulk_create,
+    and folds the sets into the user's personal records.
+    The user's cached training summaries are dropped once the transaction commits.
+    """
+    with transaction.atomic():
+        workout = Workout.objects.create(**fields)
+        WorkoutSet.objects.bulk_create([
+            WorkoutSet(workout=workout, user_id=workout.user_id, set_number=number, **set_fields)
+            for number, set_fields in enumerate(sets, start=1)
+        ])
+        updateRecords(workout.user_id, ((s["exercise_id"], s["reps"], s["weight_kg"]) for s in sets))
+        day = workout.started_at.astimezone(dt_timezone.utc).date()
+        transaction.on_commit(lambda: invalidateTraining(workout.user_id, [day]))
+    return workout
+
+def workoutLog(request):
+    """
+    A view to handle logging a whole workout session, with every set, in one request.
+    The session is stored all or nothing; the first invalid set is reported by index.
+    """
+    try:
+        data = json.loads(request.body.decode("utf-8"))
+    except ValueError:
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    try:
+        fields = validateWorkout(data)
+    except SetError as e:
+        return JsonResponse({"error": str(e), "set": e.index}, status=400)
+    except BadRequest as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    try:
+        validateTokenUser(request, fields["user_id"])
+    except PermissionDenied as e:
+        return JsonResponse({"error": str(e)}, status=403)
+
+    sets = fields.pop("sets")
+    index = unknownExerciseIndex(sets)
+    if index is not None:
+        return JsonResponse({"error": validators.UNKNOWN_EXERCISE, "set": index}, status=400)
+
+    try:
+        workout = saveWorkout(fields, sets)
+    except IntegrityError:
+        markCatalogueStale()  # An exercise was deleted after this worker's catalogue was loaded
+        index = unknownExerciseIndex(sets)
+        if index is None:
+            raise
+        return JsonResponse({"error": validators.UNKNOWN_EXERCISE, "set": index}, status=400)
+    return JsonResponse({"id": workout.id, "sets": len(sets)}, status=201)
+
+def workoutList(request):
+    """
+    A view to handle retrieval of a user's latest workout sessions, newest first.
+    """
+    try:
+        user_id = validateUserID(request.GET.get("user_id"))
+        limit = validateLimit(request.GET)
+    except BadRequest as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    try:
+        validateTokenUser(request, user_id)
+    except PermissionDenied as e:
+        return JsonResponse({"error": str(e)}, status=403)
+
+    workouts = Workout.objects.filter(user_id=user_id).order_by("-started_at").values_list(*WORKOUT_FIELDS)[:limit]
+    results = [
+        {
+            "id": workout_id,
+            "started_at": started_at.isoformat(),
+            "ended_at": ended_at.isoformat() if ended_at else None,
+            "note": note,
+        }
+        for workout_id, started_at, ended_at, note in workouts
+    ]
+    return JsonResponse({"results": results}, status=200)
+
+def workoutRecords(request):
+    """
+    A view to handle retrieval of a user's personal records, for one exercise or all of them.
+    """
+    try:
+        user_id = validateUserID(request.GET.get("user_id"))
+        exercise_id = request.GET.get("exercise_id")
+        if exercise_id is not None:
+            exercise_id = validatePositiveInteger(exercise_id, validators.MISSING_EXERCISE_ID, validators.INVALID_EXERCISE_ID)
+    except BadRequest as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    try:
+        validateTokenUser(request, user_id)
+    except PermissionDenied as e:
+        return JsonResponse({"error": str(e)}, status=403)
+
+    return JsonResponse({"results": readRecords(user_id, exercise_id)}, status=200)
+
+def workoutAnalytics(request):
+    """
+    A view to handle retrieval of weekly training summaries, tonnage, 1RM estimates and
+    acute:chronic workload ratio, for many users at once.
+    """
+    try:
+        user_ids, week = validateAnalyticsQuery(request.GET)
+    except BadRequest as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    try:
+        validateTokenUser(request, *user_ids)
+    except PermissionDenied as e:
+        return JsonResponse({"error": str(e)}, status=403)
+
+    return JsonResponse({"results": getWeeklySummaries(user_ids, week)}, status=200)
+
+def exerciseSearch(request):
+    """
+    A view to handle exercise autocomplete by name or alias prefix, served from the in-process catalogue.
+    """
+    try:
+        query, limit = validateSearchQuery(request.GET)
+    except BadRequest as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    catalogue = getCatalogue()
+    results = catalogue.search(query, limit) if query else list(islice(catalogue.exercises.values(), limit))
+    return JsonResponse({"results": results}, status=200)
@@ -1,3 +1,59 @@
 from django.shortcuts import render
+from django.http import JsonResponse, HttpResponse
+from django.middleware.csrf import get_token
+from django.views.decorators.csrf import ensure_csrf_cookie
+from WorkoutApp.viewHandling.workoutViews import workoutLog, workoutList, workoutRecords, workoutAnalytics, exerciseSearch
 
-# Create your views here.
+@ensure_csrf_cookie
+def get_CSRF_token(request):
+    return JsonResponse({'csrfToken': get_token(request)})
+
+def workout(request):
+    """
+    A view to handle workout functions.
+    """
+    if request.method == 'POST':
+        return workoutLog(request)
+    elif request.method == 'GET':
+        return workoutList(request)
+
+    return HttpResponse(
+        content="Method not allowed",
+        content_type="text/plain",
+        status=400)
+
+def workout_records(request):
+    """
+    A view to handle personal records.
+    """
+    if request.method == 'GET':
+        return workoutRecords(request)
+
+    return HttpResponse(
+        content="Method not allowed",
+        content_type="text/plain",
+        status=400)
+
+def workout_analytics(request):
+    """
+    A view to handle training analytics.
+    """
+    if request.method == 'GET':
+        return workoutAnalytics(request)
+
+    return HttpResponse(
+        content="Method not allowed",
+        content_type="text/plain",
+        status=400)
+
+def exercise(request):
+    """
+    A view to handle the exercise catalogue.
+    """
+    if request.method == 'GET':
+        return exerciseSearch(request)
+
+    return HttpResponse(
+        content="Method not allowed",
+        content_type="text/plain",
+        status=400)
@@ -11,10 +11,21 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 from pathlib import Path
+import os
+import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Code shared by the services (the gymcommon package) lives in services/common.
+# docker-compose mounts it at /common and points GYM_COMMON_DIR there.
+COMMON_DIR = Path(os.environ.get("GYM_COMMON_DIR", BASE_DIR.parent / "common"))
+if str(COMMON_DIR) not in sys.path:
+    sys.path.append(str(COMMON_DIR))
+
+from gymcommon.databaseSettings import postgresDatabase, sqliteDatabase  # noqa: E402  Importable once COMMON_DIR is on sys.path
+from gymcommon.serviceSettings import metricsSettings, serviceTokenSettings, userServiceSettings  # noqa: E402
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
@@ -25,7 +36,11 @@ SECRET_KEY = 'django-insecure-e5d3m65ncw$mgnr(6(s(glvn-b4r9*(wi^wr$y)e2k(dmufqre
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = [
+    "127.0.0.1",
+    "workout-app",
+    "localhost"
+]
 
 
 # Application definition
@@ -37,14 +52,17 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'WorkoutApp',
 ]
 
 MIDDLEWARE = [
+    'gymcommon.metricsMiddleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'gymcommon.tokenMiddleware.ServiceTokenMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -73,13 +91,79 @@ WSGI_APPLICATION = 'WorkoutSite.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# DATABASE_ENGINE selects the backend: "sqlite" (default) or "postgresql".
+DATABASE_ENGINE = os.environ.get("DATABASE_ENGINE", "sqlite")
+
+# SQLite tuned on every new connection, unless SQLITE_TUNING=0, see services/common/gymcommon/databaseSettings.py
+SQLITE_DATABASE = sqliteDatabase(BASE_DIR / 'db_data/db.sqlite3')
+
+# PostgreSQL, see services/common/gymcommon/databaseSettings.py for the POSTGRES_* variables
+POSTGRES_DATABASE = postgresDatabase("workouts")
+
 DATABASES = {
+    'default': POSTGRES_DATABASE if DATABASE_ENGINE == "postgresql" else SQLITE_DATABASE,
+}
+
+
+# Caches
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+# Backends the weekly training summary cache can use, picked with TRAINING_CACHE_BACKEND.
+# Summaries are keyed by (user id, week) and logging a workout deletes the affected weeks, which only reaches
+# other workers through a shared backend, so the default is file. locmem is per process, only use it with a single worker.
+TRAINING_CACHE_TIMEOUT = int(os.environ.get("TRAINING_CACHE_TIMEOUT", "600"))
+TRAINING_CACHE_MAX_ENTRIES = int(os.environ.get("TRAINING_CACHE_MAX_ENTRIES", "50000"))
+
+TRAINING_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'training-summaries',
+        'TIMEOUT': TRAINING_CACHE_TIMEOUT,
+        'OPTIONS': {'MAX_ENTRIES': TRAINING_CACHE_MAX_ENTRIES},
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get("TRAINING_CACHE_LOCATION", str(BASE_DIR / 'db_data/training_cache')),
+        'TIMEOUT': TRAINING_CACHE_TIMEOUT,
+        'OPTIONS': {'MAX_ENTRIES': TRAINING_CACHE_MAX_ENTRIES},
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get("REDIS_URL", 'redis://localhost:6379/0'),
+        'KEY_PREFIX': 'training-summaries',
+        'TIMEOUT': TRAINING_CACHE_TIMEOUT,
+    },
+}
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db_data/db.sqlite3',
-    }
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'training_summaries': TRAINING_CACHE_BACKENDS[os.environ.get("TRAINING_CACHE_BACKEND", "file")],
 }
 
+TRAINING_SUMMARY_CACHE = 'training_summaries'
+
+# Every worker keeps the exercise catalogue in memory and reads its stored version at most
+# this often, so a change made through another worker shows up within this many seconds.
+EXERCISE_CATALOGUE_CHECK_SECONDS = float(os.environ.get("EXERCISE_CATALOGUE_CHECK_SECONDS", "5"))
+
+
+# Service tokens
+# SERVICE_TOKEN_* and the key file every service must read, see services/common/gymcommon/serviceSettings.py.
+globals().update(serviceTokenSettings(COMMON_DIR))
+# `manage.py test` writes the key file to a temporary directory instead, see services/common/gymcommon/testRunner.py.
+TEST_RUNNER = "gymcommon.testRunner.TestRunner"
+
+# Users service
+# USER_SERVICE_* for reaching the Users service, see services/common/gymcommon/serviceSettings.py.
+globals().update(userServiceSettings())
+
+
+# Request metrics
+# METRICS_* for the per-view request metrics and Server-Timing header, see services/common/gymcommon/serviceSettings.py.
+globals().update(metricsSettings(DEBUG))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -16,7 +16,14 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path
+from WorkoutApp.views import get_CSRF_token
+from WorkoutApp.views import workout, workout_records, workout_analytics, exercise  # Importing workout-related views
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-]
+    path('get_csrf_token/', get_CSRF_token, name='get_csrf_token'),
+    path('workout/', workout, name='workout'),  # URL for workout actions
+    path('workout/records/', workout_records, name='workout_records'),  # URL for personal records
+    path('exercise/', exercise, name='exercise'),  # URL for the exercise catalogue and autocomplete
+    path('workout/analytics/', workout_analytics, name='workout_analytics'),  # URL for weekly training summaries
+    ]
@@ -0,0 +1,42 @@
+"""
+Benchmarks for the Workouts service.
+
+Run from services/Workouts, e.g. `python -m benchmarks.sessionThroughput`.
+Every benchmark runs against a throwaway test database, never db_data/db.sqlite3.
+"""
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setupDjango():
+    """
+    Configures Django so a benchmark can be run as a plain script.
+    """
+    if str(BASE_DIR) not in sys.path:
+        sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "WorkoutSite.settings")
+
+    import django
+    django.setup()
+
+
+@contextmanager
+def benchmarkDatabase():
+    """
+    Creates a test database for the duration of the block and destroys it afterwards.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
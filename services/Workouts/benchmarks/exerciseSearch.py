@@ -0,0 +1,70 @@
+"""
+Times building the exercise catalogue's prefix index and answering autocomplete keystrokes from it,
+against a database LIKE query per keystroke.
+
+Usage: python -m benchmarks.exerciseSearch [--exercises N] [--aliases-per-exercise N]
+"""
+import argparse
+import random
+import time
+
+from benchmarks import setupDjango, benchmarkDatabase
+
+WORDS = [
+    "back", "front", "incline", "decline", "seated", "standing", "single", "arm", "leg", "cable", "dumbbell",
+    "barbell", "machine", "smith", "squat", "press", "row", "curl", "raise", "extension", "deadlift", "lunge",
+    "pulldown", "fly", "shrug", "bridge", "kickback", "pullover", "dip", "crunch",
+]
+
+
+def makeNames(count: int, seed: int = 1) -> list:
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < count:
+        names.add(" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 4))).title())
+    return sorted(names)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--exercises", type=int, default=5000)
+    parser.add_argument("--aliases-per-exercise", type=int, default=1)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    setupDjango()
+    from WorkoutApp.catalogue import clearCatalogue, getCatalogue
+    from WorkoutApp.models import Exercise, ExerciseAlias
+
+    names = makeNames(args.exercises)
+    rng = random.Random(2)
+    keystrokes = [name.lower()[:length] for name in rng.sample(names, min(args.queries, len(names))) for length in range(1, 6)]
+
+    with benchmarkDatabase():
+        exercises = Exercise.objects.bulk_create(Exercise(name=name) for name in names)
+        ExerciseAlias.objects.bulk_create(
+            ExerciseAlias(exercise=exercise, alias=f"{exercise.name} alt {i}")
+            for exercise in exercises for i in range(args.aliases_per_exercise)
+        )
+        clearCatalogue()
+
+        started = time.perf_counter()
+        catalogue = getCatalogue()
+        print(f"Loaded {len(catalogue.exercises)} exercises and built the index in {time.perf_counter() - started:.2f}s"
+              " (what each worker pays after a version bump)")
+
+        started = time.perf_counter()
+        for query in keystrokes:
+            catalogue.search(query, 10)
+        elapsed = time.perf_counter() - started
+        print(f"Index: {len(keystrokes)} keystrokes, {elapsed / len(keystrokes) * 1e6:.1f} us each")
+
+        started = time.perf_counter()
+        for query in keystrokes:
+            list(Exercise.objects.filter(name__istartswith=query).values_list("id", "name")[:10])
+        elapsed = time.perf_counter() - started
+        print(f"Database: {len(keystrokes)} keystrokes, {elapsed / len(keystrokes) * 1e6:.1f} us each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Reports sets/sec for POST /workout/ when the same sets are logged as sessions of different sizes.
+A session size of 1 approximates logging one set per request.
+
+Usage: python -m benchmarks.sessionThroughput [--sets N] [--session-sizes 1 5 20 100]
+"""
+import argparse
+import json
+import time
+
+from benchmarks import setupDjango, benchmarkDatabase
+
+
+def makeSession(exercise_ids: list, size: int, user_id: int) -> dict:
+    return {
+        "user_id": user_id,
+        "sets": [
+            {"exercise_id": exercise_ids[i % len(exercise_ids)], "reps": 5 + i % 6, "weight": 60 + (i % 20) * 2.5}
+            for i in range(size)
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sets", type=int, default=5000)
+    parser.add_argument("--session-sizes", type=int, nargs="+", default=[1, 5, 20, 100])
+    args = parser.parse_args()
+
+    setupDjango()
+    from django.test import Client
+    from WorkoutApp.models import Exercise, Workout, WorkoutSet
+
+    with benchmarkDatabase():
+        client = Client()
+        exercise_ids = [Exercise.objects.create(name=f"Exercise {i}").id for i in range(10)]
+
+        print(f"{'session size':>12} {'requests':>10} {'sets/s':>12}")
+        for size in args.session_sizes:
+            Workout.objects.all().delete()
+            bodies = [
+                json.dumps(makeSession(exercise_ids, size, user_id=request % 500 + 1))
+                for request in range(max(1, args.sets // size))
+            ]
+
+            started = time.perf_counter()
+            for body in bodies:
+                response = client.post("/workout/", data=body, content_type="application/json")
+                assert response.status_code == 201, response.content
+            elapsed = time.perf_counter() - started
+
+            print(f"{size:>12} {len(bodies):>10} {WorkoutSet.objects.count() / elapsed:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Times the vectorised training analytics over a synthetic year and the cached weekly summaries.
+
+Builds a year of sets for --users users (5k by default, --sessions-per-week sessions of
+--sets-per-session sets each), then times every metric for all users at once against a
+per-user Python loop run over --baseline-users users and scaled up to the full user count.
+Unless --skip-db is given, --db-users of those users are inserted into a test database and
+GET /workout/analytics/ is timed for a cold and a warm training summary cache.
+
+Usage: python -m benchmarks.trainingAnalytics [--users N] [--db-users N] [--skip-db]
+"""
+import argparse
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from benchmarks import setupDjango, benchmarkDatabase
+
+FIRST_DAY = date(2024, 1, 1)
+EXERCISES = 20
+
+
+def makeArrays(users: int, sessions_per_week: int, sets_per_session: int, seed: int = 1):
+    """
+    Returns (user_ids, exercise_ids, days, reps, weight_kg, session) sorted by user then day.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    sessions = 52 * sessions_per_week
+    session_users = np.repeat(np.arange(1, users + 1), sessions)
+    session_days = FIRST_DAY.toordinal() + np.sort(rng.integers(0, 364, (users, sessions)), axis=1).ravel()
+
+    session = np.repeat(np.arange(len(session_users)), sets_per_session)
+    exercise_ids = rng.integers(1, EXERCISES + 1, len(session))
+    strength = 40 + rng.random(users + 1) * 80
+    reps = rng.integers(1, 13, len(session))
+    weight_kg = np.round(strength[session_users[session]] * (1.1 - reps / 30) * rng.uniform(0.9, 1.1, len(session)), 1)
+    return session_users[session], exercise_ids, session_days[session], reps, weight_kg, session
+
+
+def pythonAnalytics(user_ids, exercise_ids, days, reps, weight_kg) -> int:
+    """
+    The loop this module replaces: one pass per user and exercise over plain Python values.
+    """
+    weekly, bests = {}, {}
+    for user_id, exercise_id, day, set_reps, weight in zip(user_ids, exercise_ids, days, reps, weight_kg):
+        week = day - (day - 1) % 7
+        weekly[(user_id, week)] = weekly.get((user_id, week), 0) + weight * set_reps
+        epley = weight if set_reps == 1 else weight * (1 + set_reps / 30)
+        brzycki = weight * 36 / (37 - set_reps)
+        best = bests.setdefault((user_id, exercise_id), [epley, brzycki])
+        best[0], best[1] = max(best[0], epley), max(best[1], brzycki)
+
+    first_weeks = {}
+    for user_id, week in weekly:
+        first_weeks[user_id] = min(first_weeks.get(user_id, week), week)
+
+    ratios = {}
+    for (user_id, week), tonnage in weekly.items():
+        history = min((week - first_weeks[user_id]) // 7 + 1, 4)
+        chronic = sum(weekly.get((user_id, week - 7 * offset), 0) for offset in range(4)) / history
+        ratios[(user_id, week)] = tonnage / chronic
+    return len(ratios)
+
+
+def timeIt(fn):
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def loadDatabase(arrays, db_users: int) -> int:
+    """
+    Inserts the sets of the first db_users users, one Workout per synthetic session.
+    """
+    from WorkoutApp.models import Exercise, Workout, WorkoutSet
+
+    user_ids, exercise_ids, days, reps, weight_kg, session = arrays
+    Exercise.objects.bulk_create(Exercise(id=i, name=f"Exercise {i}") for i in range(1, EXERCISES + 1))
+
+    selected = user_ids <= db_users
+    workouts = {}
+    for session_id, user_id, day in zip(session[selected], user_ids[selected], days[selected]):
+        if session_id not in workouts:
+            started_at = datetime.combine(date.fromordinal(int(day)), datetime.min.time(), dt_timezone.utc) + timedelta(hours=18)
+            workouts[session_id] = Workout(user_id=int(user_id), started_at=started_at)
+    Workout.objects.bulk_create(workouts.values(), batch_size=2000)
+
+    numbers = {}
+    sets = []
+    for session_id, user_id, exercise_id, set_reps, weight in zip(
+        session[selected], user_ids[selected], exercise_ids[selected], reps[selected], weight_kg[selected]
+    ):
+        numbers[session_id] = numbers.get(session_id, 0) + 1
+        sets.append(WorkoutSet(
+            workout=workouts[session_id], user_id=int(user_id), exercise_id=int(exercise_id),
+            set_number=numbers[session_id], reps=int(set_reps), weight_kg=Decimal(f"{weight:.2f}"),
+        ))
+    WorkoutSet.objects.bulk_create(sets, batch_size=2000)
+    return len(sets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--sessions-per-week", type=int, default=2)
+    parser.add_argument("--sets-per-session", type=int, default=12)
+    parser.add_argument("--baseline-users", type=int, default=250)
+    parser.add_argument("--db-users", type=int, default=200)
+    parser.add_argument("--skip-db", action="store_true", help="Skip inserting into and querying the database.")
+    args = parser.parse_args()
+
+    setupDjango()
+    from WorkoutApp.analytics import TrainingSeries, summariseWeek
+
+    arrays = makeArrays(args.users, args.sessions_per_week, args.sets_per_session)
+    user_ids, exercise_ids, days, reps, weight_kg, _ = arrays
+    series = TrainingSeries(user_ids, exercise_ids, days, reps, weight_kg)
+    week = date(2024, 6, 3)
+    size = sum(column.nbytes for column in (series.user_ids, series.exercise_ids, series.days, series.reps, series.weight_kg))
+    print(f"{len(series)} sets across {args.users} users over a year, {size / 1048576:.0f} MB of arrays")
+
+    print(f"{'metric':>22} {'seconds':>10}")
+    for name, fn in [
+        ("weekly tonnage", series.weeklyTonnage),
+        ("epley + brzycki", lambda: (series.epley(), series.brzycki())),
+        ("best 1RM per exercise", series.bestOneRepMax),
+        ("workload ratios", series.workloadRatios),
+        ("one week summaries", lambda: summariseWeek(series, week)),
+    ]:
+        print(f"{name:>22} {timeIt(fn)[0]:>10.3f}")
+
+    baseline = user_ids <= args.baseline_users
+    columns = [column[baseline].tolist() for column in (user_ids, exercise_ids, days, reps, weight_kg)]
+    elapsed, _ = timeIt(lambda: pythonAnalytics(*columns))
+    print(f"{'python loop (scaled)':>22} {elapsed * args.users / args.baseline_users:>10.3f}")
+
+    if args.skip_db:
+        return
+
+    from django.test import Client
+    from WorkoutApp.trainingCache import getTrainingCache
+
+    with benchmarkDatabase():
+        elapsed, count = timeIt(lambda: loadDatabase(arrays, args.db_users))
+        print(f"\nInserted {count} sets for {args.db_users} users in {elapsed:.1f}s")
+
+        elapsed, loaded = timeIt(lambda: TrainingSeries.load())
+        print(f"TrainingSeries.load of every set: {elapsed:.3f}s ({len(loaded) / elapsed:.0f} sets/s)")
+
+        client = Client()
+        params = {"user_ids": ",".join(str(i) for i in range(1, args.db_users + 1)), "week": week.isoformat()}
+        getTrainingCache().clear()
+        for label in ("cold cache", "warm cache"):
+            elapsed, response = timeIt(lambda: client.get("/workout/analytics/", params))
+            assert response.status_code == 200, response.content
+            print(f"GET /workout/analytics/ for {args.db_users} users, {label}: {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
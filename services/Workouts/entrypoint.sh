@@ -0,0 +1,18 @@
+#!/bin/sh
+# Starts the service in the mode selected by SERVER_MODE:
+#   dev  - Django's development server (default)
+#   wsgi - gunicorn running WorkoutSite.wsgi
+#   asgi - gunicorn with uvicorn workers running WorkoutSite.asgi
+set -e
+
+case "${SERVER_MODE:-dev}" in
+    wsgi)
+        exec gunicorn WorkoutSite.wsgi:application -c gunicorn.conf.py
+        ;;
+    asgi)
+        exec gunicorn WorkoutSite.asgi:application -c gunicorn.conf.py
+        ;;
+    *)
+        exec python3 manage.py runserver 0.0.0.0:${PORT:-8002}
+        ;;
+esac
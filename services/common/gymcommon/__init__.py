@@ -0,0 +1,3 @@
+"""
+Code shared by the GymApp services. Each service's settings put services/common on sys.path.
+"""
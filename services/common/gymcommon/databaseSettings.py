@@ -0,0 +1,72 @@
+"""
+DATABASES entries shared by the services' settings, configured from the environment.
+
+Each service passes its own defaults, the environment variables are the same for all of them:
+    SQLITE_TUNING                  apply sqlitePragmas() and IMMEDIATE transactions (default 1)
+    SQLITE_JOURNAL_MODE, SQLITE_BUSY_TIMEOUT_MS, SQLITE_SYNCHRONOUS, SQLITE_MMAP_SIZE,
+    SQLITE_CACHE_SIZE, SQLITE_TEMP_STORE, SQLITE_TRANSACTION_MODE
+    POSTGRES_DB, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_HOST, POSTGRES_PORT
+    POSTGRES_POOL                  use Django's psycopg connection pool (default 1)
+    POSTGRES_POOL_MIN_SIZE         connections the pool keeps open (default 2)
+    POSTGRES_POOL_MAX_SIZE         most connections the pool opens (default 10)
+    POSTGRES_POOL_TIMEOUT          seconds to wait for a pooled connection (default 10)
+    DATABASE_CONN_MAX_AGE          seconds a connection is kept without the pool (default 60)
+"""
+import os
+
+
+def sqliteTuning(environ=os.environ) -> bool:
+    return environ.get("SQLITE_TUNING", "1") == "1"
+
+def sqlitePragmas(environ=os.environ) -> dict:
+    """
+    Returns the PRAGMAs run on every new SQLite connection when tuning is on.
+    WAL lets readers run alongside the writer, busy_timeout waits for locks instead of failing.
+    """
+    return {
+        "journal_mode": environ.get("SQLITE_JOURNAL_MODE", "WAL"),
+        "busy_timeout": environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000"),
+        "synchronous": environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "mmap_size": environ.get("SQLITE_MMAP_SIZE", str(128 * 1024 * 1024)),
+        "cache_size": environ.get("SQLITE_CACHE_SIZE", "-20000"),  # Negative values are KiB
+        "temp_store": environ.get("SQLITE_TEMP_STORE", "MEMORY"),
+    }
+
+def sqliteDatabase(path, environ=os.environ) -> dict:
+    """
+    Returns the SQLite database stored at path, tuned through init_command unless SQLITE_TUNING=0.
+    IMMEDIATE transactions take the write lock up front so lock upgrades cannot deadlock.
+    """
+    tuning = sqliteTuning(environ)
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': path,
+        'OPTIONS': {
+            'init_command': ";".join(f"PRAGMA {name}={value}" for name, value in sqlitePragmas(environ).items()) if tuning else "",
+            'transaction_mode': environ.get("SQLITE_TRANSACTION_MODE", "IMMEDIATE") if tuning else None,
+        },
+    }
+
+def postgresDatabase(name: str, environ=os.environ) -> dict:
+    """
+    Returns the PostgreSQL database for a service whose database is called name unless POSTGRES_DB says otherwise.
+    Connections come from the psycopg pool, or are kept per thread for DATABASE_CONN_MAX_AGE seconds with POSTGRES_POOL=0.
+    """
+    pool = environ.get("POSTGRES_POOL", "1") == "1"
+    return {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': environ.get("POSTGRES_DB", name),
+        'USER': environ.get("POSTGRES_USER", "postgres"),
+        'PASSWORD': environ.get("POSTGRES_PASSWORD", "postgres"),
+        'HOST': environ.get("POSTGRES_HOST", "localhost"),
+        'PORT': environ.get("POSTGRES_PORT", "5432"),
+        'CONN_MAX_AGE': 0 if pool else int(environ.get("DATABASE_CONN_MAX_AGE", "60")),  # The pool manages connection lifetime itself
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'pool': {
+                'min_size': int(environ.get("POSTGRES_POOL_MIN_SIZE", "2")),
+                'max_size': int(environ.get("POSTGRES_POOL_MAX_SIZE", "10")),
+                'timeout': float(environ.get("POSTGRES_POOL_TIMEOUT", "10")),
+            },
+        } if pool else {},
+    }
@@ -0,0 +1,188 @@
+"""
+Django middleware measuring what every request costs, see gymcommon.requestMetrics.
+
+Each request's database queries, SQL time, wall time and response size are added to per-view
+counters served in the Prometheus format at METRICS_PATH, and sent back in a Server-Timing header.
+Slow requests are counted, and a sample of them is logged with their slowest query.
+Install it first in MIDDLEWARE so the time spent in the other middleware is included.
+Streamed responses are recorded once their body has been sent, and their queries are counted while it is.
+
+Settings:
+    METRICS_ENABLED               measure requests at all (default True)
+    METRICS_PATH                  where the metrics are served (default "/metrics")
+    METRICS_TOKEN                 the metrics are only served with "Authorization: Bearer <token>";
+                                  without one they are only served when DEBUG is on
+    METRICS_SERVER_TIMING         add the Server-Timing header (default DEBUG)
+    METRICS_SLOW_REQUEST_SECONDS  requests at least this slow are counted as slow (default 0.5)
+    METRICS_SLOW_SAMPLE_RATE      fraction of slow requests logged (default 0.1)
+"""
+import hmac
+import logging
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+from django.urls import Resolver404, resolve
+
+from gymcommon.requestMetrics import CONTENT_TYPE, MetricsRegistry, RequestStats, serverTiming
+
+HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+BEARER_PREFIX = "Bearer "
+
+logger = logging.getLogger("gymcommon.metrics")
+registry = MetricsRegistry()
+
+# The stats of the request being served. Context variables follow the request into sync_to_async threads.
+currentStats = ContextVar("request_stats", default=None)
+
+
+#QUERY RECORDING
+def recordQuery(execute, sql, params, many, context):
+    stats = currentStats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.recordQuery(sql, time.perf_counter() - start)
+
+def installQueryRecorder(connection, **kwargs) -> None:
+    if recordQuery not in connection.execute_wrappers:
+        connection.execute_wrappers.append(recordQuery)
+
+# Connections are per thread, so new ones get the recorder as they connect
+connection_created.connect(installQueryRecorder)
+
+
+#MIDDLEWARE
+class RequestMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "METRICS_ENABLED", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        for connection in connections.all(initialized_only=True):
+            installQueryRecorder(connection)  # Opened before this module was imported
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if request.path == getattr(settings, "METRICS_PATH", "/metrics"):
+            return metricsResponse(request)
+
+        stats = RequestStats()
+        token = currentStats.set(stats)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            currentStats.reset(token)
+        return finishRequest(request, response, stats, start)
+
+    async def __acall__(self, request):
+        if request.path == getattr(settings, "METRICS_PATH", "/metrics"):
+            return metricsResponse(request)
+
+        stats = RequestStats()
+        token = currentStats.set(stats)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            currentStats.reset(token)
+        return finishRequest(request, response, stats, start)
+
+
+def finishRequest(request, response, stats: RequestStats, start: float):
+    """
+    Records the request and adds its Server-Timing header. A streamed body is wrapped instead,
+    so it is recorded when the last chunk has been sent; its header only covers the time to the first byte.
+    """
+    seconds = time.perf_counter() - start
+    if getattr(settings, "METRICS_SERVER_TIMING", settings.DEBUG):
+        timing = serverTiming(stats, seconds)
+        response["Server-Timing"] = f"{response['Server-Timing']}, {timing}" if response.has_header("Server-Timing") else timing
+
+    if not response.streaming:
+        recordRequest(request, response, stats, seconds, len(response.content))
+    elif response.is_async:
+        response.streaming_content = streamAsync(response.streaming_content, request, response, stats, start)
+    else:
+        response.streaming_content = streamSync(response.streaming_content, request, response, stats, start)
+    return response
+
+def streamSync(content, request, response, stats: RequestStats, start: float):
+    chunks = iter(content)
+    size = 0
+    try:
+        while True:
+            token = currentStats.set(stats)  # The body is read after the middleware has returned
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                return
+            finally:
+                currentStats.reset(token)
+            size += len(chunk)
+            yield chunk
+    finally:
+        recordRequest(request, response, stats, time.perf_counter() - start, size)
+
+async def streamAsync(content, request, response, stats: RequestStats, start: float):
+    chunks = aiter(content)
+    size = 0
+    try:
+        while True:
+            token = currentStats.set(stats)
+            try:
+                chunk = await anext(chunks)
+            except StopAsyncIteration:
+                return
+            finally:
+                currentStats.reset(token)
+            size += len(chunk)
+            yield chunk
+    finally:
+        recordRequest(request, response, stats, time.perf_counter() - start, size)
+
+def recordRequest(request, response, stats: RequestStats, seconds: float, response_bytes: int) -> None:
+    view = viewName(request)
+    method = request.method if request.method in HTTP_METHODS else "other"  # Keeps the label set bounded
+    slow = seconds >= getattr(settings, "METRICS_SLOW_REQUEST_SECONDS", 0.5)
+    registry.record(view, method, response.status_code, seconds, stats, response_bytes, slow)
+
+    if slow and random.random() < getattr(settings, "METRICS_SLOW_SAMPLE_RATE", 0.1):
+        logger.warning(
+            "Slow request %s %s (%s) %d: %.1f ms, %d queries in %.1f ms, slowest %.1f ms: %s",
+            request.method, request.path, view, response.status_code, seconds * 1000,
+            stats.queries, stats.sql_seconds * 1000, stats.slowest_sql_seconds * 1000, stats.slowest_sql,
+        )
+
+def viewName(request) -> str:
+    match = request.resolver_match
+    if match is None:  # Answered by a middleware before the URL was resolved, e.g. a rejected token
+        try:
+            match = resolve(request.path_info, getattr(request, "urlconf", None))
+        except Resolver404:
+            return "unmatched"
+    return match.view_name
+
+def metricsResponse(request) -> HttpResponse:
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if not token and not settings.DEBUG:
+        return HttpResponse("Not Found", status=404)  # Never public in production
+    if token and not hmac.compare_digest(request.headers.get("Authorization", "").encode(), f"{BEARER_PREFIX}{token}".encode()):
+        return HttpResponse("Unauthorized", status=401)
+    return HttpResponse(registry.render(), content_type=CONTENT_TYPE)
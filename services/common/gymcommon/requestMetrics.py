@@ -0,0 +1,128 @@
+"""
+Per-view request metrics kept in memory and rendered in the Prometheus text format.
+
+Each worker process keeps its own counters. Recording a request takes one lock and a few additions,
+so the metrics can stay on in production.
+"""
+import threading
+from bisect import bisect_left
+
+# Upper bounds in seconds of the request duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class RequestStats:
+    """
+    What one request has cost so far. The slowest query is kept by reference, so SQL is only formatted when it is logged.
+    """
+    __slots__ = ("queries", "sql_seconds", "slowest_sql", "slowest_sql_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.sql_seconds = 0.0
+        self.slowest_sql = None
+        self.slowest_sql_seconds = 0.0
+
+    def recordQuery(self, sql: str, seconds: float) -> None:
+        self.queries += 1
+        self.sql_seconds += seconds
+        if seconds > self.slowest_sql_seconds:
+            self.slowest_sql = sql
+            self.slowest_sql_seconds = seconds
+
+
+class ViewMetrics:
+    __slots__ = ("requests", "seconds", "buckets", "queries", "sql_seconds", "response_bytes", "slow_requests")
+
+    def __init__(self):
+        self.requests = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(DURATION_BUCKETS) + 1)  # Not cumulative, the last one is +Inf
+        self.queries = 0
+        self.sql_seconds = 0.0
+        self.response_bytes = 0
+        self.slow_requests = 0
+
+
+class MetricsRegistry:
+    """
+    Request metrics labelled by view, method and status class (2xx, 4xx, ...).
+    """
+
+    def __init__(self, prefix: str = "gym"):
+        self.prefix = prefix
+        self.lock = threading.Lock()
+        self.views = {}
+
+    def record(self, view: str, method: str, status: int, seconds: float, stats: RequestStats, response_bytes: int, slow: bool) -> None:
+        key = (view, method, f"{status // 100}xx")
+        bucket = bisect_left(DURATION_BUCKETS, seconds)
+        with self.lock:
+            metrics = self.views.get(key)
+            if metrics is None:
+                metrics = self.views[key] = ViewMetrics()
+            metrics.requests += 1
+            metrics.seconds += seconds
+            metrics.buckets[bucket] += 1
+            metrics.queries += stats.queries
+            metrics.sql_seconds += stats.sql_seconds
+            metrics.response_bytes += response_bytes
+            metrics.slow_requests += slow
+
+    def reset(self) -> None:
+        with self.lock:
+            self.views = {}
+
+    def render(self) -> str:
+        """
+        Returns every metric in the Prometheus text exposition format.
+        """
+        with self.lock:
+            snapshot = [(key, self.snapshotOf(metrics)) for key, metrics in sorted(self.views.items())]
+
+        p = self.prefix
+        families = [
+            (f"{p}_http_requests_total", "counter", "Requests served.", "requests"),
+            (f"{p}_http_request_duration_seconds", "histogram", "Wall time spent serving requests.", None),
+            (f"{p}_http_db_queries_total", "counter", "Database queries run while serving requests.", "queries"),
+            (f"{p}_http_db_duration_seconds_total", "counter", "Time spent in database queries while serving requests.", "sql_seconds"),
+            (f"{p}_http_response_bytes_total", "counter", "Response body bytes sent.", "response_bytes"),
+            (f"{p}_http_slow_requests_total", "counter", "Requests slower than the slow request threshold.", "slow_requests"),
+        ]
+        lines = []
+        for name, kind, help_text, attribute in families:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (view, method, status), metrics in snapshot:
+                labels = f'view="{escapeLabel(view)}",method="{escapeLabel(method)}",status="{status}"'
+                if attribute is not None:
+                    lines.append(f"{name}{{{labels}}} {formatValue(metrics[attribute])}")
+                    continue
+
+                cumulative = 0
+                for bound, count in zip(DURATION_BUCKETS + ("+Inf",), metrics["buckets"]):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"{name}_sum{{{labels}}} {formatValue(metrics['seconds'])}")
+                lines.append(f"{name}_count{{{labels}}} {metrics['requests']}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def snapshotOf(metrics: ViewMetrics) -> dict:
+        snapshot = {name: getattr(metrics, name) for name in ViewMetrics.__slots__}
+        snapshot["buckets"] = list(metrics.buckets)
+        return snapshot
+
+
+def escapeLabel(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def formatValue(value) -> str:
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+def serverTiming(stats: RequestStats, seconds: float) -> str:
+    """
+    Returns the Server-Timing header value for a request, durations in milliseconds.
+    """
+    return f'db;dur={stats.sql_seconds * 1000:.1f};desc="{stats.queries} queries", total;dur={seconds * 1000:.1f}'
@@ -0,0 +1,231 @@
+"""
+A small HTTP client for calls between the services, built on http.client.
+
+Connections to a service are kept alive and reused from a pool, every call has a timeout,
+idempotent calls are retried with jittered exponential backoff, and a circuit breaker stops
+calling a service that keeps failing so callers fail fast instead of queueing behind timeouts.
+"""
+import http.client
+import json
+import random
+import threading
+import time
+from urllib.parse import urlencode, urlsplit
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+RETRYABLE_STATUSES = frozenset({502, 503, 504})
+
+
+class ServiceError(Exception):
+    pass
+
+class ServiceUnavailable(ServiceError):
+    """
+    The service could not be reached, timed out or kept answering 502/503/504.
+    """
+
+class CircuitOpen(ServiceUnavailable):
+    """
+    The call was not attempted because the service's circuit breaker is open.
+    """
+
+class ServiceResponseError(ServiceError):
+    """
+    The service answered with a status the caller did not accept.
+    """
+
+    def __init__(self, response):
+        super().__init__(f"{response.status} from {response.url}")
+        self.response = response
+
+
+class Response:
+    def __init__(self, url: str, status: int, headers: dict, body: bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body)
+
+
+#CONNECTIONS
+class ConnectionPool:
+    """
+    Idle keep-alive connections to one host, most recently used first.
+    At most max_idle are kept; any number may be in use at once.
+    """
+
+    def __init__(self, scheme: str, host: str, port: int, max_idle: int = 10):
+        self.connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        self.host = host
+        self.port = port
+        self.max_idle = max_idle
+        self.lock = threading.Lock()
+        self.idle = []
+        self.created = 0
+
+    def acquire(self, timeout: float):
+        """
+        Returns (connection, reused), setting the connection's timeout for the coming call.
+        """
+        with self.lock:
+            connection = self.idle.pop() if self.idle else None
+        if connection is None:
+            return self.connect(timeout), False
+
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection, True
+
+    def connect(self, timeout: float):
+        with self.lock:
+            self.created += 1
+        return self.connection_class(self.host, self.port, timeout=timeout)
+
+    def release(self, connection) -> None:
+        with self.lock:
+            if len(self.idle) < self.max_idle:
+                self.idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for connection in idle:
+            connection.close()
+
+
+#CIRCUIT BREAKER
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures and rejects calls for reset_seconds.
+    Then one trial call is let through (half open): success closes the circuit, failure opens it again.
+    """
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow(self) -> bool:
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self.clock() - self.opened_at >= self.reset_seconds:
+                self.state = self.HALF_OPEN
+                return True
+            return False  # Open, or half open with the trial call still running
+
+    def recordSuccess(self) -> None:
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def recordFailure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+
+
+#CLIENT
+class ServiceClient:
+    """
+    Calls one service at base_url. timeout applies to every attempt, retries only to idempotent
+    calls, and each retry waits a random time up to backoff x 2^attempt, capped at max_backoff.
+    """
+
+    def __init__(
+        self, base_url: str, timeout: float = 2.0, retries: int = 2, backoff: float = 0.05, max_backoff: float = 1.0,
+        max_idle: int = 10, breaker=None, headers=None, rng=random.random, sleep=time.sleep,
+    ):
+        parts = urlsplit(base_url)
+        self.base_path = parts.path.rstrip("/")
+        self.pool = ConnectionPool(parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80), max_idle)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker = breaker or CircuitBreaker()
+        self.headers = dict(headers or {})
+        self.rng = rng
+        self.sleep = sleep
+
+    def request(self, method: str, path: str, params=None, json_body=None, headers=None, timeout=None, idempotent=None, ok=(200,)) -> Response:
+        """
+        Sends the request and returns the Response once the service answers with a status in ok.
+        Raises ServiceResponseError for other answers, ServiceUnavailable when the service cannot answer.
+        """
+        method = method.upper()
+        url = self.base_path + path + (f"?{urlencode(params, doseq=True)}" if params else "")
+        body = None if json_body is None else json.dumps(json_body, separators=(",", ":")).encode("utf-8")
+        request_headers = dict(self.headers, **(headers or {}))
+        if body is not None:
+            request_headers["Content-Type"] = "application/json"
+        attempts = 1 + (self.retries if (method in IDEMPOTENT_METHODS if idempotent is None else idempotent) else 0)
+
+        for attempt in range(attempts):
+            if not self.breaker.allow():
+                raise CircuitOpen(f"Circuit open for {self.pool.host}:{self.pool.port}")
+
+            try:
+                response = self.send(method, url, body, request_headers, self.timeout if timeout is None else timeout)
+            except (OSError, http.client.HTTPException) as e:
+                self.breaker.recordFailure()
+                failure = ServiceUnavailable(f"{method} {url} failed: {e!r}")
+            else:
+                if response.status not in RETRYABLE_STATUSES:
+                    self.breaker.recordSuccess()
+                    if response.status in ok:
+                        return response
+                    raise ServiceResponseError(response)
+                self.breaker.recordFailure()
+                failure = ServiceUnavailable(f"{method} {url} answered {response.status}")
+
+            if attempt + 1 < attempts:
+                self.sleep(self.rng() * min(self.max_backoff, self.backoff * 2 ** attempt))
+        raise failure
+
+    def send(self, method: str, url: str, body, headers: dict, timeout: float) -> Response:
+        connection, reused = self.pool.acquire(timeout)
+        try:
+            try:
+                connection.request(method, url, body=body, headers=headers)
+                raw = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # The service closed the idle connection; nothing was processed, so try once on a new one
+                connection.close()
+                connection = self.pool.connect(timeout)
+                connection.request(method, url, body=body, headers=headers)
+                raw = connection.getresponse()
+            response = Response(url, raw.status, dict(raw.getheaders()), raw.read())
+        except BaseException:
+            connection.close()
+            raise
+
+        if raw.will_close:
+            connection.close()
+        else:
+            self.pool.release(connection)
+        return response
+
+    def get(self, path: str, params=None, **kwargs) -> Response:
+        return self.request("GET", path, params=params, **kwargs)
+
+    def post(self, path: str, json_body=None, **kwargs) -> Response:
+        return self.request("POST", path, json_body=json_body, **kwargs)
+
+    def close(self) -> None:
+        self.pool.close()
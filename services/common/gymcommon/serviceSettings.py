@@ -0,0 +1,57 @@
+"""
+Settings every service shares, configured from the environment so the defaults cannot drift between services.
+Each helper returns a dict of settings; a service's settings.py merges it with globals().update().
+
+Service tokens, signed at login by the Users service and verified locally by the Weights and Workouts services,
+see gymcommon.serviceTokens. Every service must read the same key file:
+    SERVICE_TOKEN_KEY_FILE         the signing keys (default <common dir>/keys/service_tokens.json);
+                                   the Users service creates it on first use, `manage.py rotate_signing_keys` adds a key
+    SERVICE_TOKEN_TTL              seconds a token issued by the Users service is valid (default 900)
+    SERVICE_TOKEN_REQUIRED         reject requests without a token (default 0); otherwise they are served
+                                   with request.token_user_id set to None
+    SERVICE_TOKEN_CACHE_SIZE       verified tokens remembered per worker (default 10000)
+
+The Users service, as reached by the Weights and Workouts services, see gymcommon.usersClient:
+    USER_SERVICE_URL               where it listens (default http://127.0.0.1:8000)
+    USER_SERVICE_TIMEOUT           seconds before a call times out (default 2)
+    USER_SERVICE_RETRIES           times a lookup is retried (default 2)
+    USER_SERVICE_FAILURE_THRESHOLD failures in a row before calls fail fast (default 5)
+    USER_SERVICE_RESET_SECONDS     how long calls fail fast for (default 30)
+
+Request metrics, see gymcommon.metricsMiddleware. Counters are kept per worker process:
+    METRICS_ENABLED                measure requests at all (default 1)
+    METRICS_PATH                   where the Prometheus metrics are served (default /metrics)
+    METRICS_TOKEN                  the metrics need "Authorization: Bearer <token>"; without one they are only served while DEBUG is on
+    METRICS_SERVER_TIMING          send the Server-Timing header (default 1 while DEBUG is on, 0 otherwise)
+    METRICS_SLOW_REQUEST_SECONDS   requests at least this slow are counted as slow (default 0.5)
+    METRICS_SLOW_SAMPLE_RATE       fraction of slow requests logged with their slowest query (default 0.1)
+"""
+import os
+
+
+def serviceTokenSettings(common_dir, environ=os.environ) -> dict:
+    return {
+        "SERVICE_TOKEN_KEY_FILE": environ.get("SERVICE_TOKEN_KEY_FILE", str(common_dir / "keys" / "service_tokens.json")),
+        "SERVICE_TOKEN_TTL": int(environ.get("SERVICE_TOKEN_TTL", "900")),
+        "SERVICE_TOKEN_REQUIRED": environ.get("SERVICE_TOKEN_REQUIRED", "0") == "1",
+        "SERVICE_TOKEN_CACHE_SIZE": int(environ.get("SERVICE_TOKEN_CACHE_SIZE", "10000")),
+    }
+
+def userServiceSettings(environ=os.environ) -> dict:
+    return {
+        "USER_SERVICE_URL": environ.get("USER_SERVICE_URL", "http://127.0.0.1:8000"),
+        "USER_SERVICE_TIMEOUT": float(environ.get("USER_SERVICE_TIMEOUT", "2")),
+        "USER_SERVICE_RETRIES": int(environ.get("USER_SERVICE_RETRIES", "2")),
+        "USER_SERVICE_FAILURE_THRESHOLD": int(environ.get("USER_SERVICE_FAILURE_THRESHOLD", "5")),
+        "USER_SERVICE_RESET_SECONDS": float(environ.get("USER_SERVICE_RESET_SECONDS", "30")),
+    }
+
+def metricsSettings(debug: bool, environ=os.environ) -> dict:
+    return {
+        "METRICS_ENABLED": environ.get("METRICS_ENABLED", "1") == "1",
+        "METRICS_PATH": environ.get("METRICS_PATH", "/metrics"),
+        "METRICS_TOKEN": environ.get("METRICS_TOKEN", ""),
+        "METRICS_SERVER_TIMING": environ.get("METRICS_SERVER_TIMING", "1" if debug else "0") == "1",
+        "METRICS_SLOW_REQUEST_SECONDS": float(environ.get("METRICS_SLOW_REQUEST_SECONDS", "0.5")),
+        "METRICS_SLOW_SAMPLE_RATE": float(environ.get("METRICS_SLOW_SAMPLE_RATE", "0.1")),
+    }
@@ -0,0 +1,210 @@
+"""
+Short-lived user tokens signed with HMAC-SHA256, shared by every service.
+
+The Users service issues a token at login; the other services verify it locally against the
+same key file, so an authenticated request costs them no call back to the Users service.
+
+A token is "<key id>.<payload>.<signature>", payload and signature base64url without padding.
+The payload is JSON {"sub": user id, "iat": issued at, "exp": expires at}, times in Unix seconds.
+"""
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+MALFORMED_TOKEN = "Token is malformed."
+UNKNOWN_KEY = "Token was signed with an unknown key."
+INVALID_SIGNATURE = "Token signature is invalid."
+EXPIRED_TOKEN = "Token has expired."
+
+KEY_BYTES = 32
+
+
+class TokenError(Exception):
+    pass
+
+
+def encodeSegment(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+def decodeSegment(segment: str) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+    except (binascii.Error, ValueError):
+        raise TokenError(MALFORMED_TOKEN)
+
+
+#KEYS
+class KeyRing:
+    """
+    The signing keys by id, oldest first. New tokens are signed with the active key;
+    tokens signed with any key in the ring verify, so a rotation does not log anyone out.
+    """
+
+    def __init__(self, keys: dict, active: str):
+        if active not in keys:
+            raise ValueError(f"Active key {active!r} is not in the key ring.")
+        self.keys = keys
+        self.active = active
+
+    @classmethod
+    def generate(cls):
+        kid = newKeyId()
+        return cls({kid: secrets.token_bytes(KEY_BYTES)}, kid)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        return cls({kid: decodeSegment(key) for kid, key in data["keys"].items()}, data["active"])
+
+    def save(self, path) -> None:
+        """
+        Writes the ring readable by its owner only, replacing the file atomically so readers never see half of it.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        data = {"active": self.active, "keys": {kid: encodeSegment(key) for kid, key in self.keys.items()}}
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".keys-")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=2)
+            os.chmod(temporary, 0o600)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def rotated(self, keep: int = 3):
+        """
+        Returns a ring with a new active key and the keep - 1 most recent existing keys.
+        Rotate less often than tokens live, or tokens signed with a dropped key stop verifying early.
+        """
+        kid = newKeyId()
+        kept = list(self.keys.items())[-(keep - 1):] if keep > 1 else []
+        return KeyRing(dict(kept, **{kid: secrets.token_bytes(KEY_BYTES)}), kid)
+
+def newKeyId() -> str:
+    return f"{int(time.time()):x}{secrets.token_hex(2)}"
+
+
+class KeyFile:
+    """
+    A key ring read from a file shared by the services, standing in for a secrets service.
+    The file's modification time is checked at most every check_seconds, and the ring reloaded when it changes.
+    """
+
+    def __init__(self, path, check_seconds: float = 5, create: bool = False):
+        self.path = str(path)
+        self.check_seconds = check_seconds
+        self.create = create
+        self.lock = threading.Lock()
+        self._ring = None
+        self._mtime = None
+        self._checked_at = 0.0
+
+    def ring(self) -> KeyRing:
+        now = time.monotonic()
+        if self._ring is not None and now - self._checked_at < self.check_seconds:
+            return self._ring
+
+        with self.lock:
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except FileNotFoundError:
+                if not self.create:
+                    raise
+                KeyRing.generate().save(self.path)
+                mtime = os.stat(self.path).st_mtime_ns
+
+            if mtime != self._mtime:
+                self._ring = KeyRing.load(self.path)
+                self._mtime = mtime
+            self._checked_at = now
+            return self._ring
+
+
+#SIGNING
+def sign(key: bytes, message: bytes) -> bytes:
+    return hmac.new(key, message, hashlib.sha256).digest()
+
+def issueToken(ring: KeyRing, user_id: int, ttl: int, now=None) -> str:
+    issued_at = int(time.time() if now is None else now)
+    payload = json.dumps({"sub": user_id, "iat": issued_at, "exp": issued_at + ttl}, separators=(",", ":"))
+    message = f"{ring.active}.{encodeSegment(payload.encode('utf-8'))}"
+    return f"{message}.{encodeSegment(sign(ring.keys[ring.active], message.encode('ascii')))}"
+
+def verifyToken(ring: KeyRing, token: str, now=None) -> dict:
+    """
+    Returns the token's claims, or raises TokenError when it is malformed, forged or expired.
+    """
+    try:
+        kid, payload, signature = token.split(".")
+    except ValueError:
+        raise TokenError(MALFORMED_TOKEN)
+
+    key = ring.keys.get(kid)
+    if key is None:
+        raise TokenError(UNKNOWN_KEY)
+
+    expected = sign(key, f"{kid}.{payload}".encode("ascii", "replace"))
+    if not hmac.compare_digest(expected, decodeSegment(signature)):
+        raise TokenError(INVALID_SIGNATURE)
+
+    try:
+        claims = json.loads(decodeSegment(payload))
+    except ValueError:
+        raise TokenError(MALFORMED_TOKEN)
+    if not isinstance(claims, dict) or not isinstance(claims.get("sub"), int) or not isinstance(claims.get("exp"), int):
+        raise TokenError(MALFORMED_TOKEN)
+
+    if claims["exp"] <= (time.time() if now is None else now):
+        raise TokenError(EXPIRED_TOKEN)
+    return claims
+
+
+#VERIFICATION
+class TokenVerifier:
+    """
+    Verifies tokens against a KeyFile, remembering up to cache_size verified tokens until they expire.
+    A client repeats the same token on every request until it is refreshed, so most requests
+    skip the HMAC and JSON decoding. The cache is emptied whenever the key ring changes.
+    """
+
+    def __init__(self, key_file: KeyFile, cache_size: int = 10000):
+        self.key_file = key_file
+        self.cache_size = cache_size
+        self.lock = threading.Lock()
+        self.cache = OrderedDict()
+        self.ring = None
+
+    def verify(self, token: str, now=None) -> dict:
+        now = time.time() if now is None else now
+        ring = self.key_file.ring()
+
+        with self.lock:
+            if ring is not self.ring:
+                self.cache.clear()  # Tokens signed with a retired key must fail from now on
+                self.ring = ring
+            claims = self.cache.get(token)
+            if claims is not None:
+                if claims["exp"] > now:
+                    self.cache.move_to_end(token)
+                    return claims
+                del self.cache[token]
+
+        claims = verifyToken(ring, token, now)
+
+        with self.lock:
+            if self.ring is ring:
+                self.cache[token] = claims
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+        return claims
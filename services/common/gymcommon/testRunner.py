@@ -0,0 +1,34 @@
+"""
+Test runner shared by the services, see TEST_RUNNER in each service's settings.
+"""
+import tempfile
+from pathlib import Path
+
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Runs the tests with settings that keep them out of the source tree:
+    signing keys are written to a temporary directory instead of services/common/keys.
+    Slow requests are not logged, since a cold test database makes many requests slow.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.key_directory = tempfile.TemporaryDirectory(prefix="gym-test-keys-")
+        self.test_settings = override_settings(**self.testSettings(Path(self.key_directory.name)))
+        self.test_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.test_settings.disable()
+        self.key_directory.cleanup()
+        super().teardown_test_environment(**kwargs)
+
+    @staticmethod
+    def testSettings(key_directory: Path) -> dict:
+        return {
+            "SERVICE_TOKEN_KEY_FILE": str(key_directory / "service_tokens.json"),
+            "METRICS_SLOW_SAMPLE_RATE": 0,
+        }
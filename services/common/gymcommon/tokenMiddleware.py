@@ -0,0 +1,71 @@
+"""
+Django middleware verifying the Users service's tokens locally, see gymcommon.serviceTokens.
+
+Settings:
+    SERVICE_TOKEN_KEY_FILE    path of the key file shared with the Users service
+    SERVICE_TOKEN_REQUIRED    reject requests without a token (default False)
+    SERVICE_TOKEN_EXEMPT_PATHS  path prefixes served without a token even when one is required
+    SERVICE_TOKEN_CACHE_SIZE  verified tokens remembered per worker (default 10000)
+
+Views check the user_id they are asked about against the token with validateTokenUser.
+"""
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.http import JsonResponse
+
+from gymcommon.serviceTokens import KeyFile, TokenError, TokenVerifier
+
+MISSING_TOKEN = "Authentication token is missing."
+KEYS_UNAVAILABLE = "Token keys are unavailable."
+WRONG_USER = "The token does not belong to this user."
+BEARER_PREFIX = "Bearer "
+
+
+@lru_cache(maxsize=None)
+def buildVerifier(path: str, cache_size: int) -> TokenVerifier:
+    return TokenVerifier(KeyFile(path), cache_size)
+
+def getVerifier() -> TokenVerifier:
+    return buildVerifier(str(settings.SERVICE_TOKEN_KEY_FILE), getattr(settings, "SERVICE_TOKEN_CACHE_SIZE", 10000))
+
+def validateTokenUser(request, *user_ids) -> None:
+    """
+    Raises PermissionDenied when the request carries a token and any of user_ids is not the token's user.
+    Requests without a token are only served when SERVICE_TOKEN_REQUIRED is off.
+    """
+    token_user_id = getattr(request, "token_user_id", None)
+    if token_user_id is not None and any(user_id != token_user_id for user_id in user_ids):
+        raise PermissionDenied(WRONG_USER)
+
+
+class ServiceTokenMiddleware:
+    """
+    Authenticates requests carrying "Authorization: Bearer <token>" and sets request.token_user_id
+    to the token's user, or None without a token. An invalid token is rejected with 401,
+    as is a missing one when SERVICE_TOKEN_REQUIRED is set.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.token_user_id = None
+        header = request.headers.get("Authorization", "")
+
+        if header.startswith(BEARER_PREFIX):
+            try:
+                claims = getVerifier().verify(header[len(BEARER_PREFIX):].strip())
+            except TokenError as e:
+                return JsonResponse({"error": str(e)}, status=401)
+            except OSError:
+                return JsonResponse({"error": KEYS_UNAVAILABLE}, status=503)  # The key file is missing or unreadable
+            request.token_user_id = claims["sub"]
+        elif getattr(settings, "SERVICE_TOKEN_REQUIRED", False) and not self.isExempt(request.path):
+            return JsonResponse({"error": MISSING_TOKEN}, status=401)
+
+        return self.get_response(request)
+
+    def isExempt(self, path: str) -> bool:
+        return path.startswith(tuple(getattr(settings, "SERVICE_TOKEN_EXEMPT_PATHS", ("/admin/", "/get_csrf_token/"))))
@@ -0,0 +1,51 @@
+"""
+Calls to the Users service from the other services.
+"""
+from functools import lru_cache
+
+from gymcommon.serviceClient import CircuitBreaker, ServiceClient
+
+LOOKUP_PATH = "/user/lookup/"
+MAX_LOOKUP_IDS = 100  # The most ids GET /user/lookup/ accepts in one request
+
+
+class UsersClient:
+    def __init__(self, client: ServiceClient, batch_size: int = MAX_LOOKUP_IDS):
+        self.client = client
+        self.batch_size = batch_size
+
+    def resolveUsers(self, user_ids, **kwargs) -> dict:
+        """
+        Returns {user id: public profile, or None when no such user exists} for every id given.
+        Ids are deduplicated and looked up batch_size at a time, one request per batch on a pooled connection.
+        """
+        unique = list(dict.fromkeys(int(user_id) for user_id in user_ids))
+        resolved = {}
+        for start in range(0, len(unique), self.batch_size):
+            batch = unique[start:start + self.batch_size]
+            body = self.client.get(LOOKUP_PATH, {"ids": ",".join(map(str, batch))}, **kwargs).json()
+            resolved.update({int(user_id): profile for user_id, profile in body["users"].items()})
+            resolved.update(dict.fromkeys(body["missing"]["ids"]))
+        return resolved
+
+
+@lru_cache(maxsize=None)
+def buildUsersClient(base_url: str, timeout: float, retries: int, failure_threshold: int, reset_seconds: float) -> UsersClient:
+    return UsersClient(ServiceClient(
+        base_url, timeout=timeout, retries=retries, breaker=CircuitBreaker(failure_threshold, reset_seconds),
+    ))
+
+def getUsersClient() -> UsersClient:
+    """
+    Returns this process's client for the Users service, configured by the Django settings
+    USER_SERVICE_URL, USER_SERVICE_TIMEOUT, USER_SERVICE_RETRIES, USER_SERVICE_FAILURE_THRESHOLD and USER_SERVICE_RESET_SECONDS.
+    """
+    from django.conf import settings
+
+    return buildUsersClient(
+        settings.USER_SERVICE_URL,
+        getattr(settings, "USER_SERVICE_TIMEOUT", 2.0),
+        getattr(settings, "USER_SERVICE_RETRIES", 2),
+        getattr(settings, "USER_SERVICE_FAILURE_THRESHOLD", 5),
+        getattr(settings, "USER_SERVICE_RESET_SECONDS", 30.0),
+    )
@@ -0,0 +1,101 @@
+"""
+A local HTTP server answering with scripted responses, for testing the service client.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class StubResponse:
+    def __init__(self, status=200, body=None, delay=0.0, close=False):
+        self.status = status
+        self.body = body if body is not None else {}
+        self.delay = delay
+        self.close = close
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so connection reuse can be observed
+
+    def respond(self):
+        stub = self.server.stub
+        length = int(self.headers.get("Content-Length") or 0)
+        stub.record(self, self.rfile.read(length) if length else b"")
+        reply = stub.nextResponse(self)
+
+        time.sleep(reply.delay)
+        payload = json.dumps(reply.body).encode("utf-8")
+        self.send_response(reply.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if reply.close:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass  # Clients that time out hang up mid reply
+
+
+class StubServer:
+    """
+    Serves on a free local port in a background thread. Replies are taken from script in order,
+    or built by handler(request) once the script runs out. Every request is recorded with the
+    client port it arrived on, which identifies the connection.
+    """
+
+    def __init__(self, script=(), handler=None):
+        self.script = list(script)
+        self.handler = handler
+        self.requests = []
+        self.lock = threading.Lock()
+        self.server = QuietHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.stub = self
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def record(self, request, body: bytes) -> None:
+        parts = urlsplit(request.path)
+        with self.lock:
+            self.requests.append({
+                "method": request.command,
+                "path": parts.path,
+                "query": {key: values[-1] for key, values in parse_qs(parts.query).items()},
+                "headers": dict(request.headers),
+                "body": body,
+                "client_port": request.client_address[1],
+            })
+
+    def nextResponse(self, request) -> StubResponse:
+        with self.lock:
+            if self.script:
+                return self.script.pop(0)
+            request_record = self.requests[-1]
+        return self.handler(request_record) if self.handler else StubResponse()
+
+    def connections(self) -> int:
+        return len({request["client_port"] for request in self.requests})
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,49 @@
+import unittest
+
+from gymcommon.databaseSettings import postgresDatabase, sqliteDatabase
+
+
+class SqliteDatabaseTests(unittest.TestCase):
+    def test_tuned_by_default(self):
+        database = sqliteDatabase("/data/db.sqlite3", environ={"SQLITE_BUSY_TIMEOUT_MS": "250"})
+
+        self.assertEqual(database["NAME"], "/data/db.sqlite3")
+        self.assertEqual(database["OPTIONS"]["transaction_mode"], "IMMEDIATE")
+        self.assertEqual(
+            database["OPTIONS"]["init_command"].split(";"),
+            ["PRAGMA journal_mode=WAL", "PRAGMA busy_timeout=250", "PRAGMA synchronous=NORMAL",
+             "PRAGMA mmap_size=134217728", "PRAGMA cache_size=-20000", "PRAGMA temp_store=MEMORY"],
+        )
+
+    def test_tuning_off(self):
+        database = sqliteDatabase("/data/db.sqlite3", environ={"SQLITE_TUNING": "0"})
+        self.assertEqual(database["OPTIONS"], {"init_command": "", "transaction_mode": None})
+
+
+class PostgresDatabaseTests(unittest.TestCase):
+    def test_defaults_use_the_pool(self):
+        database = postgresDatabase("weights", environ={})
+
+        self.assertEqual(database["NAME"], "weights")
+        self.assertEqual((database["HOST"], database["PORT"]), ("localhost", "5432"))
+        self.assertEqual(database["CONN_MAX_AGE"], 0)
+        self.assertEqual(database["OPTIONS"]["pool"], {"min_size": 2, "max_size": 10, "timeout": 10.0})
+
+    def test_environment_overrides(self):
+        database = postgresDatabase("weights", environ={
+            "POSTGRES_DB": "weights_test", "POSTGRES_HOST": "db", "POSTGRES_POOL_MAX_SIZE": "4",
+        })
+
+        self.assertEqual((database["NAME"], database["HOST"]), ("weights_test", "db"))
+        self.assertEqual(database["OPTIONS"]["pool"]["max_size"], 4)
+
+    def test_persistent_connections_without_the_pool(self):
+        database = postgresDatabase("users", environ={"POSTGRES_POOL": "0", "DATABASE_CONN_MAX_AGE": "30"})
+
+        self.assertEqual(database["CONN_MAX_AGE"], 30)
+        self.assertEqual(database["OPTIONS"], {})
+        self.assertTrue(database["CONN_HEALTH_CHECKS"])
+
+
+if __name__ == "__main__":
+    unittest.main()
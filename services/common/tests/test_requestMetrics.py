@@ -0,0 +1,78 @@
+import unittest
+
+from gymcommon.requestMetrics import MetricsRegistry, RequestStats, serverTiming
+
+
+def statsWith(*query_seconds):
+    stats = RequestStats()
+    for i, seconds in enumerate(query_seconds):
+        stats.recordQuery(f"SELECT {i}", seconds)
+    return stats
+
+
+class RequestStatsTests(unittest.TestCase):
+    def test_totals_and_slowest_query(self):
+        stats = statsWith(0.002, 0.010, 0.001)
+
+        self.assertEqual(stats.queries, 3)
+        self.assertAlmostEqual(stats.sql_seconds, 0.013)
+        self.assertEqual(stats.slowest_sql, "SELECT 1")
+        self.assertEqual(stats.slowest_sql_seconds, 0.010)
+
+    def test_server_timing(self):
+        self.assertEqual(serverTiming(statsWith(0.0012, 0.003), 0.0256), 'db;dur=4.2;desc="2 queries", total;dur=25.6')
+
+
+class MetricsRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def samples(self) -> dict:
+        lines = self.registry.render().splitlines()
+        return dict(line.rsplit(" ", 1) for line in lines if not line.startswith("#"))
+
+    def test_counters_by_view_method_and_status_class(self):
+        self.registry.record("user", "GET", 200, 0.02, statsWith(0.001), 120, False)
+        self.registry.record("user", "GET", 201, 0.70, statsWith(0.2, 0.1), 80, True)
+        self.registry.record("user", "GET", 404, 0.01, statsWith(0.001), 30, False)
+
+        samples = self.samples()
+        labels = 'view="user",method="GET",status="2xx"'
+        self.assertEqual(samples[f"gym_http_requests_total{{{labels}}}"], "2")
+        self.assertEqual(samples[f"gym_http_db_queries_total{{{labels}}}"], "3")
+        self.assertEqual(samples[f"gym_http_response_bytes_total{{{labels}}}"], "200")
+        self.assertEqual(samples[f"gym_http_slow_requests_total{{{labels}}}"], "1")
+        self.assertAlmostEqual(float(samples[f"gym_http_db_duration_seconds_total{{{labels}}}"]), 0.301)
+        self.assertEqual(samples['gym_http_requests_total{view="user",method="GET",status="4xx"}'], "1")
+
+    def test_histogram_is_cumulative(self):
+        for seconds in (0.003, 0.02, 0.02, 0.3, 12.0):
+            self.registry.record("exercise", "GET", 200, seconds, RequestStats(), 0, False)
+
+        samples = self.samples()
+        bucket = 'gym_http_request_duration_seconds_bucket{view="exercise",method="GET",status="2xx",le="%s"}'
+        self.assertEqual(samples[bucket % "0.005"], "1")
+        self.assertEqual(samples[bucket % "0.025"], "3")
+        self.assertEqual(samples[bucket % "0.5"], "4")
+        self.assertEqual(samples[bucket % "10.0"], "4")
+        self.assertEqual(samples[bucket % "+Inf"], "5")
+        self.assertEqual(samples['gym_http_request_duration_seconds_count{view="exercise",method="GET",status="2xx"}'], "5")
+
+    def test_exposition_format(self):
+        self.registry.record('say "hi"\\', "POST", 500, 0.1, RequestStats(), 0, False)
+        text = self.registry.render()
+
+        self.assertTrue(text.endswith("\n"))
+        self.assertIn("# TYPE gym_http_requests_total counter\n", text)
+        self.assertIn("# TYPE gym_http_request_duration_seconds histogram\n", text)
+        self.assertIn('gym_http_requests_total{view="say \\"hi\\"\\\\",method="POST",status="5xx"} 1\n', text)
+
+    def test_empty_and_reset(self):
+        self.assertNotIn("{", self.registry.render())
+        self.registry.record("user", "GET", 200, 0.1, RequestStats(), 0, False)
+        self.registry.reset()
+        self.assertNotIn("{", self.registry.render())
+
+
+if __name__ == "__main__":
+    unittest.main()
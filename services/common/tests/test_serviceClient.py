@@ -0,0 +1,175 @@
+import json
+import threading
+import unittest
+
+from gymcommon.serviceClient import (
+    CircuitBreaker, CircuitOpen, ServiceClient, ServiceResponseError, ServiceUnavailable,
+)
+from gymcommon.usersClient import UsersClient
+from tests.stubServer import StubResponse, StubServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ServiceClientTests(unittest.TestCase):
+    def client(self, server, **kwargs):
+        self.sleeps = []
+        kwargs.setdefault("rng", lambda: 1.0)
+        client = ServiceClient(server.url, sleep=self.sleeps.append, **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def test_keep_alive_reuses_one_connection(self):
+        with StubServer() as server:
+            client = self.client(server)
+            for _ in range(20):
+                self.assertEqual(client.get("/ping/").status, 200)
+
+        self.assertEqual(server.connections(), 1)
+        self.assertEqual(client.pool.created, 1)
+
+    def test_concurrent_calls_use_separate_connections(self):
+        with StubServer(handler=lambda request: StubResponse(delay=0.05)) as server:
+            client = self.client(server, max_idle=2)
+            threads = [threading.Thread(target=client.get, args=("/ping/",)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(client.pool.created, 4)
+        self.assertEqual(len(client.pool.idle), 2)  # The rest were closed, not pooled
+
+    def test_server_closing_idle_connection(self):
+        with StubServer([StubResponse(close=True), StubResponse()]) as server:
+            client = self.client(server)
+            client.get("/a/")
+            client.get("/b/")
+
+        self.assertEqual(server.connections(), 2)
+
+    def test_query_headers_and_json_body(self):
+        with StubServer([StubResponse(body={"ok": True})]) as server:
+            client = self.client(server, headers={"Authorization": "Bearer abc"})
+            response = client.post("/things/", {"name": "squat"}, params={"page": 2})
+
+        request = server.requests[0]
+        self.assertEqual(response.json(), {"ok": True})
+        self.assertEqual(request["query"], {"page": "2"})
+        self.assertEqual(request["headers"]["Authorization"], "Bearer abc")
+        self.assertEqual(json.loads(request["body"]), {"name": "squat"})
+
+    def test_timeout(self):
+        with StubServer(handler=lambda request: StubResponse(delay=0.5)) as server:
+            client = self.client(server, retries=0)
+            with self.assertRaises(ServiceUnavailable):
+                client.get("/slow/", timeout=0.05)
+
+    def test_retries_with_jittered_backoff(self):
+        script = [StubResponse(503), StubResponse(502), StubResponse(body={"ok": True})]
+        with StubServer(script) as server:
+            client = self.client(server, retries=2, backoff=0.1, rng=lambda: 0.5)
+            self.assertEqual(client.get("/flaky/").json(), {"ok": True})
+
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(self.sleeps, [0.05, 0.1])  # Half of 0.1 x 2^attempt
+
+    def test_backoff_is_capped(self):
+        with StubServer(handler=lambda request: StubResponse(503)) as server:
+            client = self.client(server, retries=4, backoff=1, max_backoff=2, breaker=CircuitBreaker(failure_threshold=10))
+            with self.assertRaises(ServiceUnavailable):
+                client.get("/down/")
+
+        self.assertEqual(self.sleeps, [1, 2, 2, 2])
+
+    def test_post_not_retried(self):
+        with StubServer([StubResponse(503), StubResponse()]) as server:
+            client = self.client(server)
+            with self.assertRaises(ServiceUnavailable):
+                client.post("/create/", {})
+            self.assertEqual(len(server.requests), 1)
+
+            client.post("/create/", {}, idempotent=True)  # Callers can opt in
+
+    def test_client_errors_are_not_retried(self):
+        with StubServer([StubResponse(404, {"error": "User not found"})]) as server:
+            client = self.client(server)
+            with self.assertRaises(ServiceResponseError) as caught:
+                client.get("/user/")
+
+        self.assertEqual(caught.exception.response.status, 404)
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(client.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_circuit_opens_and_recovers(self):
+        clock = FakeClock()
+        with StubServer([StubResponse(503)] * 3) as server:
+            client = self.client(server, retries=0, breaker=CircuitBreaker(failure_threshold=3, reset_seconds=10, clock=clock))
+            for _ in range(3):
+                with self.assertRaises(ServiceUnavailable):
+                    client.get("/down/")
+
+            with self.assertRaises(CircuitOpen):
+                client.get("/down/")
+            self.assertEqual(len(server.requests), 3)  # Rejected without a request
+
+            clock.now = 10
+            self.assertEqual(client.get("/up/").status, 200)  # The half open trial call
+            self.assertEqual(client.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_failed_trial_call_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, clock=clock)
+        breaker.recordFailure()
+        clock.now = 10
+
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())  # Only one trial call at a time
+        breaker.recordFailure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow())
+
+    def test_unreachable_service(self):
+        with StubServer() as server:
+            url = server.url
+        client = ServiceClient(url, retries=1, sleep=lambda seconds: None)
+        with self.assertRaises(ServiceUnavailable):
+            client.get("/ping/")
+        self.assertEqual(client.breaker.failures, 2)
+
+
+class UsersClientTests(unittest.TestCase):
+    @staticmethod
+    def lookup(request):
+        ids = [int(user_id) for user_id in request["query"]["ids"].split(",")]
+        return StubResponse(body={
+            "users": {str(user_id): {"id": user_id, "username": f"user{user_id}"} for user_id in ids if user_id % 10},
+            "missing": {"ids": [user_id for user_id in ids if not user_id % 10]},
+        })
+
+    def test_resolves_in_batches_over_one_connection(self):
+        with StubServer(handler=self.lookup) as server:
+            client = UsersClient(ServiceClient(server.url), batch_size=100)
+            resolved = client.resolveUsers(list(range(1, 251)) + [1, 2])
+            client.client.close()
+
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(server.connections(), 1)
+        self.assertEqual(server.requests[0]["path"], "/user/lookup/")
+        self.assertEqual(len(resolved), 250)
+        self.assertEqual(resolved[7], {"id": 7, "username": "user7"})
+        self.assertIsNone(resolved[10])
+
+    def test_nothing_to_resolve(self):
+        client = UsersClient(ServiceClient("http://127.0.0.1:9"))
+        self.assertEqual(client.resolveUsers([]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
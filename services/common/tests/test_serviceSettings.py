@@ -0,0 +1,45 @@
+import unittest
+from pathlib import Path
+
+from gymcommon.serviceSettings import metricsSettings, serviceTokenSettings, userServiceSettings
+
+
+class ServiceTokenSettingsTests(unittest.TestCase):
+    def test_defaults(self):
+        self.assertEqual(serviceTokenSettings(Path("/common"), environ={}), {
+            "SERVICE_TOKEN_KEY_FILE": "/common/keys/service_tokens.json",
+            "SERVICE_TOKEN_TTL": 900,
+            "SERVICE_TOKEN_REQUIRED": False,
+            "SERVICE_TOKEN_CACHE_SIZE": 10000,
+        })
+
+    def test_environment(self):
+        settings = serviceTokenSettings(Path("/common"), environ={"SERVICE_TOKEN_KEY_FILE": "/keys.json", "SERVICE_TOKEN_REQUIRED": "1"})
+        self.assertEqual((settings["SERVICE_TOKEN_KEY_FILE"], settings["SERVICE_TOKEN_REQUIRED"]), ("/keys.json", True))
+
+
+class UserServiceSettingsTests(unittest.TestCase):
+    def test_defaults(self):
+        self.assertEqual(userServiceSettings(environ={}), {
+            "USER_SERVICE_URL": "http://127.0.0.1:8000",
+            "USER_SERVICE_TIMEOUT": 2.0,
+            "USER_SERVICE_RETRIES": 2,
+            "USER_SERVICE_FAILURE_THRESHOLD": 5,
+            "USER_SERVICE_RESET_SECONDS": 30.0,
+        })
+
+
+class MetricsSettingsTests(unittest.TestCase):
+    def test_server_timing_follows_debug(self):
+        self.assertTrue(metricsSettings(True, environ={})["METRICS_SERVER_TIMING"])
+        self.assertFalse(metricsSettings(False, environ={})["METRICS_SERVER_TIMING"])
+        self.assertFalse(metricsSettings(True, environ={"METRICS_SERVER_TIMING": "0"})["METRICS_SERVER_TIMING"])
+
+    def test_defaults(self):
+        settings = metricsSettings(False, environ={})
+        self.assertEqual((settings["METRICS_ENABLED"], settings["METRICS_PATH"], settings["METRICS_TOKEN"]), (True, "/metrics", ""))
+        self.assertEqual((settings["METRICS_SLOW_REQUEST_SECONDS"], settings["METRICS_SLOW_SAMPLE_RATE"]), (0.5, 0.1))
+
+
+if __name__ == "__main__":
+    unittest.main()
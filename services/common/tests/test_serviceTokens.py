@@ -0,0 +1,132 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from gymcommon.serviceTokens import (
+    EXPIRED_TOKEN, INVALID_SIGNATURE, MALFORMED_TOKEN, UNKNOWN_KEY,
+    KeyFile, KeyRing, TokenError, TokenVerifier, encodeSegment, issueToken, verifyToken,
+)
+
+NOW = 1_700_000_000
+
+
+class TokenTests(unittest.TestCase):
+    def setUp(self):
+        self.ring = KeyRing.generate()
+
+    def assertRejected(self, token, message, ring=None, now=NOW):
+        with self.assertRaises(TokenError) as caught:
+            verifyToken(ring or self.ring, token, now)
+        self.assertEqual(str(caught.exception), message)
+
+    def test_round_trip(self):
+        token = issueToken(self.ring, 42, ttl=900, now=NOW)
+        self.assertEqual(verifyToken(self.ring, token, NOW + 899), {"sub": 42, "iat": NOW, "exp": NOW + 900})
+
+    def test_expired(self):
+        token = issueToken(self.ring, 42, ttl=900, now=NOW)
+        self.assertRejected(token, EXPIRED_TOKEN, now=NOW + 900)
+
+    def test_tampered_payload(self):
+        kid, _, signature = issueToken(self.ring, 42, ttl=900, now=NOW).split(".")
+        forged = encodeSegment(b'{"sub":1,"iat":0,"exp":9999999999}')
+        self.assertRejected(f"{kid}.{forged}.{signature}", INVALID_SIGNATURE)
+
+    def test_other_ring(self):
+        token = issueToken(KeyRing.generate(), 42, ttl=900, now=NOW)
+        self.assertRejected(token, UNKNOWN_KEY)
+
+    def test_malformed(self):
+        for token in ["", "abc", "a.b.c.d", f"{self.ring.active}.!!.??"]:
+            with self.subTest(token=token):
+                with self.assertRaises(TokenError):
+                    verifyToken(self.ring, token, NOW)
+
+    def test_signed_bad_claims(self):
+        with mock.patch("gymcommon.serviceTokens.json.dumps", return_value='{"sub":"42","exp":"never"}'):
+            token = issueToken(self.ring, 42, ttl=900, now=NOW)
+        self.assertRejected(token, MALFORMED_TOKEN)
+
+    def test_rotation_keeps_recent_keys(self):
+        old_token = issueToken(self.ring, 42, ttl=900, now=NOW)
+        rotated = self.ring.rotated(keep=2)
+
+        self.assertNotEqual(rotated.active, self.ring.active)
+        self.assertEqual(verifyToken(rotated, old_token, NOW)["sub"], 42)
+        self.assertEqual(verifyToken(rotated, issueToken(rotated, 7, 900, NOW), NOW)["sub"], 7)
+        self.assertRejected(old_token, UNKNOWN_KEY, ring=rotated.rotated(keep=2))
+
+
+class KeyFileTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "keys", "service_tokens.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            KeyFile(self.path).ring()
+
+    def test_created_by_issuer_and_private(self):
+        ring = KeyFile(self.path, create=True).ring()
+
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+        self.assertEqual(KeyFile(self.path).ring().keys, ring.keys)
+
+    def test_reloads_after_rotation(self):
+        KeyRing.generate().save(self.path)
+        key_file = KeyFile(self.path, check_seconds=0)
+        first = key_file.ring()
+        self.assertIs(key_file.ring(), first)  # Unchanged file, same ring
+
+        first.rotated().save(self.path)
+        os.utime(self.path, ns=(0, os.stat(self.path).st_mtime_ns + 1))
+        self.assertEqual(key_file.ring().active, KeyRing.load(self.path).active)
+
+
+class TokenVerifierTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "service_tokens.json")
+        self.ring = KeyRing.generate()
+        self.ring.save(self.path)
+        self.verifier = TokenVerifier(KeyFile(self.path, check_seconds=0), cache_size=2)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_cached_tokens_skip_verification(self):
+        token = issueToken(self.ring, 42, ttl=900, now=NOW)
+        self.verifier.verify(token, NOW)
+
+        with mock.patch("gymcommon.serviceTokens.verifyToken") as verify:
+            self.assertEqual(self.verifier.verify(token, NOW + 1)["sub"], 42)
+        verify.assert_not_called()
+
+    def test_cached_tokens_still_expire(self):
+        token = issueToken(self.ring, 42, ttl=900, now=NOW)
+        self.verifier.verify(token, NOW)
+
+        with self.assertRaises(TokenError):
+            self.verifier.verify(token, NOW + 900)
+
+    def test_cache_is_bounded(self):
+        for user_id in range(5):
+            self.verifier.verify(issueToken(self.ring, user_id, ttl=900, now=NOW), NOW)
+        self.assertEqual(len(self.verifier.cache), 2)
+
+    def test_retired_key_is_rejected_despite_cache(self):
+        token = issueToken(self.ring, 42, ttl=900, now=NOW)
+        self.verifier.verify(token, NOW)
+
+        KeyRing.generate().save(self.path)
+        os.utime(self.path, ns=(0, os.stat(self.path).st_mtime_ns + 1))
+        with self.assertRaises(TokenError):
+            self.verifier.verify(token, NOW)
+
+
+if __name__ == "__main__":
+    unittest.main()
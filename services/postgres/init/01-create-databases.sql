@@ -0,0 +1,4 @@
+-- Runs once when the postgres volume is first initialised, one database per service
+CREATE DATABASE users;
+CREATE DATABASE weights;
+CREATE DATABASE workouts;